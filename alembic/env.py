@@ -6,9 +6,11 @@ from sqlalchemy.sql.schema import SchemaItem
 from logging.config import fileConfig
 
 from app.core.config import get_settings
+from app.db.engine_options import get_connect_args
 from app.common.models.base_class import Base
 from app.users.models import *  # noqa
 from app.two_factor_authentication.models import *  # noqa
+from app.auth.models import *  # noqa
 
 
 # this is the Alembic Config object, which provides
@@ -98,6 +100,7 @@ def run_migrations_online() -> None:
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=get_connect_args(),
     )
 
     with connectable.connect() as connection:
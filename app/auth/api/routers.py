@@ -1,6 +1,12 @@
 from fastapi import APIRouter
 
-from app.auth.api import endpoints
+from app.auth.api import endpoints, well_known_endpoints
 
 api_router = APIRouter()
 api_router.include_router(endpoints.router, prefix="/auth", tags=["auth"])
+
+# Served outside of the versioned API, where verifiers expect it.
+well_known_router = APIRouter()
+well_known_router.include_router(
+    well_known_endpoints.router, prefix="/.well-known", tags=["auth"]
+)
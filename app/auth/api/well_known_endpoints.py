@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Response, status
+
+from app.auth.utils.jwt_keys import keyring
+from app.core.config import get_settings
+
+router = APIRouter()
+settings = get_settings()
+
+
+@router.get("/jwks.json", status_code=status.HTTP_200_OK)
+async def get_jwks(response: Response) -> dict:
+    """Public keys other services verify `access_token` cookies with."""
+    response.headers["Cache-Control"] = (
+        f"public, max-age={settings.JWKS_MAX_AGE_SECONDS}"
+    )
+    return keyring.get_jwks()
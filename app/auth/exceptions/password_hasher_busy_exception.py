@@ -0,0 +1,6 @@
+class PasswordHasherBusyException(Exception):
+    def __init__(
+        self, message: str = "Too many password operations in progress."
+    ):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1 @@
+from .revoked_token import RevokedToken  # noqa
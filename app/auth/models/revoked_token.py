@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.models.base_class import Base
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+    # `created_at` is the watermark of the incremental denylist refresh.
+    __table_args__ = (Index("ix_revoked_tokens_created_at", "created_at"),)
+
+    jti: Mapped[str] = mapped_column(unique=True)
+    # The token's `exp`, the row is useless (and compacted) after it.
+    expires_at: Mapped[datetime] = mapped_column(index=True)
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Row, delete, exists, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.auth.models.revoked_token import RevokedToken
+from app.auth.schemas.revoked_token_schema import RevokedTokenCreate
+from app.common.repositories.base_repository import BaseRepository
+
+
+class RevokedTokensRepository(
+    BaseRepository[RevokedToken, RevokedTokenCreate, RevokedTokenCreate]
+):
+    def revoke(self, db: Session, jti: str, expires_at: datetime) -> None:
+        db.execute(
+            pg_insert(RevokedToken)
+            .values(jti=jti, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        return bool(db.scalar(select(exists().where(RevokedToken.jti == jti))))
+
+    def list_unexpired(
+        self,
+        db: Session,
+        now: datetime,
+        created_after: datetime | None = None,
+    ) -> Sequence[Row[tuple[str, datetime]]]:
+        stmt = select(RevokedToken.jti, RevokedToken.created_at).where(
+            RevokedToken.expires_at > now
+        )
+        if created_after is not None:
+            stmt = stmt.where(RevokedToken.created_at > created_after)
+        return db.execute(stmt).all()
+
+    def delete_expired(self, db: Session, now: datetime) -> int:
+        result = db.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= now)
+        )
+        return result.rowcount  # type: ignore[attr-defined]
+
+
+revoked_tokens_repository = RevokedTokensRepository(RevokedToken)
@@ -0,0 +1,8 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class RevokedTokenCreate(BaseModel):
+    jti: str
+    expires_at: datetime
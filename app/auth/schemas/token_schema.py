@@ -8,6 +8,12 @@ class Token(BaseModel):
 # Contents of JWT token
 class TokenPayload(BaseModel):
     user_id: str
+    email: str | None = None
+    # `token_version` of the user when the token was issued.
+    ver: int = 0
+    # Set by `create_access_token`, identifies the token for revocation.
+    jti: str | None = None
+    exp: int | None = None
 
 
 class EmailTokenPayload(BaseModel):
@@ -1,11 +1,25 @@
+from datetime import datetime
+
+import pytz
 from pydantic import EmailStr
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.auth.repositories.revoked_tokens_repository import (
+    RevokedTokensRepository,
+    revoked_tokens_repository,
+)
 from app.auth.schemas.auth_schema import UserLogin
+from app.auth.schemas.token_schema import TokenPayload
 from app.common.exceptions.model_not_found_exception import (
     ModelNotFoundException,
 )
-from app.auth.utils.security import verify_password
+from app.auth.exceptions.password_hasher_busy_exception import (
+    PasswordHasherBusyException,
+)
+from app.auth.utils.password_hasher import hash_password, verify_password
+from app.auth.utils.password_hashing import needs_rehash
+from app.auth.utils.token_denylist import token_denylist
 from app.auth.exceptions.invalid_credentials_exception import (
     InvalidCredentialsException,
 )
@@ -18,32 +32,61 @@ from app.users.schemas.user_schema import UserAuth, UserUpdate
 
 class AuthService:
     def __init__(
-        self, session: Session, repository: UsersRepository = users_repository
+        self,
+        session: Session,
+        repository: UsersRepository = users_repository,
+        revoked_tokens: RevokedTokensRepository = revoked_tokens_repository,
     ):
         self.session = session
         self.repository = repository
+        self.revoked_tokens = revoked_tokens
 
-    def authenticate(self, login_data: UserLogin) -> UserAuth:
-        user = self.repository.get_by_email(
-            self.session, email=login_data.email
+    async def authenticate(self, login_data: UserLogin) -> UserAuth:
+        user_schema = await run_in_threadpool(
+            self.repository.get_by_email,
+            self.session,
+            email=login_data.email,
+            schema=UserAuth,
         )
-        if not user:
+        if not user_schema:
             raise ModelNotFoundException()
-        user_schema = UserAuth.model_validate(user)
-        if not verify_password(
+        if not await verify_password(
             login_data.password, user_schema.hashed_password
         ):
             raise InvalidCredentialsException()
+        if needs_rehash(user_schema.hashed_password):
+            await self._rehash_password(user_schema, login_data.password)
         return user_schema
 
+    async def _rehash_password(self, user: UserAuth, password: str) -> None:
+        """
+        Upgrade the stored hash to the configured algorithm and cost while
+        the plain password is at hand. Best effort, the login goes on if
+        the hasher is busy.
+        """
+        try:
+            hashed_password = await hash_password(password)
+        except PasswordHasherBusyException:
+            return
+        await run_in_threadpool(
+            self.repository.update_by_id,
+            self.session,
+            user.id,
+            UserUpdate(hashed_password=hashed_password),
+        )
+        user.hashed_password = hashed_password
+
     def reset_password(self, email: EmailStr, hashed_password: str) -> None:
-        user = self.repository.get_by_email(self.session, email)
+        user = self.repository.reset_password(
+            self.session, email, hashed_password
+        )
         if not user:
             raise InvalidCredentialsException()
-        self.repository.update(
-            self.session,
-            user,
-            UserUpdate(
-                hashed_password=hashed_password,
-            ),
-        )
+
+    def revoke_token(self, token_data: TokenPayload) -> None:
+        """Deny the access token until it expires."""
+        if token_data.jti is None or token_data.exp is None:
+            return
+        expires_at = datetime.fromtimestamp(token_data.exp, pytz.utc)
+        self.revoked_tokens.revoke(self.session, token_data.jti, expires_at)
+        token_denylist.add(token_data.jti, expires_at)
@@ -0,0 +1,30 @@
+from typing import cast
+
+from fastapi import Response
+from sqlalchemy.orm import Session
+
+from app.auth.enums.claims_enum import ClaimsEnum
+from app.auth.exceptions.invalid_credentials_exception import (
+    InvalidCredentialsException,
+)
+from app.auth.schemas.token_schema import TokenPayload
+from app.auth.services.auth_service import AuthService
+from app.auth.utils.security import validate_token
+
+
+class LogoutUseCase:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def execute(self, token: str | None, response: Response) -> None:
+        if token:
+            try:
+                token_data = cast(
+                    TokenPayload, validate_token(token, ClaimsEnum.USER_ID)
+                )
+            except InvalidCredentialsException:
+                # Nothing to revoke, the token is not accepted anyway.
+                pass
+            else:
+                AuthService(self.session).revoke_token(token_data)
+        response.delete_cookie(key="access_token", httponly=True)
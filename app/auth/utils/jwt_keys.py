@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytz
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+from app.core.config import JWTKeySettings, get_settings
+
+settings = get_settings()
+
+_JWK_ALGORITHMS: dict[str, Any] = {
+    "EdDSA": OKPAlgorithm,
+    "RS256": RSAAlgorithm,
+}
+
+
+@dataclass(frozen=True)
+class JWTKey:
+    kid: str
+    algorithm: str
+    private_key: Any | None
+    public_key: Any
+    active_from: datetime | None = None
+    expires_at: datetime | None = None
+
+    def is_published(self, now: datetime) -> bool:
+        return self.expires_at is None or now < self.expires_at
+
+    def can_sign(self, now: datetime) -> bool:
+        return (
+            self.private_key is not None
+            and (self.active_from is None or self.active_from <= now)
+            and self.is_published(now)
+        )
+
+    def to_jwk(self) -> dict:
+        jwk = _JWK_ALGORITHMS[self.algorithm].to_jwk(
+            self.public_key, as_dict=True
+        )
+        return {**jwk, "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+def load_key(key_settings: JWTKeySettings) -> JWTKey:
+    pem = Path(key_settings.pem_file).read_bytes()
+    private_key: Any | None
+    try:
+        private_key = load_pem_private_key(pem, password=None)
+        public_key = private_key.public_key()
+    except ValueError:
+        private_key = None
+        public_key = load_pem_public_key(pem)
+    return JWTKey(
+        kid=key_settings.kid,
+        algorithm=key_settings.algorithm,
+        private_key=private_key,
+        public_key=public_key,
+        active_from=key_settings.active_from,
+        expires_at=key_settings.expires_at,
+    )
+
+
+class KeyRing:
+    """
+    Asymmetric JWT keys by `kid`. The most recently activated private key
+    signs, every key that has not expired verifies and is published in
+    the JWKS, so keys can be rotated on a schedule without downtime.
+    """
+
+    def __init__(self, keys: list[JWTKey]):
+        self.keys = {key.kid: key for key in keys}
+        self._jwks: dict[tuple[str, ...], dict] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.keys)
+
+    @classmethod
+    def from_settings(cls, keys: list[JWTKeySettings]) -> "KeyRing":
+        return cls([load_key(key_settings) for key_settings in keys])
+
+    def get_signing_key(self, now: datetime | None = None) -> JWTKey | None:
+        now = now or datetime.now(pytz.utc)
+        signing_keys = [key for key in self.keys.values() if key.can_sign(now)]
+        if not signing_keys:
+            return None
+        return max(
+            signing_keys,
+            key=lambda key: (
+                key.active_from or datetime.min.replace(tzinfo=pytz.utc)
+            ),
+        )
+
+    def get_verification_key(
+        self, kid: str, now: datetime | None = None
+    ) -> JWTKey | None:
+        key = self.keys.get(kid)
+        if key is None or not key.is_published(now or datetime.now(pytz.utc)):
+            return None
+        return key
+
+    def get_jwks(self, now: datetime | None = None) -> dict:
+        """The published keys, built once per set of published keys."""
+        now = now or datetime.now(pytz.utc)
+        kids = tuple(
+            kid for kid, key in self.keys.items() if key.is_published(now)
+        )
+        jwks = self._jwks.get(kids)
+        if jwks is None:
+            jwks = {"keys": [self.keys[kid].to_jwk() for kid in kids]}
+            self._jwks[kids] = jwks
+        return jwks
+
+
+keyring = KeyRing.from_settings(settings.JWT_KEYS)
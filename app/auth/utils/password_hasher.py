@@ -0,0 +1,162 @@
+import asyncio
+import bisect
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from app.auth.exceptions.password_hasher_busy_exception import (
+    PasswordHasherBusyException,
+)
+from app.auth.utils import password_hashing
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Upper bounds, in seconds, of the queue wait histogram buckets.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+def _timed(function: Callable[..., Any], *args: Any) -> tuple[float, Any]:
+    # Wall clock, as the start is compared with the submit time of
+    # another process.
+    return time.time(), function(*args)
+
+
+def _hash(password: str) -> str:
+    return password_hashing.hash_password(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return password_hashing.verify_password(password, hashed_password)
+
+
+class HasherMetrics:
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.wait_seconds_total = 0.0
+        # One extra bucket for waits above the last bound.
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def observe_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS, seconds)] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "in_flight": self.in_flight,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_histogram": {
+                str(bound): count
+                for bound, count in zip(
+                    (*WAIT_BUCKETS, "+Inf"), self.wait_buckets, strict=True
+                )
+            },
+        }
+
+
+class PasswordHasher:
+    """
+    Runs password hashing in a dedicated process pool, so password work neither
+    holds the GIL nor ties up the threadpool serving other routes.
+
+    At most `workers + max_queue` operations are accepted at once, further
+    ones raise `PasswordHasherBusyException` right away instead of
+    queueing behind a burst. With `workers=0` hashing runs in the
+    threadpool instead, e.g. for tests.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.metrics = HasherMetrics()
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        return await self._run(_verify, plain_password, hashed_password)
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # NOTE: forking a process running threads is unsafe.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, e.g. when the app shuts down."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    def _release(self) -> None:
+        with self._lock:
+            self.metrics.in_flight -= 1
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self.metrics.in_flight >= self.workers + self.max_queue:
+                self.metrics.rejected += 1
+                raise PasswordHasherBusyException()
+            self.metrics.in_flight += 1
+            self.metrics.submitted += 1
+
+        submitted_at = time.time()
+        if not self.workers:
+            try:
+                started_at, result = await run_in_threadpool(
+                    _timed, function, *args
+                )
+            finally:
+                self._release()
+        else:
+            try:
+                future = self.get_executor().submit(_timed, function, *args)
+            except BaseException:
+                self._release()
+                raise
+            # NOTE: cancelling the request does not stop a job its worker
+            #       already runs, the job holds its slot until it is done.
+            future.add_done_callback(lambda _: self._release())
+            started_at, result = await asyncio.wrap_future(future)
+
+        with self._lock:
+            self.metrics.observe_wait(max(0.0, started_at - submitted_at))
+        return result
+
+
+password_hasher = PasswordHasher(
+    workers=(
+        os.cpu_count() or 1
+        if settings.PASSWORD_HASHER_WORKERS is None
+        else settings.PASSWORD_HASHER_WORKERS
+    ),
+    max_queue=settings.PASSWORD_HASHER_MAX_QUEUE,
+)
+
+
+async def hash_password(password: str) -> str:
+    return await password_hasher.hash_password(password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify_password(
+        plain_password, hashed_password
+    )
@@ -0,0 +1,89 @@
+from functools import lru_cache
+from typing import Any
+
+import bcrypt
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+ARGON2_PREFIX = "$argon2"
+
+
+@lru_cache(maxsize=None)
+def get_argon2_hasher(
+    time_cost: int, memory_cost: int, parallelism: int
+) -> Any:
+    try:
+        from argon2 import PasswordHasher
+    except ImportError:
+        raise RuntimeError(
+            "argon2 password hashing requires the `argon2` extra "
+            "(argon2-cffi) to be installed."
+        )
+    return PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+    )
+
+
+def _get_configured_argon2_hasher() -> Any:
+    return get_argon2_hasher(
+        settings.ARGON2_TIME_COST,
+        settings.ARGON2_MEMORY_COST,
+        settings.ARGON2_PARALLELISM,
+    )
+
+
+def hash_password_bcrypt(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds)).decode()
+
+
+def hash_password(password: str) -> str:
+    """Hash with the configured algorithm and cost."""
+    if settings.PASSWORD_HASH_ALGORITHM == "argon2":
+        return _get_configured_argon2_hasher().hash(password)
+    return hash_password_bcrypt(password, settings.BCRYPT_ROUNDS)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify against a hash of either algorithm, whatever the configured one
+    is, so existing hashes keep working after switching.
+    """
+    if hashed_password.startswith(ARGON2_PREFIX):
+        # Raises the same RuntimeError as hashing without the `argon2` extra.
+        hasher = _get_configured_argon2_hasher()
+        from argon2.exceptions import (
+            InvalidHashError,
+            VerificationError,
+        )
+
+        try:
+            return hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+
+def get_bcrypt_rounds(hashed_password: str) -> int:
+    # "$2b$<rounds>$<salt and checksum>"
+    return int(hashed_password.split("$")[2])
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Whether a hash was made with another algorithm or other parameters
+    than the configured ones.
+    """
+    is_argon2 = hashed_password.startswith(ARGON2_PREFIX)
+    if settings.PASSWORD_HASH_ALGORITHM == "argon2":
+        return (
+            not is_argon2
+            or _get_configured_argon2_hasher().check_needs_rehash(
+                hashed_password
+            )
+        )
+    rounds = None if is_argon2 else get_bcrypt_rounds(hashed_password)
+    return rounds != settings.BCRYPT_ROUNDS
@@ -1,19 +1,38 @@
+import hashlib
+import time
+from uuid import uuid4
 from datetime import datetime, timedelta
 from typing import Any
 
-import bcrypt
 import pytz
-from jwt import encode, decode
-from jwt.exceptions import PyJWTError
+from jwt import decode, encode, get_unverified_header
+from jwt.exceptions import InvalidKeyError, PyJWTError
 from pydantic import ValidationError
 from app.auth.api.dependencies.get_token import TokenDep
 from app.auth.enums.claims_enum import ClaimsEnum
 from app.auth.schemas.token_schema import EmailTokenPayload, TokenPayload
+from app.auth.utils import password_hashing
+from app.auth.utils.jwt_keys import JWTKey, keyring
+from app.auth.utils.token_denylist import token_denylist
+from app.common.utils.ttl_cache import TTLCache
 from app.core.config import settings
 from app.auth.exceptions.invalid_credentials_exception import (
     InvalidCredentialsException,
 )
 
+# Longer tokens are not ours, don't let them fill the cache.
+MAX_CACHED_TOKEN_LENGTH = 4096
+
+# Entries keep the token's key id, so a cached token stops validating once
+# its key is retired.
+token_cache: TTLCache[
+    tuple[bytes, ClaimsEnum],
+    tuple[str | None, TokenPayload | EmailTokenPayload],
+] = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.TOKEN_CACHE_TTL_SECONDS,
+)
+
 
 def create_access_token(
     token_data: TokenPayload | Any, expires_delta: timedelta | None = None
@@ -24,36 +43,124 @@ def create_access_token(
         expire = datetime.now(pytz.utc) + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode = {"exp": expire}
-    to_encode.update(token_data.model_dump())
-    encoded_jwt = encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+    to_encode = token_data.model_dump(exclude_none=True)
+    to_encode.update(exp=expire, jti=uuid4().hex)
+    return _encode(to_encode)
+
+
+def _encode(payload: dict) -> str:
+    key = keyring.get_signing_key()
+    if key is None:
+        return encode(
+            payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        )
+    return encode(
+        payload,
+        key.private_key,
+        algorithm=key.algorithm,
+        headers={"kid": key.kid},
     )
-    return encoded_jwt
+
+
+def _get_verification_key(kid: str | None) -> JWTKey | None:
+    """
+    The key tokens with `kid` are verified with, None for SECRET_KEY.
+    Raises `InvalidKeyError` when such tokens are no longer accepted.
+    """
+    if kid is None:
+        if not settings.JWT_ACCEPT_SECRET_KEY_TOKENS:
+            raise InvalidKeyError("Token has no key id.")
+        return None
+    key = keyring.get_verification_key(kid)
+    if key is None:
+        raise InvalidKeyError("Unknown or expired key id.")
+    return key
+
+
+def _decode(token: str) -> tuple[str | None, dict]:
+    """
+    Verify with the key named by the `kid` header, only ever with that
+    key's algorithm. Tokens without one are checked against SECRET_KEY.
+    Returns the key id along with the payload.
+    """
+    kid = get_unverified_header(token).get("kid")
+    key = _get_verification_key(kid)
+    if key is None:
+        return kid, decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+    return kid, decode(token, key.public_key, algorithms=[key.algorithm])
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    return password_hashing.verify_password(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return password_hashing.hash_password(password)
+
+
+def _get_token_cache_key(
+    token: str, claim: ClaimsEnum
+) -> tuple[bytes, ClaimsEnum] | None:
+    if not token_cache.ttl or len(token) > MAX_CACHED_TOKEN_LENGTH:
+        return None
+    return hashlib.sha256(token.encode()).digest(), claim
 
 
 def validate_token(
     token: TokenDep, claim: ClaimsEnum
 ) -> TokenPayload | EmailTokenPayload:
+    """
+    Decode and validate `token`. Valid tokens are cached by digest until
+    their `exp`, so a client sending the same cookie again skips the
+    signature check and payload parsing. Access tokens revoked on logout,
+    or signed with a key that was retired since, are rejected, cached or
+    not.
+    """
     if not token:
         raise InvalidCredentialsException()
+    key = _get_token_cache_key(token, claim)
+    if key is not None:
+        cached = token_cache.get(key)
+        if cached is not None:
+            kid, cached_token_data = cached
+            try:
+                _get_verification_key(kid)
+            except InvalidKeyError:
+                token_cache.delete(key)
+                raise InvalidCredentialsException()
+            return _check_not_revoked(cached_token_data)
+
     try:
-        payload = decode(
-            token, settings.SECRET_KEY, algorithms=settings.ALGORITHM
-        )
+        kid, payload = _decode(token)
+        token_data: TokenPayload | EmailTokenPayload
         if claim == ClaimsEnum.USER_ID:
-            return TokenPayload(**payload)
+            token_data = TokenPayload(**payload)
         elif claim == ClaimsEnum.USER_EMAIL:
-            return EmailTokenPayload(**payload)
+            token_data = EmailTokenPayload(**payload)
         else:
             raise ValueError("Invalid token claim")
     except (PyJWTError, ValidationError):
         raise InvalidCredentialsException()
+
+    if key is not None:
+        expires_at = payload.get("exp")
+        token_cache.set(
+            key,
+            (kid, token_data),
+            ttl=None if expires_at is None else expires_at - time.time(),
+        )
+    return _check_not_revoked(token_data)
+
+
+def _check_not_revoked(
+    token_data: TokenPayload | EmailTokenPayload,
+) -> TokenPayload | EmailTokenPayload:
+    if (
+        isinstance(token_data, TokenPayload)
+        and token_data.jti is not None
+        and token_denylist.is_revoked(token_data.jti)
+    ):
+        raise InvalidCredentialsException()
+    return token_data
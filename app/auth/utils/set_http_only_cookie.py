@@ -1,5 +1,3 @@
-from uuid import UUID
-
 from fastapi import Response
 
 from app.auth.schemas.token_schema import TokenPayload
@@ -10,10 +8,10 @@ from app.core.config import get_settings
 settings = get_settings()
 
 
-def set_http_only_cookie(user_id: UUID, key: str, response: Response) -> None:
-    access_token = security.create_access_token(
-        TokenPayload(user_id=str(user_id))
-    )
+def set_http_only_cookie(
+    token_data: TokenPayload, key: str, response: Response
+) -> None:
+    access_token = security.create_access_token(token_data)
     response.set_cookie(
         key=key,
         value=access_token,
@@ -0,0 +1,157 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+import pytz
+from sqlalchemy.orm import Session
+
+from app.auth.repositories.revoked_tokens_repository import (
+    RevokedTokensRepository,
+    revoked_tokens_repository,
+)
+from app.common.utils.bloom_filter import BloomFilter
+from app.common.utils.ttl_cache import TTLCache
+from app.core.config import get_settings
+from app.db.session import ReadOnlySessionLocal
+
+settings = get_settings()
+
+# `created_at` is the start of the revoking transaction, so rows committed
+# after a refresh may still be older than its watermark; refreshes look
+# back this far to pick them up.
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+
+class TokenDenylist:
+    """
+    Revoked token ids (`jti`), persisted in `revoked_tokens` and fronted
+    by a per process bloom filter, so only ids the filter might contain
+    cost a database lookup.
+
+    The filter is refreshed with the rows revoked since the last refresh
+    at most every `refresh_interval` seconds, and rebuilt from the
+    unexpired rows every `rebuild_interval` seconds (or once it is full)
+    so expired ids stop taking room. Ids revoked by this process are
+    carried into rebuilt filters until a load returns them, as the rebuild
+    may read from a lagging replica or before the revocation committed.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        refresh_interval: float,
+        rebuild_interval: float,
+        session_factory: Callable[[], Session] = ReadOnlySessionLocal,
+        repository: RevokedTokensRepository = revoked_tokens_repository,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self.session_factory = session_factory
+        self.repository = repository
+        self._filter = BloomFilter(capacity, error_rate)
+        self._watermark: datetime | None = None
+        self._refreshed_at: float | None = None
+        self._rebuilt_at = 0.0
+        # Database answers for ids the filter matched: revoked ones until
+        # they expire, false positives until the next refresh.
+        self._checked: TTLCache[str, bool] = TTLCache(
+            max_size=capacity,
+            ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        )
+        # Ids revoked by this process that no load has returned yet.
+        self._local: dict[str, datetime] = {}
+        # Guards the filter and `_local`; held by the thread refreshing.
+        self._lock = threading.Lock()
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        """Record a revocation made by this process right away."""
+        with self._lock:
+            self._filter.add(jti)
+            self._local[jti] = expires_at
+        self._checked.set(
+            jti,
+            True,
+            ttl=(expires_at - datetime.now(pytz.utc)).total_seconds(),
+        )
+
+    def is_revoked(self, jti: str) -> bool:
+        self.refresh()
+        if jti not in self._filter:
+            return False
+        revoked = self._checked.get(jti)
+        if revoked is None:
+            session = self.session_factory()
+            try:
+                revoked = self.repository.is_revoked(session, jti)
+            finally:
+                session.close()
+            self._checked.set(
+                jti, revoked, ttl=None if revoked else self.refresh_interval
+            )
+        return revoked
+
+    def refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if (
+            not force
+            and self._refreshed_at is not None
+            and now - self._refreshed_at < self.refresh_interval
+        ):
+            return
+        # One thread refreshes, the others go on with the current filter.
+        if not self._lock.acquire(blocking=self._refreshed_at is None):
+            return
+        try:
+            rebuild = (
+                self._watermark is None
+                or now - self._rebuilt_at >= self.rebuild_interval
+                or len(self._filter) >= self.capacity
+            )
+            self._load(rebuild)
+            self._refreshed_at = now
+            if rebuild:
+                self._rebuilt_at = now
+        finally:
+            self._lock.release()
+
+    def _load(self, rebuild: bool) -> None:
+        created_after = None
+        if not rebuild and self._watermark is not None:
+            created_after = self._watermark - REFRESH_OVERLAP
+        session = self.session_factory()
+        try:
+            rows = self.repository.list_unexpired(
+                session, datetime.now(pytz.utc), created_after
+            )
+        finally:
+            session.close()
+        bloom_filter = (
+            BloomFilter(self.capacity, self.error_rate)
+            if rebuild
+            else self._filter
+        )
+        for jti, created_at in rows:
+            bloom_filter.add(jti)
+            self._local.pop(jti, None)
+            if self._watermark is None or created_at > self._watermark:
+                self._watermark = created_at
+        now = datetime.now(pytz.utc)
+        for jti, expires_at in list(self._local.items()):
+            if expires_at <= now:
+                del self._local[jti]
+            elif rebuild:
+                bloom_filter.add(jti)
+        if rebuild:
+            self._filter = bloom_filter
+
+
+token_denylist = TokenDenylist(
+    capacity=settings.TOKEN_REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.TOKEN_REVOCATION_FILTER_ERROR_RATE,
+    refresh_interval=settings.TOKEN_REVOCATION_REFRESH_INTERVAL_SECONDS,
+    rebuild_interval=settings.TOKEN_REVOCATION_REBUILD_INTERVAL_SECONDS,
+)
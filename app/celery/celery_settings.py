@@ -1,6 +1,7 @@
 from celery.schedules import crontab
 
 from app.core.config import get_settings
+from app.db.engine_options import get_engine_options
 
 settings = get_settings()
 
@@ -19,8 +20,9 @@ def get_celery_settings() -> dict:
     return {
         "broker_url": settings.BROKER_URL,
         "result_backend": f"db+{settings.SQLALCHEMY_DATABASE_URI}",
-        "imports": ("app.celery.tasks",),
-        "include": ["app.celery.tasks.emails"],
+        "database_engine_options": get_engine_options(),
+        "imports": ("app.celery.tasks", "app.celery.signals"),
+        "include": ["app.celery.tasks.emails", "app.celery.tasks.tokens"],
         "worker_max_tasks_per_child": 10,
         "broker_connection_retry_on_startup": True,
         "worker_send_task_events": True,
@@ -30,5 +32,9 @@ def get_celery_settings() -> dict:
                 "task": "app.celery.tasks.emails.send_reminder_email",
                 "schedule": crontab(minute="*/30"),
             },
+            "compact_revoked_tokens": {
+                "task": "app.celery.tasks.tokens.compact_revoked_tokens",
+                "schedule": crontab(minute=0),
+            },
         },
     }
@@ -0,0 +1,16 @@
+from typing import Any
+
+from celery import Task
+from celery.signals import task_postrun, task_prerun
+
+from app.db.sql_comments import bind_task_name
+
+
+@task_prerun.connect
+def tag_task_statements(task: Task, **_: Any) -> None:
+    bind_task_name(task.name.rpartition(".")[2])
+
+
+@task_postrun.connect
+def untag_task_statements(**_: Any) -> None:
+    bind_task_name(None)
@@ -1,6 +1,5 @@
 from uuid import UUID
 from app.emails.exceptions.email_client_exception import EmailClientException
-from app.common.schemas.pagination_schema import ListFilter
 from app.emails.services.emails_service import EmailService
 from app.db.session import SessionLocal
 from app.main import celery
@@ -17,11 +16,9 @@ settings = get_settings()
 def send_reminder_email() -> None:
     session = SessionLocal()
     try:
-        users = UsersService(session).list(ListFilter(page=1, page_size=100))
-        for user in users.data:
-            EmailService().send_user_remind_email(
-                UserInDB.model_validate(user)
-            )
+        email_service = EmailService()
+        for user in UsersService(session).stream_all():
+            email_service.send_user_remind_email(user)
     finally:
         session.close()
 
@@ -33,7 +30,9 @@ def send_reminder_email() -> None:
     retry_jitter=False,
 )
 def send_welcome_email(user_id: UUID) -> None:
-    session = SessionLocal()
+    # NOTE: the user has just been created, so read from the primary in
+    #       case replicas have not caught up yet.
+    session = SessionLocal(replicas=None)
     try:
         user = UsersService(session).get_by_id(user_id)
         if user:
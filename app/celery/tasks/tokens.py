@@ -0,0 +1,23 @@
+from datetime import datetime
+
+import pytz
+
+from app.auth.repositories.revoked_tokens_repository import (
+    revoked_tokens_repository,
+)
+from app.db.session import SessionLocal
+from app.main import celery
+
+
+@celery.task
+def compact_revoked_tokens() -> int:
+    """Delete revocations of tokens that have expired anyway."""
+    session = SessionLocal()
+    try:
+        deleted = revoked_tokens_repository.delete_expired(
+            session, datetime.now(pytz.utc)
+        )
+        session.commit()
+        return deleted
+    finally:
+        session.close()
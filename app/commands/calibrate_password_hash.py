@@ -0,0 +1,90 @@
+"""
+Pick the password hash cost that takes about `--target-ms` per hash on
+this machine, to be set as `BCRYPT_ROUNDS` (or `ARGON2_TIME_COST` with
+`--algorithm argon2`) on hosts with the same hardware:
+
+    python -m app.commands.calibrate_password_hash --target-ms 250
+
+Existing hashes are upgraded (or downgraded) to the new cost the next time
+their user logs in.
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+from app.auth.utils.password_hashing import (
+    get_argon2_hasher,
+    hash_password_bcrypt,
+)
+from app.core.config import get_settings
+
+settings = get_settings()
+
+PASSWORD = "calibration-password"
+BCRYPT_ROUNDS = range(4, 20)
+ARGON2_TIME_COSTS = range(1, 20)
+
+
+def measure_ms(hash_once: Callable[[], object], samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hash_once()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(
+    costs: range,
+    hash_with: Callable[[int], object],
+    target_ms: float,
+    samples: int,
+) -> int:
+    """Highest cost whose median hash time stays within `target_ms`."""
+    chosen = costs[0]
+    for cost in costs:
+        elapsed = measure_ms(lambda cost=cost: hash_with(cost), samples)
+        print(f"cost {cost:>2}: {elapsed:8.1f} ms")
+        if elapsed > target_ms:
+            break
+        chosen = cost
+    return chosen
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument(
+        "--algorithm",
+        choices=["bcrypt", "argon2"],
+        default=settings.PASSWORD_HASH_ALGORITHM,
+    )
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.algorithm == "argon2":
+        cost = calibrate(
+            ARGON2_TIME_COSTS,
+            lambda time_cost: get_argon2_hasher(
+                time_cost,
+                settings.ARGON2_MEMORY_COST,
+                settings.ARGON2_PARALLELISM,
+            ).hash(PASSWORD),
+            args.target_ms,
+            args.samples,
+        )
+        print(f"ARGON2_TIME_COST={cost}")
+    else:
+        cost = calibrate(
+            BCRYPT_ROUNDS,
+            lambda rounds: hash_password_bcrypt(PASSWORD, rounds),
+            args.target_ms,
+            args.samples,
+        )
+        print(f"BCRYPT_ROUNDS={cost}")
+
+
+if __name__ == "__main__":
+    main()
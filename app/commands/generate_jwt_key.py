@@ -0,0 +1,58 @@
+"""
+Generate a JWT signing key for rotation and print the `JWT_KEYS` entry
+to add for it:
+
+    python -m app.commands.generate_jwt_key --kid 2026-11 \\
+        --active-from 2026-11-01T00:00:00Z --out /run/secrets/jwt
+
+Schedule `--active-from` at least `JWKS_MAX_AGE_SECONDS` ahead so
+verifiers fetch the new public key before tokens are signed with it,
+and keep the previous key until the tokens it signed have expired.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--kid", required=True)
+    parser.add_argument(
+        "--algorithm", choices=["EdDSA", "RS256"], default="EdDSA"
+    )
+    parser.add_argument("--active-from")
+    parser.add_argument("--out", type=Path, default=Path("."))
+    args = parser.parse_args()
+
+    if args.algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=3072
+        )
+    pem_file = args.out / f"{args.kid}.pem"
+    pem_file.write_bytes(
+        private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    pem_file.chmod(0o600)
+
+    entry = {
+        "kid": args.kid,
+        "algorithm": args.algorithm,
+        "pem_file": str(pem_file),
+    }
+    if args.active_from:
+        entry["active_from"] = args.active_from
+    print(json.dumps(entry))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from starlette import status
+
+from app.auth.utils.password_hasher import password_hasher
+from app.db.pool_metrics import get_pool_stats
+from app.db.slow_queries import query_stats_table
+from app.users.api.dependencies.get_admin_user import get_admin_user
+
+router = APIRouter(dependencies=[Depends(get_admin_user)])
+
+
+@router.get("/db/pool", status_code=status.HTTP_200_OK)
+def get_connection_pool_stats() -> dict:
+    return get_pool_stats()
+
+
+@router.get("/db/queries", status_code=status.HTTP_200_OK)
+def get_top_queries(
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> list:
+    """Statement fingerprints of this process by total time spent."""
+    return query_stats_table.top(limit)
+
+
+@router.get("/auth/hasher", status_code=status.HTTP_200_OK)
+def get_password_hasher_stats() -> dict:
+    return password_hasher.metrics.as_dict()
@@ -0,0 +1,19 @@
+from typing import Callable
+
+from app.common.utils.deadline import get_deadline
+
+
+def with_deadline(seconds: float) -> Callable[[], None]:
+    """
+    Route dependency declaring the time budget of a route, instead of the
+    `REQUEST_DEADLINE_SECONDS` default:
+
+        @router.get("/path", dependencies=[Depends(with_deadline(5))])
+    """
+
+    def set_deadline() -> None:
+        deadline = get_deadline()
+        if deadline is not None:
+            deadline.budget = seconds
+
+    return set_deadline
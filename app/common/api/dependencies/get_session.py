@@ -3,14 +3,29 @@ from typing import Annotated, Generator
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
+from app.db.request_stats import get_request_db_stats
+from app.db.session import ReadOnlySessionLocal, SessionLocal
+from app.db.write_tracking import (
+    autocommit_connections,
+    has_connection,
+    has_writes,
+)
 
 
 def get_session() -> Generator:
+    """
+    Request session. A connection is only checked out on first use, and
+    COMMIT is only sent when something was written.
+    """
     session = SessionLocal()
     try:
         yield session
-        session.commit()
+        if has_writes(session):
+            session.commit()
+        elif has_connection(session):
+            stats = get_request_db_stats()
+            if stats is not None:
+                stats.commits_skipped += 1
     except:
         session.rollback()
         raise
@@ -18,4 +33,21 @@ def get_session() -> Generator:
         session.close()
 
 
+def get_read_only_session() -> Generator:
+    """
+    Autocommit session for read only routes: no BEGIN, COMMIT or ROLLBACK
+    round trips are sent. Flushes and DML raise
+    `ReadOnlySessionException`.
+    """
+    session = ReadOnlySessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        stats = get_request_db_stats()
+        if stats is not None:
+            stats.round_trips_saved += 2 * autocommit_connections(session)
+
+
 SessionDependency = Annotated[Session, Depends(get_session)]
+ReadOnlySessionDependency = Annotated[Session, Depends(get_read_only_session)]
@@ -0,0 +1,46 @@
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.common.utils.rate_limit_storage import (
+    BatchedStorage,
+    BoundedMemoryStorage,
+    SharedMemoryStorage,
+)
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+def get_storage_options(storage_uri: str) -> dict:
+    """
+    Options of the storage `storage_uri` names. Only our storages take
+    any: others pass unknown options on to their client (e.g. `Redis`),
+    which rejects them.
+    """
+    scheme = storage_uri.partition("://")[0]
+    if scheme in BatchedStorage.STORAGE_SCHEME:
+        return {
+            "max_keys": settings.RATE_LIMIT_MAX_KEYS,
+            "flush_interval": settings.RATE_LIMIT_FLUSH_INTERVAL_SECONDS,
+        }
+    if scheme in BoundedMemoryStorage.STORAGE_SCHEME:
+        return {"max_keys": settings.RATE_LIMIT_MAX_KEYS}
+    if scheme in SharedMemoryStorage.STORAGE_SCHEME:
+        return {"slots": settings.RATE_LIMIT_SHARED_MEMORY_SLOTS}
+    return {}
+
+
+# The one limiter of the app, every route limit shares its storage.
+limiter = Limiter(
+    key_func=get_remote_address,
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    storage_options=get_storage_options(settings.RATE_LIMIT_STORAGE_URI),
+)
+
+
+def flush_limiter() -> None:
+    """Send hits still pre-aggregated in process, e.g. on shutdown."""
+    storage = limiter.limiter.storage
+    if isinstance(storage, BatchedStorage):
+        storage.flush()
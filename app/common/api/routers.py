@@ -1,6 +1,9 @@
 from fastapi import APIRouter
 
-from app.common.api import endpoints
+from app.common.api import admin_endpoints, endpoints
 
 api_router = APIRouter()
 api_router.include_router(endpoints.router, prefix="/health", tags=["health"])
+api_router.include_router(
+    admin_endpoints.router, prefix="/admin", tags=["admin"]
+)
@@ -3,6 +3,7 @@ from abc import ABC
 import requests
 import structlog
 
+from app.common.utils.deadline import get_remaining_timeout
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
@@ -23,6 +24,7 @@ class BaseRequestClient(ABC):
         auth: tuple[str, str] | None = None,
         json: dict | None = None,
     ) -> requests.Response | None:
+        timeout = get_remaining_timeout(settings.REQUESTS_TIMEOUT_SECONDS)
         try:
             response = requests.request(
                 method=method,
@@ -34,7 +36,7 @@ class BaseRequestClient(ABC):
                 files=files,
                 params=params,
                 auth=auth,
-                timeout=settings.REQUESTS_TIMEOUT_SECONDS,
+                timeout=timeout,
                 json=json,
             )
             response.raise_for_status()
@@ -1,3 +1,6 @@
+from .deadline_exceeded_exception import DeadlineExceededException
 from .external_provider_exception import ExternalProviderException
+from .invalid_pagination_exception import InvalidPaginationException
 from .model_not_created_exception import ModelNotCreatedException
 from .model_not_found_exception import ModelNotFoundException
+from .read_only_session_exception import ReadOnlySessionException
@@ -0,0 +1,4 @@
+class DeadlineExceededException(Exception):
+    def __init__(self, message: str = "Request deadline exceeded."):
+        self.message = message
+        super().__init__(self.message)
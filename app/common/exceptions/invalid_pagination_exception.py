@@ -0,0 +1,4 @@
+class InvalidPaginationException(Exception):
+    def __init__(self, message: str = "Invalid pagination options."):
+        self.message = message
+        super().__init__(self.message)
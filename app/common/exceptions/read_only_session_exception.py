@@ -0,0 +1,6 @@
+class ReadOnlySessionException(Exception):
+    def __init__(
+        self, message: str = "Cannot write through a read only session."
+    ):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,173 @@
+from typing import Any, Generic, Optional, Type, overload
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import ColumnElement, Select, asc, desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.repositories.base_repository import (
+    CreateSchemaType,
+    ModelType,
+    UpdateSchemaType,
+    build_list_response,
+)
+from app.common.repositories.keyset_pagination import KeysetPagination
+from app.common.repositories.projection import (
+    SchemaType,
+    select_schema,
+    to_schema,
+)
+from app.common.repositories.row_counts import (
+    Explain,
+    count_cache,
+    get_count_cache_key,
+    get_estimated_rows,
+)
+from app.common.schemas.pagination_schema import ListFilter, ListResponse
+
+
+class AsyncBaseRepository(
+    Generic[ModelType, CreateSchemaType, UpdateSchemaType]
+):
+    def __init__(self, model: Type[ModelType]):
+        """
+        Async counterpart of `BaseRepository`, to be used with an
+        `AsyncSession`.
+
+        **Parameters**
+
+        * `model`: A SQLAlchemy model class
+        """
+        self.model = model
+
+    @overload
+    async def get(
+        self, db: AsyncSession, model_id: UUID
+    ) -> Optional[ModelType]: ...
+
+    @overload
+    async def get(
+        self, db: AsyncSession, model_id: UUID, *, schema: Type[SchemaType]
+    ) -> Optional[SchemaType]: ...
+
+    async def get(
+        self,
+        db: AsyncSession,
+        model_id: UUID,
+        *,
+        schema: Type[SchemaType] | None = None,
+    ) -> Any:
+        if schema is not None:
+            return await self.get_one_as(db, schema, self.model.id == model_id)
+        return await db.scalar(
+            select(self.model).where(self.model.id == model_id)
+        )
+
+    async def get_one_as(
+        self,
+        db: AsyncSession,
+        schema: Type[SchemaType],
+        *whereclause: ColumnElement[bool],
+    ) -> SchemaType | None:
+        stmt = select_schema(self.model, schema).where(*whereclause).limit(1)
+        result = await db.execute(stmt)
+        return to_schema(schema, result.mappings().first())
+
+    async def list(
+        self,
+        db: AsyncSession,
+        list_options: ListFilter,
+        query: Select | None = None,
+    ) -> ListResponse:
+        if query is None:
+            query = select(self.model)
+
+        total = await self._count(db, query, list_options)
+
+        if list_options.uses_cursor:
+            keyset = KeysetPagination(self.model, list_options)
+            rows = (await db.scalars(keyset.apply(query))).all()
+            page = keyset.paginate(rows)
+            return build_list_response(
+                list_options,
+                page.data,
+                total,
+                has_next=page.next_cursor is not None,
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+            )
+
+        if list_options.order_by:
+            column = list_options.order_by
+            direction = list_options.order
+            by = desc if direction == "desc" else asc
+
+            query = query.order_by(by(column))
+
+        query = query.offset(list_options.page_size * (list_options.page - 1))
+
+        if list_options.total_count == "exact":
+            query = query.limit(list_options.page_size)
+            data = (await db.scalars(query)).all()
+            return build_list_response(list_options, data, total)
+
+        query = query.limit(list_options.page_size + 1)
+        data = (await db.scalars(query)).all()
+        return build_list_response(
+            list_options,
+            data[: list_options.page_size],
+            total,
+            has_next=len(data) > list_options.page_size,
+        )
+
+    async def _count(
+        self, db: AsyncSession, query: Select, list_options: ListFilter
+    ) -> int | None:
+        if list_options.total_count == "none":
+            return None
+        if list_options.total_count == "estimated":
+            plan = (await db.execute(Explain(query))).scalar()
+            return get_estimated_rows(plan)
+
+        key = get_count_cache_key(query, db.get_bind().dialect)
+        total = count_cache.get(key) if key else None
+        if total is None:
+            total = await db.scalar(
+                select(func.count()).select_from(
+                    query.order_by(None).subquery()
+                )
+            )
+            total = total or 0
+            if key:
+                count_cache.set(key, total)
+        return total
+
+    async def create(
+        self, db: AsyncSession, obj_in: CreateSchemaType
+    ) -> ModelType:
+        obj_in_data = jsonable_encoder(obj_in)
+        db_obj = self.model(**obj_in_data)  # type: ignore
+        db.add(db_obj)
+        await db.flush()
+        return db_obj
+
+    async def update(
+        self, db: AsyncSession, db_obj: ModelType, obj_in: UpdateSchemaType
+    ) -> ModelType:
+        obj_data = jsonable_encoder(db_obj)
+        update_data = obj_in.model_dump(exclude_unset=True)
+        for field in obj_data:
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+        db.add(db_obj)
+        await db.flush()
+        return db_obj
+
+    async def delete(
+        self, db: AsyncSession, model_id: UUID
+    ) -> ModelType | None:
+        obj = await db.get(self.model, model_id)
+        if obj is not None:
+            await db.delete(obj)
+            await db.flush()
+        return obj
@@ -1,13 +1,51 @@
+from collections import defaultdict
+from collections.abc import Iterator
 from math import ceil
-from typing import Any, Generic, Optional, Type, TypeVar
+from typing import (
+    Any,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    overload,
+)
 from uuid import UUID
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import asc, desc
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    asc,
+    bindparam,
+    column,
+    delete,
+    desc,
+    insert,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.query import Query
 
+from app.common.repositories.keyset_pagination import KeysetPagination
+from app.db.identity_cache import get_identity_cache
+from app.common.repositories.projection import (
+    SchemaType,
+    select_schema,
+    to_schema,
+)
+from app.common.repositories.row_counts import (
+    Explain,
+    count_cache,
+    get_count_cache_key,
+    get_estimated_rows,
+)
 from app.common.schemas.pagination_schema import ListFilter, ListResponse
 
 
@@ -15,6 +53,36 @@ ModelType = TypeVar("ModelType", bound=Any)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+BULK_CHUNK_SIZE = 1000
+# Keeps `IN (...)` lists well below the driver's bind parameter limit.
+GET_MANY_CHUNK_SIZE = 1000
+STREAM_CHUNK_SIZE = 1000
+
+
+def build_list_response(
+    list_options: ListFilter,
+    data: Sequence[Any],
+    total: int | None,
+    has_next: bool | None = None,
+    next_cursor: str | None = None,
+    prev_cursor: str | None = None,
+) -> ListResponse:
+    total_pages = (
+        ceil(total / list_options.page_size) if total is not None else None
+    )
+    if has_next is None and total_pages is not None:
+        has_next = list_options.page < total_pages
+    return ListResponse(
+        data=list(data),
+        page=list_options.page,
+        page_size=list_options.page_size,
+        total=total,
+        total_pages=total_pages,
+        has_next=has_next,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
+
 
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
@@ -27,9 +95,190 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         * `schema`: A Pydantic model (schema) class
         """
         self.model = model
+        self._select_by_statements: dict[
+            tuple[str, Type[BaseModel] | None], Select
+        ] = {}
+
+    @overload
+    def get(self, db: Session, model_id: UUID) -> Optional[ModelType]: ...
+
+    @overload
+    def get(
+        self, db: Session, model_id: UUID, *, schema: Type[SchemaType]
+    ) -> Optional[SchemaType]: ...
+
+    def get(
+        self,
+        db: Session,
+        model_id: UUID,
+        *,
+        schema: Type[SchemaType] | None = None,
+    ) -> Any:
+        """
+        Get a row by id. With `schema`, only the columns backing its fields
+        are selected and the row is validated straight into it.
+
+        Repeated reads of the same id within a transaction are served from
+        the session (the identity map, or the identity cache for schemas)
+        without going back to the database.
+        """
+        if schema is None:
+            return db.get(self.model, model_id)
+
+        cache = get_identity_cache(db)
+        key = (self.model, schema, model_id)
+        if cache is not None and key in cache:
+            return cache[key]
+        obj = self.get_one_by(db, "id", model_id, schema=schema)
+        cache = get_identity_cache(db)
+        if cache is not None and obj is not None:
+            cache[key] = obj
+        return obj
+
+    @overload
+    def get_many(
+        self,
+        db: Session,
+        model_ids: Sequence[UUID],
+        *,
+        chunk_size: int = GET_MANY_CHUNK_SIZE,
+    ) -> List[ModelType]: ...
+
+    @overload
+    def get_many(
+        self,
+        db: Session,
+        model_ids: Sequence[UUID],
+        *,
+        schema: Type[SchemaType],
+        chunk_size: int = GET_MANY_CHUNK_SIZE,
+    ) -> List[SchemaType]: ...
+
+    def get_many(
+        self,
+        db: Session,
+        model_ids: Sequence[UUID],
+        *,
+        schema: Type[SchemaType] | None = None,
+        chunk_size: int = GET_MANY_CHUNK_SIZE,
+    ) -> Any:
+        """
+        Get rows by id with one `IN` query per chunk, in the order of
+        `model_ids`. Ids without a row are skipped, and ids already in the
+        session are not fetched again.
+        """
+        found: dict[UUID, Any] = {}
+        cache = get_identity_cache(db)
+        for model_id in model_ids:
+            if schema is None:
+                key = db.identity_key(self.model, model_id)
+                obj = db.identity_map.get(key)
+            else:
+                obj = (
+                    cache.get((self.model, schema, model_id))
+                    if cache
+                    else None
+                )
+            if obj is not None:
+                found[model_id] = obj
+
+        missing = [
+            model_id
+            for model_id in dict.fromkeys(model_ids)
+            if model_id not in found
+        ]
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start : start + chunk_size]
+            if schema is None:
+                rows = db.scalars(
+                    select(self.model).where(self.model.id.in_(chunk))
+                )
+                found.update((obj.id, obj) for obj in rows)
+                continue
+            stmt = (
+                select_schema(self.model, schema)
+                .add_columns(self.model.id.label("_model_id"))
+                .where(self.model.id.in_(chunk))
+            )
+            for row in db.execute(stmt).mappings():
+                mapping = dict(row)
+                found[mapping.pop("_model_id")] = schema.model_validate(
+                    mapping
+                )
+
+        cache = get_identity_cache(db)
+        if schema is not None and cache is not None:
+            cache.update(
+                ((self.model, schema, model_id), obj)
+                for model_id, obj in found.items()
+            )
+        return [found[model_id] for model_id in model_ids if model_id in found]
+
+    def select_by(
+        self, column: str, schema: Type[BaseModel] | None = None
+    ) -> Select:
+        """
+        `SELECT ... WHERE <column> = :value LIMIT 1` for the model, or for
+        the columns of `schema`. Built once per column and schema, so hot
+        lookups skip statement construction and hit the compiled cache.
+        """
+        key = (column, schema)
+        stmt = self._select_by_statements.get(key)
+        if stmt is None:
+            stmt = (
+                select(self.model)
+                if schema is None
+                else select_schema(self.model, schema)
+            )
+            stmt = self._select_by_statements[key] = stmt.where(
+                getattr(self.model, column) == bindparam("value")
+            ).limit(1)
+        return stmt
 
-    def get(self, db: Session, model_id: UUID) -> Optional[ModelType]:
-        return db.query(self.model).filter(self.model.id == model_id).first()
+    @overload
+    def get_one_by(
+        self, db: Session, column: str, value: Any
+    ) -> Optional[ModelType]: ...
+
+    @overload
+    def get_one_by(
+        self,
+        db: Session,
+        column: str,
+        value: Any,
+        *,
+        schema: Type[SchemaType],
+    ) -> Optional[SchemaType]: ...
+
+    def get_one_by(
+        self,
+        db: Session,
+        column: str,
+        value: Any,
+        *,
+        schema: Type[SchemaType] | None = None,
+    ) -> Any:
+        """First row whose `column` equals `value`, see `select_by`."""
+        stmt = self.select_by(column, schema)
+        if schema is None:
+            return db.scalars(stmt, {"value": value}).first()
+        row = db.execute(stmt, {"value": value}).mappings().first()
+        return to_schema(schema, row)
+
+    def get_one_as(
+        self,
+        db: Session,
+        schema: Type[SchemaType],
+        *whereclause: ColumnElement[bool],
+    ) -> SchemaType | None:
+        stmt = self.select_one_as(schema, *whereclause)
+        return to_schema(schema, db.execute(stmt).mappings().first())
+
+    def select_one_as(
+        self, schema: Type[BaseModel], *whereclause: ColumnElement[bool]
+    ) -> Select:
+        """The statement behind `get_one_as`, e.g. to pipeline it."""
+        return select_schema(self.model, schema).where(*whereclause).limit(1)
 
     def list(
         self, db: Session, list_options: ListFilter, query: Query | None = None
@@ -37,7 +286,19 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if not query:
             query = db.query(self.model)
 
-        total = query.count()
+        total = self._count(db, query, list_options)
+
+        if list_options.uses_cursor:
+            keyset = KeysetPagination(self.model, list_options)
+            page = keyset.paginate(keyset.apply(query).all())
+            return build_list_response(
+                list_options,
+                page.data,
+                total,
+                has_next=page.next_cursor is not None,
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+            )
 
         if list_options.order_by:
             column = list_options.order_by
@@ -48,15 +309,83 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         query = query.offset(list_options.page_size * (list_options.page - 1))
 
-        query = query.limit(list_options.page_size)
-        return ListResponse(
-            data=query.all(),
-            page=list_options.page,
-            page_size=list_options.page_size,
-            total=total,
-            total_pages=ceil(total / list_options.page_size),
+        if list_options.total_count == "exact":
+            query = query.limit(list_options.page_size)
+            return build_list_response(list_options, query.all(), total)
+
+        data = query.limit(list_options.page_size + 1).all()
+        return build_list_response(
+            list_options,
+            data[: list_options.page_size],
+            total,
+            has_next=len(data) > list_options.page_size,
         )
 
+    def iter_chunks(
+        self,
+        db: Session,
+        query: Select | None = None,
+        *,
+        mappings: bool = False,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[List[Any]]:
+        """
+        Walk every row of `query` (all rows of the model by default) in
+        chunks of `chunk_size`, through a server-side cursor so memory
+        stays bounded however large the table is.
+
+        Yields ORM objects, or row mappings with `mappings=True` (e.g. for
+        a `select()` of a few columns). ORM objects of a chunk are
+        expunged from the session once the next chunk is requested, so
+        changes made to them must be flushed before then.
+        """
+        if query is None:
+            query = select(self.model)
+        execution_options = {"yield_per": chunk_size}
+
+        if mappings:
+            result = db.execute(query, execution_options=execution_options)
+            yield from result.mappings().partitions()
+            return
+
+        for chunk in db.scalars(
+            query, execution_options=execution_options
+        ).partitions():
+            yield list(chunk)
+            for obj in chunk:
+                db.expunge(obj)
+
+    def stream(
+        self,
+        db: Session,
+        query: Select | None = None,
+        *,
+        mappings: bool = False,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """Row by row version of `iter_chunks`."""
+        for chunk in self.iter_chunks(
+            db, query, mappings=mappings, chunk_size=chunk_size
+        ):
+            yield from chunk
+
+    def _count(
+        self, db: Session, query: Query, list_options: ListFilter
+    ) -> int | None:
+        if list_options.total_count == "none":
+            return None
+        if list_options.total_count == "estimated":
+            plan = db.execute(Explain(query.statement)).scalar()
+            return get_estimated_rows(plan)
+
+        key = get_count_cache_key(query.statement, db.get_bind().dialect)
+        total = count_cache.get(key) if key else None
+        if total is None:
+            total = query.count()
+            if key:
+                count_cache.set(key, total)
+        return total
+
     def create(self, db: Session, obj_in: CreateSchemaType) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)  # type: ignore
@@ -64,6 +393,116 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.flush()
         return db_obj
 
+    def create_many(
+        self,
+        db: Session,
+        objs_in: Sequence[CreateSchemaType],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> List[ModelType]:
+        """
+        Insert `objs_in` with one multi-row `INSERT ... RETURNING` per
+        chunk, returning the created objects in the same order.
+        """
+        stmt = insert(self.model).returning(
+            self.model, sort_by_parameter_order=True
+        )
+        created: List[ModelType] = []
+        for start in range(0, len(objs_in), chunk_size):
+            chunk = objs_in[start : start + chunk_size]
+            rows = [obj_in.model_dump() for obj_in in chunk]
+            created.extend(db.scalars(stmt, rows).all())
+        return created
+
+    def upsert_many(
+        self,
+        db: Session,
+        objs_in: Sequence[CreateSchemaType],
+        index_elements: Sequence[str] = ("id",),
+        update_fields: Sequence[str] | None = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> List[ModelType]:
+        """
+        `INSERT ... ON CONFLICT (index_elements) DO UPDATE ... RETURNING`
+        per chunk. On conflict, `update_fields` (by default every inserted
+        field that is not part of `index_elements`) take the new values.
+        Without any field to update (e.g. `update_fields=()`) conflicting
+        rows are left as they are and only the inserted ones are returned.
+        """
+        upserted: List[ModelType] = []
+        for start in range(0, len(objs_in), chunk_size):
+            chunk = objs_in[start : start + chunk_size]
+            rows = [obj_in.model_dump() for obj_in in chunk]
+            insert_stmt = pg_insert(self.model)
+            fields = (
+                [field for field in rows[0] if field not in index_elements]
+                if update_fields is None
+                else update_fields
+            )
+            if fields:
+                stmt = insert_stmt.on_conflict_do_update(
+                    index_elements=index_elements,
+                    set_={
+                        field: insert_stmt.excluded[field] for field in fields
+                    },
+                ).returning(self.model, sort_by_parameter_order=True)
+            else:
+                # Skipped rows return nothing, so there is no order to keep.
+                stmt = insert_stmt.on_conflict_do_nothing(
+                    index_elements=index_elements
+                ).returning(self.model)
+            upserted.extend(
+                db.scalars(
+                    stmt,
+                    rows,
+                    execution_options={"populate_existing": True},
+                ).all()
+            )
+        return upserted
+
+    def update_many(
+        self,
+        db: Session,
+        objs_in: Mapping[UUID, UpdateSchemaType],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> int:
+        """
+        Update rows by primary key with one
+        `UPDATE ... FROM (VALUES ...)` per chunk of rows setting the same
+        fields. Returns the number of updated rows.
+        """
+        groups: dict[tuple[str, ...], List[dict]] = defaultdict(list)
+        for model_id, obj_in in objs_in.items():
+            update_data = obj_in.model_dump(exclude_unset=True)
+            if update_data:
+                groups[tuple(sorted(update_data))].append(
+                    {"id": model_id, **update_data}
+                )
+
+        table = self.model.__table__
+        updated = 0
+        for fields, rows in groups.items():
+            names = ("id", *fields)
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                source = values(
+                    *(column(name, table.c[name].type) for name in names),
+                    name="bulk_update",
+                ).data([tuple(row[name] for name in names) for row in chunk])
+                stmt = (
+                    update(table)
+                    .where(table.c.id == source.c.id)
+                    .values({name: source.c[name] for name in fields})
+                )
+                updated += db.execute(stmt).rowcount
+
+        # Rows were updated behind the ORM's back, refresh stale objects.
+        for model_id in objs_in:
+            key = db.identity_key(self.model, model_id)
+            db_obj = db.identity_map.get(key)
+            if db_obj is not None:
+                db.expire(db_obj)
+        return updated
+
     def update(
         self, db: Session, db_obj: ModelType, obj_in: UpdateSchemaType
     ) -> ModelType:
@@ -76,6 +515,45 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.flush()
         return db_obj
 
+    def update_where(
+        self,
+        db: Session,
+        obj_in: UpdateSchemaType,
+        *whereclause: ColumnElement[bool],
+    ) -> List[ModelType]:
+        """
+        `UPDATE ... RETURNING` the rows matching `whereclause` with the
+        fields set on `obj_in`, without loading them first.
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if not update_data:
+            # Nothing to set, only report the matching rows.
+            return list(db.scalars(select(self.model).where(*whereclause)))
+        stmt = (
+            update(self.model)
+            .where(*whereclause)
+            .values(update_data)
+            .returning(self.model)
+        )
+        return list(
+            db.scalars(stmt, execution_options={"populate_existing": True})
+        )
+
+    def update_by_id(
+        self, db: Session, model_id: UUID, obj_in: UpdateSchemaType
+    ) -> ModelType | None:
+        updated = self.update_where(db, obj_in, self.model.id == model_id)
+        return updated[0] if updated else None
+
+    def delete_by_id(self, db: Session, model_id: UUID) -> ModelType | None:
+        """`DELETE ... RETURNING` by primary key, without loading the row."""
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == model_id)
+            .returning(self.model)
+        )
+        return db.scalars(stmt).one_or_none()
+
     def delete(self, db: Session, model_id: UUID) -> ModelType | None:
         obj = db.query(self.model).get(model_id)
         db.delete(obj)
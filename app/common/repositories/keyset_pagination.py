@@ -0,0 +1,153 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Sequence, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import ColumnElement, asc, desc, tuple_
+
+from app.common.exceptions.invalid_pagination_exception import (
+    InvalidPaginationException,
+)
+from app.common.schemas.pagination_schema import ListFilter
+
+QueryType = TypeVar("QueryType")
+
+
+@lru_cache(maxsize=None)
+def _get_type_adapter(python_type: type) -> TypeAdapter:
+    return TypeAdapter(python_type)
+
+
+def _coerce(key: Any, value: Any) -> Any:
+    """Restore a JSON encoded cursor value to the column's python type."""
+    try:
+        python_type = key.type.python_type
+    except NotImplementedError:
+        return value
+    return _get_type_adapter(python_type).validate_python(value)
+
+
+@dataclass
+class KeysetPage:
+    data: list[Any]
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+@dataclass
+class KeysetPagination:
+    """
+    Cursor based pagination over `(order_by, id)`.
+
+    Instead of skipping `OFFSET` rows, each page filters on the row
+    comparison `(order_by, id) > (last_value, last_id)`, so every page
+    costs the same regardless of its depth. `id` is always appended as a
+    tie-break so rows sharing the same `order_by` value are never skipped
+    or repeated. The `order_by` column is expected to be non-nullable.
+    """
+
+    model: Any
+    list_options: ListFilter
+    keys: list[Any] = field(init=False)
+    values: tuple[Any, ...] | None = field(init=False, default=None)
+    backwards: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.keys = [self.model.id]
+        order_by = self.list_options.order_by
+        if order_by and order_by != "id":
+            column = self.model.__mapper__.columns.get(order_by)
+            if column is None:
+                raise InvalidPaginationException(
+                    f"Cannot paginate by '{order_by}'."
+                )
+            self.keys.insert(0, getattr(self.model, order_by))
+
+        if self.list_options.cursor:
+            self._decode(self.list_options.cursor)
+
+    @property
+    def descending(self) -> bool:
+        return self.list_options.order == "desc"
+
+    def apply(self, query: QueryType) -> QueryType:
+        """Filter, order and limit a `Query` or `Select` to one page."""
+        # Walking backwards means scanning in the opposite direction and
+        # reversing the rows afterwards.
+        scan_descending = self.descending != self.backwards
+        if self.values is not None:
+            row = tuple_(*self.keys)
+            cursor: ColumnElement = tuple_(*self.values)
+            query = query.filter(  # type: ignore[attr-defined]
+                row < cursor if scan_descending else row > cursor
+            )
+
+        by = desc if scan_descending else asc
+        query = query.order_by(  # type: ignore[attr-defined]
+            *(by(key) for key in self.keys)
+        )
+        # One extra row tells whether there is another page.
+        return query.limit(  # type: ignore[attr-defined]
+            self.list_options.page_size + 1
+        )
+
+    def paginate(self, rows: Sequence[Any]) -> KeysetPage:
+        page_size = self.list_options.page_size
+        has_more = len(rows) > page_size
+        data = list(rows[:page_size])
+        if self.backwards:
+            data.reverse()
+
+        if not data:
+            return KeysetPage(data=data)
+
+        has_next = has_more if not self.backwards else True
+        has_prev = has_more if self.backwards else self.values is not None
+        return KeysetPage(
+            data=data,
+            next_cursor=self._encode(data[-1], False) if has_next else None,
+            prev_cursor=self._encode(data[0], True) if has_prev else None,
+        )
+
+    def _encode(self, row: Any, backwards: bool) -> str:
+        payload = {
+            "k": jsonable_encoder([getattr(row, k.key) for k in self.keys]),
+            "b": backwards,
+            "o": self.list_options.order_by,
+            "d": self.list_options.order,
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def _decode(self, cursor: str) -> None:
+        try:
+            raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            values = payload["k"]
+            backwards = bool(payload["b"])
+            order_by, order = payload["o"], payload["d"]
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise InvalidPaginationException("Invalid cursor.")
+
+        if (
+            order_by != self.list_options.order_by
+            or order != self.list_options.order
+            or not isinstance(values, list)
+            or len(values) != len(self.keys)
+        ):
+            raise InvalidPaginationException(
+                "Cursor does not match the requested ordering."
+            )
+
+        try:
+            self.values = tuple(
+                _coerce(key, value)
+                for key, value in zip(self.keys, values, strict=True)
+            )
+        except ValidationError:
+            raise InvalidPaginationException("Invalid cursor.")
+        self.backwards = backwards
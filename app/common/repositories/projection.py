@@ -0,0 +1,40 @@
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+_schema_columns: dict[tuple[Any, type[BaseModel]], tuple] = {}
+
+
+def get_schema_columns(model: Any, schema: type[BaseModel]) -> tuple:
+    """
+    The model columns backing the fields of `schema`, so a read can select
+    only what the schema is going to validate.
+    """
+    key = (model, schema)
+    if key not in _schema_columns:
+        _schema_columns[key] = _build_schema_columns(model, schema)
+    return _schema_columns[key]
+
+
+def _build_schema_columns(model: Any, schema: type[BaseModel]) -> tuple:
+    columns = model.__mapper__.columns
+    missing = [field for field in schema.model_fields if field not in columns]
+    if missing:
+        raise ValueError(
+            f"{schema.__name__} fields {missing} are not columns of "
+            f"{model.__name__}."
+        )
+    return tuple(getattr(model, field) for field in schema.model_fields)
+
+
+def select_schema(model: Any, schema: type[BaseModel]) -> Select:
+    return select(*get_schema_columns(model, schema))
+
+
+def to_schema(schema: type[SchemaType], row: Any) -> SchemaType | None:
+    if row is None:
+        return None
+    return schema.model_validate(dict(row))
@@ -0,0 +1,53 @@
+import json
+from typing import Any
+
+from sqlalchemy import ClauseElement, Executable
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+
+from app.common.utils.ttl_cache import TTLCache
+from app.core.config import get_settings
+
+settings = get_settings()
+
+count_cache: TTLCache[tuple[str, str], int] = TTLCache(
+    max_size=settings.LIST_COUNT_CACHE_MAX_SIZE,
+    ttl=settings.LIST_COUNT_CACHE_TTL_SECONDS,
+)
+
+
+class Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON)` of a statement, without running it."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(
+    element: Explain, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def get_estimated_rows(plan: Any) -> int:
+    """Read the planner's row estimate from an `EXPLAIN (FORMAT JSON)`."""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_count_cache_key(
+    statement: Any, dialect: Dialect
+) -> tuple[str, str] | None:
+    """
+    Key exact counts by the compiled SQL and its parameters, so each
+    model and filter combination is cached separately.
+    """
+    if not count_cache.ttl:
+        return None
+    compiled = statement.compile(dialect=dialect)
+    return (str(compiled), repr(sorted(compiled.params.items())))
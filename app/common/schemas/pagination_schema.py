@@ -11,11 +11,26 @@ class ListFilter(BaseModel):
     page_size: Annotated[int, _PageSizeField] = 10
     order: Literal["asc", "desc"] | None = None
     order_by: str | None = None
+    pagination: Literal["offset", "cursor"] = "offset"
+    cursor: str | None = None
+    """Opaque `next_cursor`/`prev_cursor` from a previous cursor page."""
+    total_count: Literal["exact", "estimated", "none"] = "exact"
+    """
+    How `total` is computed: an exact `COUNT(*)`, the planner's row
+    estimate, or not at all (only `has_next` is reported).
+    """
+
+    @property
+    def uses_cursor(self) -> bool:
+        return self.pagination == "cursor" or self.cursor is not None
 
 
 class ListResponse[T](BaseModel):
     data: list[T]
     page: Annotated[int, _PageField]
     page_size: Annotated[int, _PageSizeField]
-    total: int
-    total_pages: int
+    total: int | None
+    total_pages: int | None
+    has_next: bool | None = None
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
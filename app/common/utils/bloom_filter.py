@@ -0,0 +1,57 @@
+import hashlib
+from math import ceil, log
+from typing import Iterator
+
+
+class BloomFilter:
+    """
+    Set membership in a fixed bit array: `in` never misses an added item
+    but answers true for about `error_rate` of the others while no more
+    than `capacity` items were added. Items cannot be removed, build a new
+    filter instead.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(
+            ceil(-self.capacity * log(error_rate) / log(2) ** 2), 8
+        )
+        self.hash_count = max(round(self.size / self.capacity * log(2)), 1)
+        self._bits = bytearray(ceil(self.size / 8))
+        self._count = 0
+
+    def __len__(self) -> int:
+        """
+        Approximate number of distinct items added: adding an item the
+        filter already contains (or reports as such) does not count.
+        """
+        return self._count
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Double hashing: k positions out of one 128 bit digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hash_count):
+            yield (first + index * second) % self.size
+
+    def add(self, item: str) -> bool:
+        """Add `item`, returning whether it was not contained yet."""
+        added = False
+        for position in self._positions(item):
+            mask = 1 << (position & 7)
+            if not self._bits[position >> 3] & mask:
+                self._bits[position >> 3] |= mask
+                added = True
+        if added:
+            self._count += 1
+        return added
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
@@ -0,0 +1,49 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from app.common.exceptions.deadline_exceeded_exception import (
+    DeadlineExceededException,
+)
+
+
+@dataclass
+class Deadline:
+    """Time budget of a request, counted from when it was received."""
+
+    budget: float
+    started_at: float = field(default_factory=time.monotonic)
+
+    def remaining(self) -> float:
+        return self.started_at + self.budget - time.monotonic()
+
+    def check(self) -> float:
+        """Remaining seconds, raising once the budget is spent."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededException()
+        return remaining
+
+
+# NOTE: bound as a mutable instance by the middleware, so route
+#       dependencies running in the threadpool can tighten the budget of
+#       the request they belong to.
+_deadline: ContextVar[Deadline | None] = ContextVar("deadline", default=None)
+
+
+def start_deadline(budget: float) -> Deadline | None:
+    deadline = Deadline(budget) if budget else None
+    _deadline.set(deadline)
+    return deadline
+
+
+def get_deadline() -> Deadline | None:
+    return _deadline.get()
+
+
+def get_remaining_timeout(default: float) -> float:
+    """`default`, capped by what is left of the current deadline."""
+    deadline = get_deadline()
+    if deadline is None:
+        return default
+    return min(default, deadline.check())
@@ -0,0 +1,451 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import urllib.parse
+from abc import abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from math import floor
+from typing import Any, Iterator
+
+from limits.storage import SCHEMES, Storage, storage_from_string
+from limits.storage.base import (
+    SlidingWindowCounterSupport,
+    TimestampedSlidingWindow,
+)
+
+DEFAULT_MAX_KEYS = 100_000
+DEFAULT_SLOTS = 65_536
+DEFAULT_SHARED_MEMORY_PATH = "/dev/shm/fastapi-rate-limits"
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Key hash, expires at, count.
+_SLOT = struct.Struct("<QdQ")
+# Neighbouring slots a key may take in the shared memory table.
+PROBE_LENGTH = 8
+
+
+class CounterStorage(
+    Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow
+):
+    """
+    Fixed window and sliding window counter support on top of `incr`,
+    `decr` and `get`, following `limits.storage.MemoryStorage`.
+    """
+
+    @abstractmethod
+    def decr(self, key: str, amount: int = 1) -> int:
+        raise NotImplementedError
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count, previous_ttl, current_count, _ = (
+            self._get_sliding_window_info(
+                previous_key, current_key, expiry, now
+            )
+        )
+        weighted_count = previous_count * previous_ttl / expiry + current_count
+        if floor(weighted_count) + amount > limit:
+            return False
+        # A new current window lives on as the previous one.
+        current_count = self.incr(current_key, 2 * expiry, amount=amount)
+        weighted_count = previous_count * previous_ttl / expiry + current_count
+        if floor(weighted_count) > limit:
+            # Another hit got in first.
+            self.decr(current_key, amount)
+            return False
+        return True
+
+    def _get_sliding_window_info(
+        self, previous_key: str, current_key: str, expiry: int, now: float
+    ) -> tuple[int, float, int, float]:
+        previous_count = self.get(previous_key)
+        current_count = self.get(current_key)
+        if previous_count == 0:
+            previous_ttl = 0.0
+        else:
+            previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def get_sliding_window(
+        self, key: str, expiry: int
+    ) -> tuple[int, float, int, float]:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        return self._get_sliding_window_info(
+            previous_key, current_key, expiry, now
+        )
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        for window_key in self.sliding_window_keys(key, expiry, time.time()):
+            self.clear(window_key)
+
+
+@dataclass(slots=True)
+class _Counter:
+    count: int
+    expires_at: float
+
+
+class BoundedMemoryStorage(CounterStorage):
+    """
+    Per process counters, evicting the least recently used key once
+    `max_keys` are tracked, so memory does not grow with every client.
+    """
+
+    STORAGE_SCHEME = ["bounded-memory"]
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        **options: Any,
+    ):
+        self.max_keys = int(max_keys)
+        self._counters: OrderedDict[str, _Counter] = OrderedDict()
+        self._lock = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return ValueError
+
+    def _get_live(self, key: str, now: float) -> _Counter | None:
+        counter = self._counters.get(key)
+        if counter is None or counter.expires_at <= now:
+            return None
+        return counter
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        now = time.time()
+        with self._lock:
+            counter = self._get_live(key, now)
+            if counter is None:
+                counter = self._counters[key] = _Counter(0, now + expiry)
+            counter.count = max(counter.count + amount, 0)
+            self._counters.move_to_end(key)
+            while len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+            return counter.count
+
+    def decr(self, key: str, amount: int = 1) -> int:
+        with self._lock:
+            counter = self._get_live(key, time.time())
+            if counter is None:
+                return 0
+            counter.count = max(counter.count - amount, 0)
+            return counter.count
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            counter = self._get_live(key, time.time())
+            if counter is None:
+                return 0
+            self._counters.move_to_end(key)
+            return counter.count
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._lock:
+            counter = self._get_live(key, now)
+            return counter.expires_at if counter else now
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def reset(self) -> int | None:
+        with self._lock:
+            count = len(self._counters)
+            self._counters.clear()
+            return count
+
+    def check(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class SharedMemoryStorage(CounterStorage):
+    """
+    Counters in a memory mapped file, shared by the worker processes of
+    one host: `shared-memory:///dev/shm/<name>`. Every process must use
+    the same number of `slots`.
+
+    The table has a fixed size. A key hashes to one of `PROBE_LENGTH`
+    neighbouring slots and takes over the one expiring first when all of
+    them are in use.
+    """
+
+    STORAGE_SCHEME = ["shared-memory"]
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        slots: int = DEFAULT_SLOTS,
+        **options: Any,
+    ):
+        path = urllib.parse.urlparse(uri or "").path
+        self.path = path or DEFAULT_SHARED_MEMORY_PATH
+        self.slots = int(slots)
+        size = self.slots * _SLOT.size
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        # flock only excludes other processes, not threads sharing the fd.
+        self._lock = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return OSError
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        # 0 marks an empty slot.
+        return int.from_bytes(digest, "little") or 1
+
+    def _probe(self, key_hash: int) -> tuple[int | None, int]:
+        """
+        Offset of the slot holding `key_hash`, if any, and of the slot to
+        take over for it otherwise.
+        """
+        start = key_hash % self.slots
+        victim, victim_expires_at = 0, float("inf")
+        for probe in range(PROBE_LENGTH):
+            offset = ((start + probe) % self.slots) * _SLOT.size
+            slot_hash, expires_at, _ = _SLOT.unpack_from(self._map, offset)
+            if slot_hash == key_hash:
+                return offset, offset
+            if expires_at < victim_expires_at:
+                victim, victim_expires_at = offset, expires_at
+        return None, victim
+
+    def _read_live(self, key: str, now: float) -> tuple[int, float] | None:
+        offset, _ = self._probe(self._hash(key))
+        if offset is None:
+            return None
+        _, expires_at, count = _SLOT.unpack_from(self._map, offset)
+        if expires_at <= now:
+            return None
+        return count, expires_at
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        now = time.time()
+        key_hash = self._hash(key)
+        with self._locked():
+            found, offset = self._probe(key_hash)
+            _, expires_at, count = _SLOT.unpack_from(self._map, offset)
+            if found is None or expires_at <= now:
+                expires_at, count = now + expiry, 0
+            count = max(count + amount, 0)
+            _SLOT.pack_into(self._map, offset, key_hash, expires_at, count)
+            return count
+
+    def decr(self, key: str, amount: int = 1) -> int:
+        now = time.time()
+        key_hash = self._hash(key)
+        with self._locked():
+            offset, _ = self._probe(key_hash)
+            if offset is None:
+                return 0
+            _, expires_at, count = _SLOT.unpack_from(self._map, offset)
+            if expires_at <= now:
+                return 0
+            count = max(count - amount, 0)
+            _SLOT.pack_into(self._map, offset, key_hash, expires_at, count)
+            return count
+
+    def get(self, key: str) -> int:
+        with self._locked():
+            live = self._read_live(key, time.time())
+        return live[0] if live else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._locked():
+            live = self._read_live(key, now)
+        return live[1] if live else now
+
+    def clear(self, key: str) -> None:
+        with self._locked():
+            offset, _ = self._probe(self._hash(key))
+            if offset is not None:
+                _SLOT.pack_into(self._map, offset, 0, 0.0, 0)
+
+    def reset(self) -> int | None:
+        with self._locked():
+            self._map[:] = bytes(len(self._map))
+        return None
+
+    def check(self) -> bool:
+        return not self._map.closed
+
+
+@dataclass(slots=True)
+class _LocalCounter:
+    # Backend count as of the last sync.
+    remote: int = 0
+    # Hits not sent to the backend yet.
+    pending: int = 0
+    # Hits being sent right now.
+    in_flight: int = 0
+    expiry: float = 0
+    expires_at: float = 0
+    synced_at: float = float("-inf")
+
+
+class BatchedStorage(CounterStorage):
+    """
+    Pre-aggregates hits in process in front of another storage, usually a
+    networked one: `batched+redis://redis:6379`, or e.g.
+    `batched+bounded-memory://` as a local stand-in.
+
+    A check only reaches the backend once the local view of a key is more
+    than `flush_interval` seconds old, sending the hits counted meanwhile
+    as one increment, so most checks cost no I/O. Limits become
+    approximate: within an interval each process only sees its own hits.
+    """
+
+    STORAGE_SCHEME = [
+        f"batched+{scheme}"
+        for scheme in SCHEMES
+        if not scheme.startswith("async+")
+    ]
+
+    def __init__(
+        self,
+        uri: str,
+        wrap_exceptions: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        **options: Any,
+    ):
+        self.storage = storage_from_string(uri.removeprefix("batched+"))
+        self.flush_interval = float(flush_interval)
+        self.max_keys = int(max_keys)
+        self._counters: OrderedDict[str, _LocalCounter] = OrderedDict()
+        self._lock = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return self.storage.base_exceptions
+
+    def _update(self, key: str, expiry: float | None, amount: int) -> int:
+        now = time.time()
+        evicted: list[tuple[str, _LocalCounter]] = []
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None or (
+                counter.expires_at and counter.expires_at <= now
+            ):
+                counter = self._counters[key] = _LocalCounter()
+            self._counters.move_to_end(key)
+            while len(self._counters) > self.max_keys:
+                evicted.append(self._counters.popitem(last=False))
+
+            if expiry is not None:
+                counter.expiry = expiry
+                counter.expires_at = counter.expires_at or now + expiry
+            counter.pending += amount
+            flush = None
+            if time.monotonic() - counter.synced_at >= self.flush_interval:
+                # Claim the sync, other threads keep counting locally.
+                flush, counter.pending = counter.pending, 0
+                counter.in_flight += flush
+                counter.synced_at = time.monotonic()
+
+        for evicted_key, evicted_counter in evicted:
+            if evicted_counter.pending:
+                self.storage.incr(
+                    evicted_key,
+                    evicted_counter.expiry,
+                    evicted_counter.pending,
+                )
+
+        if flush is not None:
+            try:
+                if flush:
+                    remote = self.storage.incr(key, counter.expiry, flush)
+                else:
+                    remote = self.storage.get(key)
+            except Exception:
+                with self._lock:
+                    counter.pending += flush
+                    counter.in_flight -= flush
+                    counter.synced_at = float("-inf")
+                raise
+            with self._lock:
+                counter.in_flight -= flush
+                counter.remote = remote
+
+        return max(counter.remote + counter.in_flight + counter.pending, 0)
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        return self._update(key, expiry, amount)
+
+    def decr(self, key: str, amount: int = 1) -> int:
+        return self._update(key, None, -amount)
+
+    def get(self, key: str) -> int:
+        return self._update(key, None, 0)
+
+    def get_expiry(self, key: str) -> float:
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is not None and counter.expires_at > time.time():
+                return counter.expires_at
+        return self.storage.get_expiry(key)
+
+    def flush(self) -> None:
+        """Send every pending hit to the backend, e.g. on shutdown."""
+        with self._lock:
+            pending = [
+                (key, counter.expiry, counter.pending)
+                for key, counter in self._counters.items()
+                if counter.pending
+            ]
+            for counter in self._counters.values():
+                counter.remote += counter.pending
+                counter.pending = 0
+        for key, expiry, amount in pending:
+            self.storage.incr(key, expiry, amount)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._counters.pop(key, None)
+        self.storage.clear(key)
+
+    def reset(self) -> int | None:
+        with self._lock:
+            self._counters.clear()
+        return self.storage.reset()
+
+    def check(self) -> bool:
+        return self.storage.check()
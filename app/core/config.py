@@ -1,11 +1,32 @@
 import logging
 import secrets
 from functools import lru_cache
-from typing import Any, Final, List, Optional, Union
+from typing import Annotated, Any, Final, List, Literal, Optional, Union
 
-from pydantic import AnyHttpUrl, PostgresDsn, field_validator, model_validator
+from pydantic import (
+    AnyHttpUrl,
+    AwareDatetime,
+    BaseModel,
+    PostgresDsn,
+    field_validator,
+    model_validator,
+)
 from pydantic_core.core_schema import ValidationInfo
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+from sqlalchemy.engine import make_url
+
+
+class JWTKeySettings(BaseModel):
+    kid: str
+    algorithm: Literal["EdDSA", "RS256"] = "EdDSA"
+    # PEM file, a private key signs and verifies, a public one only
+    # verifies tokens signed before.
+    pem_file: str
+    # The latest active private key signs new tokens. Keys are published
+    # before they activate, so verifiers already know them.
+    active_from: AwareDatetime | None = None
+    # Neither accepted nor published from then on.
+    expires_at: AwareDatetime | None = None
 
 
 class Settings(BaseSettings):
@@ -25,14 +46,59 @@ class Settings(BaseSettings):
     PROJECT_NAME: str
     AUTHENTICATION_API_RATE_LIMIT: str = "5 per minute"
     SECURE_COOKIE: bool = True
+    # Comma separated emails of the users allowed on the /admin endpoints.
+    # Nobody is when empty.
+    ADMIN_EMAILS: Annotated[List[str], NoDecode] = []
 
     # Database
     POSTGRES_SERVER: str
+    POSTGRES_REPLICA_SERVERS: Annotated[List[str], NoDecode] = []
+    """Comma separated `host` or `host:port` of read replicas."""
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     POSTGRES_PORT: int
+    # `psycopg` (3) also serves the async engine and prepares statements
+    POSTGRES_DRIVER: Literal["psycopg2", "psycopg"] = "psycopg2"
+    # psycopg 3 prepares a statement server side after this many runs on
+    # a connection. None disables prepared statements.
+    DB_PREPARE_THRESHOLD: int | None = 5
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
+    SQLALCHEMY_ASYNC_DATABASE_URI: Optional[str] = None
+    SQLALCHEMY_REPLICA_URIS: Annotated[List[str], NoDecode] = []
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5
+    DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: float = 10
+    DB_REPLICA_CONNECT_TIMEOUT_SECONDS: int = 2
+
+    # Connection pool (per engine, i.e. per process)
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    DB_POOL_RECYCLE_SECONDS: int = -1
+    # `idle` only pings connections idle for DB_POOL_PRE_PING_IDLE_SECONDS
+    DB_POOL_PRE_PING: Literal["always", "idle", "never"] = "always"
+    DB_POOL_PRE_PING_IDLE_SECONDS: float = 30
+    DB_POOL_USE_LIFO: bool = False
+    # `transaction` when connecting through a transaction pooling proxy
+    # (e.g. PgBouncer pool_mode=transaction): no client side pool unless
+    # DB_POOLER_CLIENT_POOL_SIZE is set, no pre-ping, no prepared statements
+    DB_POOLER: Literal["none", "transaction"] = "none"
+    DB_POOLER_CLIENT_POOL_SIZE: int = 0
+    LIST_COUNT_CACHE_TTL_SECONDS: float = 0
+    LIST_COUNT_CACHE_MAX_SIZE: int = 1024
+
+    # Rate limiting
+    # Storage of every limiter: "bounded-memory://" (per process),
+    # "shared-memory:///dev/shm/<name>" (per host) or "batched+<uri>" to
+    # pre-aggregate hits in process in front of a networked storage, e.g.
+    # "batched+redis://redis:6379" (needs the `redis` extra).
+    RATE_LIMIT_STORAGE_URI: str = "bounded-memory://"
+    RATE_LIMIT_STRATEGY: Literal["fixed-window", "sliding-window-counter"] = (
+        "sliding-window-counter"
+    )
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    RATE_LIMIT_SHARED_MEMORY_SLOTS: int = 65536
+    RATE_LIMIT_FLUSH_INTERVAL_SECONDS: float = 1
 
     # SQS
     BROKER_URL: str = "sqs://"
@@ -42,10 +108,56 @@ class Settings(BaseSettings):
     # Logging
     LOG_JSON_FORMAT: bool = False
     LOG_LEVEL: int = logging.INFO
+    # Warn when one statement shape runs more often in a request, 0 disables
+    DB_N_PLUS_ONE_THRESHOLD: int = 10
+    # Statements slower than this are logged with their caller, 0 disables
+    DB_SLOW_QUERY_THRESHOLD_SECONDS: float = 0.5
+    # Tag statements with sqlcommenter comments (route, task, repo method).
+    # The request id makes every statement text unique, which defeats
+    # client side prepared statement caches keyed by the SQL text.
+    DB_SQL_COMMENTS: bool = False
+    DB_SQL_COMMENT_REQUEST_ID: bool = True
 
     # Auth
+    # Hashes made with another algorithm or cost are upgraded on login,
+    # see `python -m app.commands.calibrate_password_hash`.
+    PASSWORD_HASH_ALGORITHM: Literal["bcrypt", "argon2"] = "bcrypt"
+    BCRYPT_ROUNDS: int = 12
+    # argon2id parameters, requires the `argon2` extra
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    # Password hashing processes, defaults to the core count. 0 hashes in
+    # the threadpool instead.
+    PASSWORD_HASHER_WORKERS: int | None = None
+    # Password operations waiting for a worker before new ones get a 503
+    PASSWORD_HASHER_MAX_QUEUE: int = 64
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # Asymmetric keys, published at /.well-known/jwks.json. Without any,
+    # tokens are signed with SECRET_KEY and ALGORITHM.
+    JWT_KEYS: List[JWTKeySettings] = []
+    # Accept tokens without a `kid`, signed with SECRET_KEY
+    JWT_ACCEPT_SECRET_KEY_TOKENS: bool = True
+    JWKS_MAX_AGE_SECONDS: int = 300
+    # Decoded access tokens by digest, never kept past their `exp`.
+    # 0 disables the cache.
+    TOKEN_CACHE_TTL_SECONDS: float = 300
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    # Per process cache of the authenticated user, 0 disables it. Changes
+    # made by other processes show up after at most the TTL.
+    CURRENT_USER_CACHE_TTL_SECONDS: float = 30
+    CURRENT_USER_CACHE_MAX_SIZE: int = 10000
+    # Trust the user claims of the access token without any lookup, so
+    # password resets only revoke tokens once they expire.
+    CURRENT_USER_STATELESS: bool = False
+    # Logged out tokens are looked up in a per process bloom filter sized
+    # for CAPACITY unexpired revocations, refreshed from the database at
+    # most every REFRESH interval and rebuilt every REBUILD interval.
+    TOKEN_REVOCATION_FILTER_CAPACITY: int = 100000
+    TOKEN_REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    TOKEN_REVOCATION_REFRESH_INTERVAL_SECONDS: float = 5
+    TOKEN_REVOCATION_REBUILD_INTERVAL_SECONDS: float = 3600
 
     # Mail
     SENDER_EMAIL: str = "test@test.com"
@@ -60,6 +172,11 @@ class Settings(BaseSettings):
 
     # Requests
     REQUESTS_TIMEOUT_SECONDS: int = 1
+    # Default time budget of a request, 0 disables deadlines
+    REQUEST_DEADLINE_SECONDS: float = 30
+    # statement_timeout of every database connection (not set behind a
+    # transaction pooler), 0 disables; request deadlines only tighten it
+    DB_STATEMENT_TIMEOUT_SECONDS: float = 10
 
     @model_validator(mode="before")
     @classmethod
@@ -88,13 +205,25 @@ class Settings(BaseSettings):
             return v
         raise ValueError(v)
 
+    @field_validator(
+        "ADMIN_EMAILS",
+        "POSTGRES_REPLICA_SERVERS",
+        "SQLALCHEMY_REPLICA_URIS",
+        mode="before",
+    )
+    @classmethod
+    def split_comma_separated(cls, v: Union[str, List[str]]) -> List[str]:
+        if isinstance(v, str):
+            return [i.strip() for i in v.split(",") if i.strip()]
+        return v
+
     @field_validator("SQLALCHEMY_DATABASE_URI", mode="before")
     @classmethod
     def assemble_db_uri(cls, field_value: Any, info: ValidationInfo) -> str:
         if isinstance(field_value, str):
             return field_value
         return PostgresDsn.build(
-            scheme="postgresql+psycopg2",
+            scheme=f"postgresql+{info.data.get('POSTGRES_DRIVER')}",
             username=info.data.get("POSTGRES_USER"),
             password=info.data.get("POSTGRES_PASSWORD"),
             host=info.data.get("POSTGRES_SERVER"),
@@ -102,6 +231,49 @@ class Settings(BaseSettings):
             port=info.data.get("POSTGRES_PORT"),
         ).unicode_string()
 
+    @field_validator("SQLALCHEMY_ASYNC_DATABASE_URI", mode="before")
+    @classmethod
+    def assemble_async_db_uri(
+        cls, field_value: Any, info: ValidationInfo
+    ) -> str | None:
+        if isinstance(field_value, str):
+            return field_value
+        sync_uri = info.data.get("SQLALCHEMY_DATABASE_URI")
+        if not sync_uri:
+            return None
+        async_driver = (
+            "psycopg_async"
+            if info.data.get("POSTGRES_DRIVER") == "psycopg"
+            else "asyncpg"
+        )
+        return (
+            make_url(sync_uri)
+            .set(drivername=f"postgresql+{async_driver}")
+            .render_as_string(hide_password=False)
+        )
+
+    @field_validator("SQLALCHEMY_REPLICA_URIS", mode="after")
+    @classmethod
+    def assemble_replica_uris(
+        cls, field_value: List[str], info: ValidationInfo
+    ) -> List[str]:
+        if field_value:
+            return field_value
+        uris = []
+        for server in info.data.get("POSTGRES_REPLICA_SERVERS") or []:
+            host, _, port = server.partition(":")
+            uris.append(
+                PostgresDsn.build(
+                    scheme=f"postgresql+{info.data.get('POSTGRES_DRIVER')}",
+                    username=info.data.get("POSTGRES_USER"),
+                    password=info.data.get("POSTGRES_PASSWORD"),
+                    host=host,
+                    path=info.data.get("POSTGRES_DB") or "",
+                    port=int(port) if port else info.data.get("POSTGRES_PORT"),
+                ).unicode_string()
+            )
+        return uris
+
 
 settings: Final = Settings()
 
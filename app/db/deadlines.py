@@ -0,0 +1,46 @@
+from typing import Any
+
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+from app.common.utils.deadline import get_deadline
+
+
+def apply_deadline(
+    session_factory: sessionmaker, statement_timeout: float | None = None
+) -> None:
+    """
+    Bound the statements of a request by what is left of its deadline:
+    no statement is sent once the deadline has passed, and a transaction
+    starts with `SET LOCAL statement_timeout` when less is left than the
+    `statement_timeout` (in seconds) connections were opened with, so
+    requests with time to spare skip that round trip.
+
+    Autocommit sessions have no transaction to scope the setting to, so
+    their statements are only bounded by the connection's timeout, on top
+    of the deadline check. Pool checkouts wait at most until the deadline,
+    see `InstrumentedQueuePool`.
+    """
+
+    @event.listens_for(session_factory, "after_begin")
+    def _after_begin(session: Session, _: Any, connection: Connection) -> None:
+        deadline = get_deadline()
+        if deadline is None:
+            return
+        remaining = deadline.check()
+        isolation_level = connection.get_execution_options().get(
+            "isolation_level"
+        )
+        if isolation_level == "AUTOCOMMIT":
+            return
+        if statement_timeout is not None and remaining >= statement_timeout:
+            return
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {max(1, int(remaining * 1000))}"
+        )
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+        deadline = get_deadline()
+        if deadline is not None:
+            deadline.check()
@@ -0,0 +1,119 @@
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.pool import NullPool
+
+from app.core.config import get_settings
+from app.db.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+)
+
+settings = get_settings()
+
+
+def uses_transaction_pooler() -> bool:
+    return settings.DB_POOLER == "transaction"
+
+
+def _unique_statement_name() -> str:
+    # Names must not collide across the server connections a transaction
+    # pooler hands out.
+    return f"__asyncpg_{uuid4()}__"
+
+
+def get_connect_args(*, is_async: bool = False) -> dict[str, Any]:
+    """
+    DBAPI `connect()` arguments. Behind a transaction pooler consecutive
+    transactions may run on different server connections, so statements
+    prepared on one are unknown to the next: prepared statement caching
+    is turned off.
+    """
+    if settings.POSTGRES_DRIVER == "psycopg":
+        return {
+            "prepare_threshold": (
+                None
+                if uses_transaction_pooler()
+                else settings.DB_PREPARE_THRESHOLD
+            )
+        }
+    if is_async and uses_transaction_pooler():
+        # asyncpg always prepares, at least give every statement a name
+        # of its own and never reuse it.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    return {}
+
+
+def get_statement_timeout() -> float | None:
+    """
+    The `statement_timeout` (in seconds) connections are opened with.
+    Transaction poolers reject startup options, there it is left unset.
+    """
+    if uses_transaction_pooler() or not settings.DB_STATEMENT_TIMEOUT_SECONDS:
+        return None
+    return settings.DB_STATEMENT_TIMEOUT_SECONDS
+
+
+def _get_statement_timeout_args(*, is_async: bool) -> dict[str, Any]:
+    statement_timeout = get_statement_timeout()
+    if statement_timeout is None:
+        return {}
+    milliseconds = max(1, int(statement_timeout * 1000))
+    if is_async and settings.POSTGRES_DRIVER != "psycopg":
+        return {"server_settings": {"statement_timeout": str(milliseconds)}}
+    return {"options": f"-c statement_timeout={milliseconds}"}
+
+
+def get_pool_options(*, is_async: bool = False) -> dict[str, Any]:
+    if uses_transaction_pooler() and not settings.DB_POOLER_CLIENT_POOL_SIZE:
+        return {"poolclass": NullPool}
+    if uses_transaction_pooler():
+        # Connections to the pooler are cheap, keep a few and drop broken
+        # ones on error (SQLAlchemy invalidates the pool on disconnects)
+        # instead of pinging on every checkout.
+        return {
+            "poolclass": (
+                InstrumentedAsyncQueuePool
+                if is_async
+                else InstrumentedQueuePool
+            ),
+            "pool_size": settings.DB_POOLER_CLIENT_POOL_SIZE,
+            "max_overflow": 0,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_pre_ping": False,
+        }
+    return {
+        "poolclass": (
+            InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool
+        ),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+    }
+
+
+def get_engine_options(
+    *, is_async: bool = False, connect_timeout: int | None = None
+) -> dict[str, Any]:
+    """
+    `create_engine` keyword arguments shared by every engine we create.
+    `connect_timeout` (in seconds) bounds connecting with the sync drivers.
+    Statements are bounded by `get_statement_timeout()`.
+    """
+    options = get_pool_options(is_async=is_async)
+    connect_args = {
+        **get_connect_args(is_async=is_async),
+        **_get_statement_timeout_args(is_async=is_async),
+    }
+    if connect_timeout is not None:
+        connect_args["connect_timeout"] = connect_timeout
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
@@ -0,0 +1,48 @@
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+_IDENTITY_CACHE = "identity_cache"
+
+
+def get_identity_cache(session: Session) -> dict[Any, Any] | None:
+    """
+    Rows already read by primary key in the current transaction, keyed by
+    `(model, schema, id)`. None when the session does not track one.
+
+    This complements the ORM identity map for schema projections, which
+    return plain pydantic objects the session knows nothing about.
+    """
+    return session.info.get(_IDENTITY_CACHE)
+
+
+def track_identity_cache(session_factory: sessionmaker) -> None:
+    """
+    Keep an identity cache per transaction, dropped on any write so reads
+    after a write always see it.
+    """
+
+    @event.listens_for(session_factory, "after_begin")
+    def _after_begin(session: Session, *_: Any) -> None:
+        session.info[_IDENTITY_CACHE] = {}
+
+    @event.listens_for(session_factory, "after_flush")
+    def _after_flush(session: Session, *_: Any) -> None:
+        _clear(session)
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+        if not orm_execute_state.is_select:
+            _clear(orm_execute_state.session)
+
+    @event.listens_for(session_factory, "after_commit")
+    @event.listens_for(session_factory, "after_rollback")
+    def _after_transaction(session: Session) -> None:
+        session.info.pop(_IDENTITY_CACHE, None)
+
+
+def _clear(session: Session) -> None:
+    cache = get_identity_cache(session)
+    if cache is not None:
+        cache.clear()
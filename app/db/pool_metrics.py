@@ -0,0 +1,160 @@
+import bisect
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.common.utils.deadline import get_deadline
+from app.db.request_stats import get_request_db_stats
+
+# Upper bounds, in seconds, of the checkout wait histogram buckets.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_engines: dict[str, Engine] = {}
+
+
+class PoolMetrics:
+    """Cumulative checkout counters of one connection pool."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.wait_seconds_total = 0.0
+        # One extra bucket for waits above the last bound.
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+        self._lock = threading.Lock()
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS, seconds)] += 1
+
+    def observe_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_histogram": {
+                str(bound): count
+                for bound, count in zip(
+                    (*WAIT_BUCKETS, "+Inf"), self.wait_buckets, strict=True
+                )
+            },
+        }
+
+
+class _InstrumentedPoolMixin:
+    """
+    Times how long each checkout waits for a pooled connection, and caps
+    that wait by what is left of the request's deadline.
+    """
+
+    metrics: PoolMetrics
+    _pool_timeout: float
+
+    def __init__(self, *args: Any, **kw: Any):
+        super().__init__(*args, **kw)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> Pool:
+        # Keep counting across pool recreation (e.g. after invalidation).
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        pool._timeout = self._pool_timeout
+        return pool
+
+    # NOTE: `QueuePool` waits `_timeout` seconds for a connection, reading
+    #       it gives the configured timeout capped by the deadline.
+    @property
+    def _timeout(self) -> float:
+        deadline = get_deadline()
+        if deadline is None:
+            return self._pool_timeout
+        return max(0, min(self._pool_timeout, deadline.remaining()))
+
+    @_timeout.setter
+    def _timeout(self, timeout: float) -> None:
+        self._pool_timeout = timeout
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore[misc]
+        except exc.TimeoutError:
+            self.metrics.observe_timeout()
+            deadline = get_deadline()
+            if deadline is not None:
+                deadline.check()
+            raise
+        wait = time.perf_counter() - start
+        self.metrics.observe_wait(wait)
+        stats = get_request_db_stats()
+        if stats is not None:
+            stats.checkout_wait += wait
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(
+    _InstrumentedPoolMixin, AsyncAdaptedQueuePool
+):
+    pass
+
+
+def ping_idle_connections(engine: Engine, idle_seconds: float) -> None:
+    """
+    Pre-ping only connections that sat idle in the pool for longer than
+    `idle_seconds`, instead of paying a round trip on every checkout.
+    """
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(_: Any, connection_record: Any) -> None:
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(
+        dbapi_connection: Any, connection_record: Any, _: Any
+    ) -> None:
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None:
+            return
+        if time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except engine.dialect.loaded_dbapi.Error as error:
+            # The pool retries the checkout with a fresh connection.
+            raise exc.DisconnectionError() from error
+
+
+def register_engine(name: str, engine: Engine) -> None:
+    _engines[name] = engine
+
+
+def get_pool_stats() -> dict[str, dict]:
+    stats = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        pool_stats: dict[str, Any] = {"status": pool.status()}
+        if isinstance(pool, QueuePool):
+            pool_stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+            )
+        metrics = getattr(pool, "metrics", None)
+        if metrics is not None:
+            pool_stats.update(metrics.as_dict())
+        stats[name] = pool_stats
+    return stats
@@ -0,0 +1,137 @@
+import itertools
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from sqlalchemy import Engine, event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = structlog.get_logger(__name__)
+
+# Zero when the replica has replayed everything it received, otherwise the
+# age of the last replayed transaction. NULL (so 0) on a primary.
+_REPLICATION_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+
+@dataclass(eq=False)
+class Replica:
+    engine: Engine
+    autocommit_engine: Engine = field(init=False)
+    healthy: bool = True
+    checked_at: float = 0
+
+    def __post_init__(self) -> None:
+        self.autocommit_engine = self.engine.execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+
+
+class ReplicaSet:
+    """
+    Round robin over the read replicas that are reachable and within
+    `max_lag` seconds of the primary. A background thread re-checks every
+    replica each `check_interval` seconds (0 disables it), so choosing a
+    replica never waits on the network, and a replica is taken out of
+    rotation as soon as one of its connections fails.
+    """
+
+    def __init__(
+        self, engines: list[Engine], max_lag: float, check_interval: float
+    ):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._cycle = itertools.cycle(self.replicas)
+        self._lock = threading.Lock()
+        self._checker_pid: int | None = None
+        self._stopped = threading.Event()
+        for replica in self.replicas:
+            self._listen_for_errors(replica)
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Replica | None:
+        """Next healthy replica, or None to fall back to the primary."""
+        self._start_checking()
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                replica = next(self._cycle)
+            if replica.healthy:
+                return replica
+        return None
+
+    def check(self, replica: Replica) -> bool:
+        """Query the health of `replica` and record it."""
+        try:
+            with replica.autocommit_engine.connect() as connection:
+                lag = connection.execute(_REPLICATION_LAG_QUERY).scalar()
+        except SQLAlchemyError:
+            logger.warning("Replica unreachable", replica=self._name(replica))
+            replica.healthy = False
+            replica.checked_at = time.monotonic()
+            return False
+
+        replica.healthy = float(lag or 0) <= self.max_lag
+        replica.checked_at = time.monotonic()
+        if not replica.healthy:
+            logger.warning(
+                "Replica lagging", replica=self._name(replica), lag=lag
+            )
+        return replica.healthy
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _start_checking(self) -> None:
+        # Threads do not survive a fork (e.g. into Celery or gunicorn
+        # workers), so each process starts its own on first use.
+        pid = os.getpid()
+        if not self.check_interval or self._checker_pid == pid:
+            return
+        with self._lock:
+            if self._checker_pid == pid:
+                return
+            self._checker_pid = pid
+            threading.Thread(
+                target=self._check_periodically,
+                name="replica-health-check",
+                daemon=True,
+            ).start()
+
+    def _check_periodically(self) -> None:
+        while not self._stopped.is_set():
+            for replica in self.replicas:
+                try:
+                    self.check(replica)
+                except Exception:
+                    logger.exception(
+                        "Replica health check failed",
+                        replica=self._name(replica),
+                    )
+            self._stopped.wait(self.check_interval)
+
+    def _listen_for_errors(self, replica: Replica) -> None:
+        @event.listens_for(replica.engine, "handle_error")
+        def _handle_error(context: ExceptionContext) -> Any:
+            # Errors raised while connecting carry no connection.
+            if context.is_disconnect or context.connection is None:
+                replica.healthy = False
+                replica.checked_at = time.monotonic()
+
+    @staticmethod
+    def _name(replica: Replica) -> str:
+        return replica.engine.url.render_as_string(hide_password=True)
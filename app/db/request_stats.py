@@ -0,0 +1,68 @@
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RequestDBStats:
+    """Database bookkeeping for a single request, see `logging_middleware`."""
+
+    round_trips_saved: int = 0
+    commits_skipped: int = 0
+    statements: int = 0
+    db_time: float = 0
+    rows: int = 0
+    checkout_wait: float = 0
+    slowest_statement: str | None = None
+    slowest_statement_time: float = 0
+    # Executions per statement fingerprint, to spot N+1 query patterns.
+    statement_counts: Counter[str] = field(default_factory=Counter)
+
+    def observe_statement(
+        self, statement: str, duration: float, rows: int
+    ) -> None:
+        self.statements += 1
+        self.db_time += duration
+        self.rows += rows
+        self.statement_counts[statement] += 1
+        if duration > self.slowest_statement_time:
+            self.slowest_statement = statement
+            self.slowest_statement_time = duration
+
+    def repeated_statements(self, threshold: int) -> dict[str, int]:
+        """Statements that ran more than `threshold` times."""
+        return {
+            statement: count
+            for statement, count in self.statement_counts.items()
+            if count > threshold
+        }
+
+    def as_log_dict(self) -> dict:
+        return {
+            "round_trips_saved": self.round_trips_saved,
+            "commits_skipped": self.commits_skipped,
+            "statements": self.statements,
+            "db_time": self.db_time,
+            "rows": self.rows,
+            "checkout_wait": self.checkout_wait,
+            "slowest_statement": self.slowest_statement,
+            "slowest_statement_time": self.slowest_statement_time,
+        }
+
+
+# NOTE: the middleware binds a mutable instance before calling the app, so
+#       dependencies and engine events running in the threadpool (which see
+#       a copy of the context) update the same object.
+_request_db_stats: ContextVar[RequestDBStats | None] = ContextVar(
+    "request_db_stats", default=None
+)
+
+
+def start_request_db_stats() -> RequestDBStats:
+    stats = RequestDBStats()
+    _request_db_stats.set(stats)
+    return stats
+
+
+def get_request_db_stats() -> RequestDBStats | None:
+    return _request_db_stats.get()
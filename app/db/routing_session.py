@@ -0,0 +1,50 @@
+from typing import Any
+
+from sqlalchemy import Connection, Select
+from sqlalchemy.orm import Session
+
+from app.db.replicas import ReplicaSet
+
+_PINNED_TO_PRIMARY = "pinned_to_primary"
+
+
+class RoutingSession(Session):
+    """
+    Session sending plain SELECTs to a read replica while it has not
+    written anything. Flushes, DML, locking reads, statements that are not
+    known to be SELECTs, and everything that follows them in the same
+    session go to the primary, so a session always reads its own writes.
+
+    Pass `replicas=None` to keep a session on the primary, e.g. to read
+    rows another session has just committed.
+    """
+
+    def __init__(self, replicas: ReplicaSet | None = None, **kw: Any):
+        super().__init__(**kw)
+        self.replicas = replicas
+
+    def get_bind(
+        self, mapper: Any = None, clause: Any = None, **kw: Any
+    ) -> Any:
+        primary = super().get_bind(mapper=mapper, clause=clause, **kw)
+        # Sessions bound to an explicit connection (e.g. tests) never route.
+        if not self.replicas or isinstance(primary, Connection):
+            return primary
+        if self.info.get(_PINNED_TO_PRIMARY):
+            return primary
+        if (
+            self._flushing
+            or not isinstance(clause, Select)
+            or clause._for_update_arg is not None
+        ):
+            self.info[_PINNED_TO_PRIMARY] = True
+            return primary
+
+        replica = self.replicas.choose()
+        if replica is None:
+            return primary
+        autocommit = (
+            primary.get_execution_options().get("isolation_level")
+            == "AUTOCOMMIT"
+        )
+        return replica.autocommit_engine if autocommit else replica.engine
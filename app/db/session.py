@@ -1,8 +1,87 @@
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
+from app.db.deadlines import apply_deadline
+from app.db.engine_options import (
+    get_engine_options,
+    get_statement_timeout,
+    uses_transaction_pooler,
+)
+from app.db.identity_cache import track_identity_cache
+from app.db.pool_metrics import ping_idle_connections, register_engine
+from app.db.replicas import ReplicaSet
+from app.db.routing_session import RoutingSession
+from app.db.sql_comments import add_sql_comments
+from app.db.statement_stats import track_statement_stats
+from app.db.write_tracking import forbid_writes, track_writes
 
 settings = get_settings()
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _configure_engine(name: str, engine: Engine) -> Engine:
+    register_engine(name, engine)
+    track_statement_stats(engine)
+    if settings.DB_SQL_COMMENTS:
+        add_sql_comments(engine, settings.DB_SQL_COMMENT_REQUEST_ID)
+    if settings.DB_POOL_PRE_PING == "idle" and not uses_transaction_pooler():
+        ping_idle_connections(engine, settings.DB_POOL_PRE_PING_IDLE_SECONDS)
+    return engine
+
+
+engine = _configure_engine(
+    "primary",
+    create_engine(settings.SQLALCHEMY_DATABASE_URI, **get_engine_options()),
+)
+replicas = ReplicaSet(
+    [
+        _configure_engine(
+            f"replica-{index}",
+            create_engine(
+                uri,
+                **get_engine_options(
+                    connect_timeout=settings.DB_REPLICA_CONNECT_TIMEOUT_SECONDS
+                ),
+            ),
+        )
+        for index, uri in enumerate(settings.SQLALCHEMY_REPLICA_URIS)
+    ],
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS,
+)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replicas=replicas,
+)
+track_writes(SessionLocal)
+track_identity_cache(SessionLocal)
+apply_deadline(SessionLocal, get_statement_timeout())
+
+# NOTE: read only sessions run in autocommit mode, so reads skip the
+#       BEGIN and COMMIT/ROLLBACK round trips of a transaction.
+ReadOnlySessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+    replicas=replicas,
+)
+track_writes(ReadOnlySessionLocal)
+track_identity_cache(ReadOnlySessionLocal)
+apply_deadline(ReadOnlySessionLocal, get_statement_timeout())
+forbid_writes(ReadOnlySessionLocal)
+
+async_engine = create_async_engine(
+    settings.SQLALCHEMY_ASYNC_DATABASE_URI,
+    **get_engine_options(is_async=True),
+)
+_configure_engine("primary-async", async_engine.sync_engine)
+# NOTE: attributes are not expired on commit, as reloading them lazily
+#       would require implicit IO, which AsyncSession does not allow.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
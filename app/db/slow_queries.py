@@ -0,0 +1,171 @@
+import sys
+import threading
+from dataclasses import dataclass
+from types import CodeType, FrameType
+from typing import Any
+
+import structlog
+from asgi_correlation_id.context import correlation_id
+
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = structlog.get_logger("db.slow_query")
+
+# Fingerprints beyond this are evicted by lowest total time, so a flood of
+# distinct ad hoc statements cannot grow the table without bound.
+_MAX_FINGERPRINTS = 1000
+
+
+@dataclass
+class FingerprintStats:
+    calls: int = 0
+    total_time: float = 0
+    max_time: float = 0
+    slow_calls: int = 0
+    caller: str | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.calls if self.calls else 0,
+            "max_time": self.max_time,
+            "slow_calls": self.slow_calls,
+            "caller": self.caller,
+        }
+
+
+class QueryStatsTable:
+    """In-process totals per statement fingerprint."""
+
+    def __init__(self, max_fingerprints: int = _MAX_FINGERPRINTS):
+        self.max_fingerprints = max_fingerprints
+        self._stats: dict[str, FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self, fingerprint: str, duration: float, caller: str | None = None
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get(fingerprint)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    self._evict()
+                stats = self._stats[fingerprint] = FingerprintStats()
+            stats.calls += 1
+            stats.total_time += duration
+            stats.max_time = max(stats.max_time, duration)
+            if caller is not None:
+                stats.slow_calls += 1
+                stats.caller = caller
+
+    def top(self, limit: int) -> list[dict]:
+        with self._lock:
+            ranked = sorted(
+                self._stats.items(),
+                key=lambda item: item[1].total_time,
+                reverse=True,
+            )[:limit]
+            return [
+                {"fingerprint": fingerprint, **stats.as_dict()}
+                for fingerprint, stats in ranked
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def _evict(self) -> None:
+        fingerprint = min(
+            self._stats, key=lambda key: self._stats[key].total_time
+        )
+        del self._stats[fingerprint]
+
+
+query_stats_table = QueryStatsTable()
+
+# Per code object, so walking the stack for each statement costs a dict
+# lookup per frame.
+_repository_code: dict[CodeType, bool] = {}
+_method_names: dict[tuple[CodeType, type | None], str] = {}
+
+
+def _is_repository_code(frame: FrameType) -> bool:
+    is_repository = _repository_code.get(frame.f_code)
+    if is_repository is None:
+        module = frame.f_globals.get("__name__", "")
+        is_repository = _repository_code[frame.f_code] = (
+            ".repositories." in module
+        )
+    return is_repository
+
+
+def _get_method_name(frame: FrameType) -> str:
+    code = frame.f_code
+    owner = None
+    if code.co_argcount and code.co_varnames[0] == "self":
+        instance = frame.f_locals.get("self")
+        owner = None if instance is None else type(instance)
+    name = _method_names.get((code, owner))
+    if name is None:
+        if owner is None:
+            module = frame.f_globals.get("__name__", "")
+            name = f"{module}:{code.co_qualname}"
+        else:
+            name = f"{owner.__module__}:{owner.__qualname__}.{code.co_name}"
+        _method_names[(code, owner)] = name
+    return name
+
+
+def get_caller() -> str | None:
+    """
+    The repository method the application called, if any: the outermost
+    of the innermost run of repository frames, e.g.
+    `UsersRepository.get_by_email` rather than the `get_one_by` it is
+    built on. Inherited methods are named after the class of `self`.
+    """
+    caller = None
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        if _is_repository_code(frame):
+            caller = frame
+        elif caller is not None:
+            break
+        frame = frame.f_back
+    return None if caller is None else _get_method_name(caller)
+
+
+def get_parameter_shapes(parameters: Any) -> Any:
+    """Types of the bound parameters, never their values."""
+    if isinstance(parameters, dict):
+        return {
+            name: type(value).__name__ for name, value in parameters.items()
+        }
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany: the shape of the first row and the row count.
+            return {
+                "rows": len(parameters),
+                "row": get_parameter_shapes(parameters[0]),
+            }
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def observe_query(fingerprint: str, duration: float, parameters: Any) -> None:
+    threshold = settings.DB_SLOW_QUERY_THRESHOLD_SECONDS
+    if not threshold or duration < threshold:
+        query_stats_table.observe(fingerprint, duration)
+        return
+
+    caller = get_caller()
+    query_stats_table.observe(fingerprint, duration, caller or "unknown")
+    logger.warning(
+        "Slow query",
+        fingerprint=fingerprint,
+        duration=duration,
+        parameters=get_parameter_shapes(parameters),
+        caller=caller,
+        request_id=correlation_id.get(),
+    )
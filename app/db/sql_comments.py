@@ -0,0 +1,87 @@
+from contextvars import ContextVar
+from typing import Any
+from urllib.parse import quote
+
+from asgi_correlation_id.context import correlation_id
+from sqlalchemy import Engine, event
+
+from app.db.slow_queries import get_caller
+
+_request_scope: ContextVar[dict | None] = ContextVar(
+    "sql_comment_request_scope", default=None
+)
+_task_name: ContextVar[str | None] = ContextVar(
+    "sql_comment_task_name", default=None
+)
+
+
+def bind_request_scope(scope: dict) -> None:
+    """
+    Bind the ASGI scope of the current request. The route is only known
+    once the router matched it, which updates this same scope in place.
+    """
+    _request_scope.set(scope)
+
+
+def bind_task_name(name: str | None) -> None:
+    _task_name.set(name)
+
+
+def get_sql_comment_tags(include_request_id: bool) -> dict[str, str]:
+    tags = {}
+    scope = _request_scope.get()
+    route = scope.get("route") if scope else None
+    if route is not None and getattr(route, "path", None):
+        tags["route"] = route.path
+    task_name = _task_name.get()
+    if task_name:
+        tags["task"] = task_name
+    caller = get_caller()
+    if caller:
+        tags["repo"] = caller.rpartition(":")[2]
+    request_id = correlation_id.get() if include_request_id else None
+    if request_id:
+        tags["request_id"] = request_id
+    return tags
+
+
+def format_sql_comment(tags: dict[str, str], escape_percent: bool) -> str:
+    """
+    sqlcommenter formatted comment: URL encoded `key='value'` pairs sorted
+    by key, so the same tags always render the same text.
+    """
+    if not tags:
+        return ""
+    comment = ",".join(
+        f"{quote(key, safe='')}='{quote(value, safe='/{}')}'"
+        for key, value in sorted(tags.items())
+    )
+    if escape_percent:
+        # `%` introduces a placeholder with pyformat drivers.
+        comment = comment.replace("%", "%%")
+    return f"/*{comment}*/"
+
+
+def add_sql_comments(engine: Engine, include_request_id: bool) -> None:
+    """
+    Append route, Celery task, repository method and request id tags to
+    every statement of `engine`, so Postgres logs and `pg_stat_statements`
+    can be joined with the application logs. `pg_stat_statements` ignores
+    comments when grouping statements.
+    """
+    escape_percent = engine.dialect.paramstyle in ("format", "pyformat")
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def _before_cursor_execute(
+        connection: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        *_: Any,
+    ) -> tuple[str, Any]:
+        comment = format_sql_comment(
+            get_sql_comment_tags(include_request_id), escape_percent
+        )
+        if comment:
+            statement = f"{statement} {comment}"
+        return statement, parameters
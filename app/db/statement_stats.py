@@ -0,0 +1,68 @@
+import re
+import time
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from app.db.request_stats import get_request_db_stats
+from app.db.slow_queries import observe_query
+
+_QUERY_START = "query_start"
+
+# e.g. the sqlcommenter tags of `add_sql_comments`.
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+# asyncpg's `$1` placeholders are not literals.
+_NUMBER_LITERAL = re.compile(r"(?<!\$)\b\d+(?:\.\d+)?\b")
+# Expanded `IN` lists, VALUES rows and multi-row inserts vary in length.
+_PLACEHOLDER_LIST = re.compile(
+    r"\(\s*(?:%\(\w+\)s|\$\d+|\?)(?:\s*,\s*(?:%\(\w+\)s|\$\d+|\?))*\s*\)"
+)
+_PLACEHOLDER_ROWS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a statement to its shape: comments are dropped, literals
+    become `?` and lists of placeholders collapse to `(...)`, so
+    statements that differ only in their values share a fingerprint.
+    """
+    statement = _BLOCK_COMMENT.sub("", statement)
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(...)", statement)
+    return _PLACEHOLDER_ROWS.sub("(...)", statement)
+
+
+def track_statement_stats(engine: Engine) -> None:
+    """
+    Account every statement of `engine` to the current request and to the
+    slow query table.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        connection: Any, cursor: Any, statement: str, *_: Any
+    ) -> None:
+        # A connection runs one statement at a time.
+        connection.info[_QUERY_START] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        connection: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        *_: Any,
+    ) -> None:
+        duration = time.perf_counter() - connection.info[_QUERY_START]
+        shape = fingerprint(statement)
+        observe_query(shape, duration, parameters)
+        stats = get_request_db_stats()
+        if stats is None:
+            return
+        # Server-side cursors report -1 until the rows are fetched.
+        rows = cursor.rowcount if cursor.description is not None else 0
+        stats.observe_statement(shape, duration, max(rows, 0))
@@ -0,0 +1,81 @@
+from typing import Any
+
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+from app.common.exceptions.read_only_session_exception import (
+    ReadOnlySessionException,
+)
+
+_HAS_WRITES = "has_writes"
+_HAS_CONNECTION = "has_connection"
+_AUTOCOMMIT_CONNECTIONS = "autocommit_connections"
+
+
+def has_writes(session: Session) -> bool:
+    """
+    Whether committing `session` would change anything: something was
+    flushed or executed as DML, or there are pending changes left for the
+    commit to flush.
+    """
+    return bool(
+        session.info.get(_HAS_WRITES)
+        or session.new
+        or session.dirty
+        or session.deleted
+    )
+
+
+def has_connection(session: Session) -> bool:
+    """Whether `session` checked out a connection at all."""
+    return bool(session.info.get(_HAS_CONNECTION))
+
+
+def autocommit_connections(session: Session) -> int:
+    """
+    Connections `session` used in autocommit mode, each of which skipped
+    the BEGIN and COMMIT/ROLLBACK round trips of a transaction.
+    """
+    return session.info.get(_AUTOCOMMIT_CONNECTIONS, 0)
+
+
+def track_writes(session_factory: sessionmaker) -> None:
+    @event.listens_for(session_factory, "after_begin")
+    def _after_begin(
+        session: Session, transaction: Any, connection: Connection
+    ) -> None:
+        session.info[_HAS_CONNECTION] = True
+        isolation_level = connection.get_execution_options().get(
+            "isolation_level"
+        )
+        if isolation_level == "AUTOCOMMIT":
+            session.info[_AUTOCOMMIT_CONNECTIONS] = (
+                autocommit_connections(session) + 1
+            )
+
+    @event.listens_for(session_factory, "after_flush")
+    def _after_flush(session: Session, *_: Any) -> None:
+        session.info[_HAS_WRITES] = True
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+        # Anything that is not known to be a SELECT (e.g. `text()`) is
+        # conservatively treated as a write.
+        if not orm_execute_state.is_select:
+            orm_execute_state.session.info[_HAS_WRITES] = True
+
+    @event.listens_for(session_factory, "after_commit")
+    @event.listens_for(session_factory, "after_rollback")
+    def _after_transaction(session: Session) -> None:
+        session.info.pop(_HAS_WRITES, None)
+
+
+def forbid_writes(session_factory: sessionmaker) -> None:
+    @event.listens_for(session_factory, "before_flush")
+    def _before_flush(session: Session, *_: Any) -> None:
+        raise ReadOnlySessionException()
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+        if orm_execute_state.statement.is_dml:
+            raise ReadOnlySessionException()
@@ -1,5 +1,6 @@
 import time
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 from urllib.parse import urlparse
 
 from asgi_correlation_id import CorrelationIdMiddleware
@@ -9,8 +10,11 @@ from fastapi import FastAPI, Request, Response, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
 from starlette.middleware.cors import CORSMiddleware
 import structlog
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 from uvicorn.protocols.utils import get_path_with_query_string
 
 
@@ -24,15 +28,36 @@ celery_settings = get_celery_settings()
 
 # region Logging
 from app.custom_logging import setup_logging
+from app.db.request_stats import start_request_db_stats
+from app.db.sql_comments import bind_request_scope
+from app.common.exceptions import (
+    DeadlineExceededException,
+    InvalidPaginationException,
+)
+from app.auth.exceptions.password_hasher_busy_exception import (
+    PasswordHasherBusyException,
+)
+from app.auth.utils.password_hasher import password_hasher
+from app.common.utils.deadline import start_deadline
+from app.common.api.limiter import flush_limiter, limiter
 
 setup_logging(json_logs=settings.LOG_JSON_FORMAT, log_level=settings.LOG_LEVEL)
 access_logger = structlog.stdlib.get_logger("api.access")
 
 
 # region Instances
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Rate limit hits pre-aggregated in process would be lost otherwise.
+    flush_limiter()
+    password_hasher.shutdown()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 celery = Celery(
@@ -74,6 +99,9 @@ async def logging_middleware(request: Request, call_next: Any) -> Response:
     structlog.contextvars.clear_contextvars()
     request_id = correlation_id.get()
     structlog.contextvars.bind_contextvars(request_id=request_id)
+    db_stats = start_request_db_stats()
+    bind_request_scope(request.scope)
+    start_deadline(settings.REQUEST_DEADLINE_SECONDS)
 
     start_time = time.perf_counter()
     response = Response(status_code=500)
@@ -112,8 +140,21 @@ async def logging_middleware(request: Request, call_next: Any) -> Response:
             },
             network={"client": {"ip": client_host, "port": client_port}},
             duration=process_time,
+            db=db_stats.as_log_dict(),
         )
+        if settings.DB_N_PLUS_ONE_THRESHOLD:
+            repeated = db_stats.repeated_statements(
+                settings.DB_N_PLUS_ONE_THRESHOLD
+            )
+            for statement, count in repeated.items():
+                access_logger.warning(
+                    "Possible N+1 query",
+                    statement=statement,
+                    count=count,
+                    url=url,
+                )
         response.headers["X-Process-Time"] = str(process_time / 10**9)
+        response.headers["X-DB-Time"] = str(db_stats.db_time)
         return response
 
 
@@ -121,6 +162,10 @@ app.add_middleware(CorrelationIdMiddleware)
 
 
 # region Exceptions
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
@@ -141,6 +186,63 @@ async def validation_exception_handler(
     )
 
 
+@app.exception_handler(DeadlineExceededException)
+async def deadline_exceeded_exception_handler(
+    request: Request, exc: DeadlineExceededException
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": exc.message},
+    )
+
+
+@app.exception_handler(InvalidPaginationException)
+async def invalid_pagination_exception_handler(
+    request: Request, exc: InvalidPaginationException
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": exc.message},
+    )
+
+
+@app.exception_handler(PasswordHasherBusyException)
+async def password_hasher_busy_exception_handler(
+    request: Request, exc: PasswordHasherBusyException
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": exc.message},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(DBAPIError)
+async def database_exception_handler(
+    request: Request, exc: DBAPIError
+) -> JSONResponse:
+    # 57014: query_canceled, raised when statement_timeout fires.
+    sqlstate = getattr(exc.orig, "pgcode", None) or getattr(
+        exc.orig, "sqlstate", None
+    )
+    if sqlstate != "57014":
+        raise exc
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": "Database statement timed out."},
+    )
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_exception_handler(
+    request: Request, exc: PoolTimeoutError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "No database connection available."},
+    )
+
+
 # region Routers
 # NOTE: its important to import routers last as this action
 #       triggers import of the use case layer all the way down
@@ -149,11 +251,15 @@ from app.users.api.routers import api_router as users_router
 from app.two_factor_authentication.api.router import (
     api_router as two_factor_authentication_router,
 )
-from app.auth.api.routers import api_router as auth_router
+from app.auth.api.routers import (
+    api_router as auth_router,
+    well_known_router,
+)
 from app.common.api.routers import api_router as common_router
 
 app.include_router(users_router, prefix=settings.API_V1_STR)
 app.include_router(auth_router, prefix=settings.API_V1_STR)
+app.include_router(well_known_router)
 app.include_router(common_router, prefix=settings.API_V1_STR)
 app.include_router(
     two_factor_authentication_router, prefix=settings.API_V1_STR
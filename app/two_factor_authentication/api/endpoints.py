@@ -1,6 +1,5 @@
 from uuid import UUID
 from fastapi import APIRouter, HTTPException, status
-from slowapi import Limiter
 
 from app.common.api.dependencies.get_session import SessionDependency
 from app.common.exceptions.model_not_created_exception import (
@@ -11,8 +10,6 @@ from app.common.exceptions.model_not_found_exception import (
 )
 from app.core.config import get_settings
 
-from slowapi.util import get_remote_address
-
 from app.two_factor_authentication.schemas.user_2fa_schema import (
     User2FAResponse,
     VerifyUser2FAData,
@@ -29,8 +26,6 @@ from app.two_factor_authentication.use_cases.verify_user_2fa_use_case import (
 router = APIRouter()
 settings = get_settings()
 
-limiter = Limiter(key_func=get_remote_address)
-
 
 @router.post("", status_code=status.HTTP_200_OK)
 def create_new_user_2fa(
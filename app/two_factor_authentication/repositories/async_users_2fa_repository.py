@@ -0,0 +1,36 @@
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.repositories.async_base_repository import AsyncBaseRepository
+from app.two_factor_authentication.models.user_2fa import Users2FA
+from app.two_factor_authentication.schemas.user_2fa_schema import (
+    User2FACreate,
+    User2FAUpdate,
+)
+
+
+class AsyncUsers2FARepository(
+    AsyncBaseRepository[Users2FA, User2FACreate, User2FAUpdate]
+):
+    async def get_by_user_id(
+        self, session: AsyncSession, user_id: UUID
+    ) -> Users2FA | None:
+        return await session.scalar(
+            select(self.model).where(Users2FA.user_id == user_id)
+        )
+
+    async def toggle_active(
+        self, session: AsyncSession, user_2fa_id: UUID, active: bool
+    ) -> None:
+        stmt = (
+            update(Users2FA)
+            .where(Users2FA.id == user_2fa_id)
+            .values(active=active)
+        )
+        await session.execute(stmt)
+        await session.flush()
+
+
+async_users_2fa_repository = AsyncUsers2FARepository(Users2FA)
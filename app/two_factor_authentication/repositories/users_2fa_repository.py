@@ -1,5 +1,6 @@
 from uuid import UUID
-from sqlalchemy import update
+from pydantic import BaseModel
+from sqlalchemy import Select, update
 from sqlalchemy.orm import Session
 
 
@@ -17,11 +18,12 @@ class Users2FARepository(
     def get_by_user_id(
         self, session: Session, user_id: UUID
     ) -> Users2FA | None:
-        return (
-            session.query(self.model)
-            .filter(Users2FA.user_id == user_id)
-            .first()
-        )
+        return self.get_one_by(session, "user_id", user_id)
+
+    def select_by_user_id(
+        self, user_id: UUID, schema: type[BaseModel]
+    ) -> Select:
+        return self.select_one_as(schema, Users2FA.user_id == user_id)
 
     def toggle_active(
         self, session: Session, user_2fa_id: UUID, active: bool
@@ -2,6 +2,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.db.pipeline import fetch_first_pipelined
 from app.two_factor_authentication.repositories.users_2fa_repository import (
     users_2fa_repository,
 )
@@ -12,6 +13,9 @@ from app.two_factor_authentication.schemas.user_2fa_schema import (
     User2FACreate,
     User2FAInDB,
 )
+from app.users.models.user import User
+from app.users.repositories.users_repository import users_repository
+from app.users.schemas.user_schema import UserInDB
 
 
 class Users2FAService:
@@ -29,6 +33,22 @@ class Users2FAService:
             return None
         return User2FAInDB.model_validate(user_2fa)
 
+    def get_with_user(
+        self, user_id: UUID
+    ) -> tuple[UserInDB | None, User2FAInDB | None]:
+        """The user and its 2FA settings, fetched in one round trip."""
+        user, user_2fa = fetch_first_pipelined(
+            self.session,
+            [
+                users_repository.select_one_as(UserInDB, User.id == user_id),
+                self.repository.select_by_user_id(user_id, User2FAInDB),
+            ],
+        )
+        return (
+            UserInDB.model_validate(user) if user else None,
+            User2FAInDB.model_validate(user_2fa) if user_2fa else None,
+        )
+
     def create_user_2fa(self, user_2fa: User2FACreate) -> User2FAInDB:
         created_user_2fa = self.repository.create(self.session, user_2fa)
         return User2FAInDB.model_validate(created_user_2fa)
@@ -10,7 +10,6 @@ from app.two_factor_authentication.schemas.user_2fa_schema import (
 from app.two_factor_authentication.services.users_2fa_service import (
     Users2FAService,
 )
-from app.users.services.users_service import UsersService
 
 settings = get_settings()
 
@@ -18,16 +17,13 @@ settings = get_settings()
 class VerifyUser2FAUseCase:
     def __init__(self, session: Session):
         self.session = session
-        self.users_service = UsersService(self.session)
         self.users_2fa_service = Users2FAService(self.session)
 
     def execute(self, data: VerifyUser2FAData) -> bool:
-        user = self.users_service.get_by_id(data.user_id)
+        user, user_2fa = self.users_2fa_service.get_with_user(data.user_id)
         if not user:
             raise ModelNotFoundException("User not found")
 
-        user_2fa = self.users_2fa_service.get_by_user_id(user.id)
-
         if not user_2fa:
             raise ModelNotFoundException("User 2FA not found")
 
@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from fastapi import Depends, HTTPException
+from starlette import status
+
+from app.core.config import get_settings
+from app.users.api.dependencies.get_current_user import ReadOnlyCurrentUser
+from app.users.schemas.user_schema import UserInDB
+
+settings = get_settings()
+
+
+def get_admin_user(user: ReadOnlyCurrentUser) -> UserInDB:
+    """The current user, if listed in ADMIN_EMAILS."""
+    admin_emails = {email.lower() for email in settings.ADMIN_EMAILS}
+    if user.email.lower() not in admin_emails:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+    return user
+
+
+AdminUser = Annotated[UserInDB, Depends(get_admin_user)]
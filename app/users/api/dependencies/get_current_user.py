@@ -3,33 +3,108 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 
 from app.auth.enums.claims_enum import ClaimsEnum
 from app.auth.schemas.token_schema import TokenPayload
-from app.common.api.dependencies.get_session import SessionDependency
+from app.common.api.dependencies.get_async_session import (
+    AsyncSessionDependency,
+)
+from app.common.api.dependencies.get_session import (
+    ReadOnlySessionDependency,
+    SessionDependency,
+)
 from app.auth.api.dependencies.get_token import TokenDep
 
 from app.auth.utils.security import validate_token
 from app.auth.exceptions.invalid_credentials_exception import (
     InvalidCredentialsException,
 )
-from app.users.schemas.user_schema import UserInDB
+from app.core.config import get_settings
+from app.users.schemas.user_schema import UserInDB, UserTokenState
+from app.users.services.async_users_service import AsyncUsersService
 from app.users.services.users_service import UsersService
+from app.users.utils.current_user_cache import current_user_cache
 
+settings = get_settings()
 
-def get_current_user(session: SessionDependency, token: TokenDep) -> UserInDB:
+
+def _get_token_data(token: str) -> TokenPayload:
     try:
-        token_data = cast(
-            TokenPayload, validate_token(token, ClaimsEnum.USER_ID)
-        )
+        return cast(TokenPayload, validate_token(token, ClaimsEnum.USER_ID))
     except InvalidCredentialsException as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message
         )
-    provider = UsersService(session).get_by_id(UUID(token_data.user_id))
-    if not provider:
+
+
+def _get_stateless_user(token_data: TokenPayload) -> UserInDB | None:
+    """The user claimed by the token, when tokens are trusted as is."""
+    if not settings.CURRENT_USER_STATELESS or token_data.email is None:
+        return None
+    return UserInDB(id=UUID(token_data.user_id), email=token_data.email)
+
+
+def _check_token_version(
+    user: UserTokenState | None, token_data: TokenPayload
+) -> UserInDB:
+    if not user:
         raise HTTPException(status_code=404, detail="Provider not found")
-    return provider
+    if token_data.ver < user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=InvalidCredentialsException().message,
+        )
+    # NOTE: the token version is internal, endpoints get a plain `UserInDB`.
+    #       The cached state is already validated, so it is not re-checked.
+    return UserInDB.model_construct(
+        **user.model_dump(exclude={"token_version"})
+    )
+
+
+def get_current_user(session: SessionDependency, token: TokenDep) -> UserInDB:
+    """
+    Served from the current user cache when possible, so a hit costs no
+    database round trip (the session never checks out a connection).
+    """
+    token_data = _get_token_data(token)
+    stateless_user = _get_stateless_user(token_data)
+    if stateless_user:
+        return stateless_user
+
+    user_id = UUID(token_data.user_id)
+    user = current_user_cache.get(user_id)
+    if user is None:
+        user = UsersService(session).get_token_state(user_id)
+        if user:
+            current_user_cache.set(user_id, user)
+    return _check_token_version(user, token_data)
+
+
+def get_current_user_read_only(
+    session: ReadOnlySessionDependency, token: TokenDep
+) -> UserInDB:
+    return get_current_user(session, token)
+
+
+async def get_current_user_async(
+    session: AsyncSessionDependency, token: TokenDep
+) -> UserInDB:
+    # NOTE: the revocation check may query the database synchronously.
+    token_data = await run_in_threadpool(_get_token_data, token)
+    stateless_user = _get_stateless_user(token_data)
+    if stateless_user:
+        return stateless_user
+
+    user_id = UUID(token_data.user_id)
+    user = current_user_cache.get(user_id)
+    if user is None:
+        user = await AsyncUsersService(session).get_token_state(user_id)
+        if user:
+            current_user_cache.set(user_id, user)
+    return _check_token_version(user, token_data)
 
 
 CurrentUser = Annotated[UserInDB, Depends(get_current_user)]
+ReadOnlyCurrentUser = Annotated[UserInDB, Depends(get_current_user_read_only)]
+AsyncCurrentUser = Annotated[UserInDB, Depends(get_current_user_async)]
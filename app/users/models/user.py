@@ -12,3 +12,5 @@ class User(Base):
         String(USER_EMAIL_MAX_LENGTH), unique=True
     )
     hashed_password: Mapped[str]
+    # Bumped whenever previously issued access tokens must stop working.
+    token_version: Mapped[int] = mapped_column(default=0, server_default="0")
@@ -0,0 +1,35 @@
+from typing import Any, Type, overload
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.repositories.async_base_repository import AsyncBaseRepository
+from app.common.repositories.projection import SchemaType
+from app.users.models.user import User
+from app.users.schemas.user_schema import UserCreate, UserUpdate
+
+
+class AsyncUsersRepository(AsyncBaseRepository[User, UserCreate, UserUpdate]):
+    @overload
+    async def get_by_email(
+        self, db: AsyncSession, email: str
+    ) -> User | None: ...
+
+    @overload
+    async def get_by_email(
+        self, db: AsyncSession, email: str, *, schema: Type[SchemaType]
+    ) -> SchemaType | None: ...
+
+    async def get_by_email(
+        self,
+        db: AsyncSession,
+        email: str,
+        *,
+        schema: Type[SchemaType] | None = None,
+    ) -> Any:
+        if schema is not None:
+            return await self.get_one_as(db, schema, User.email == email)
+        return await db.scalar(select(self.model).where(User.email == email))
+
+
+async_users_repository = AsyncUsersRepository(User)
@@ -1,14 +1,112 @@
+from typing import Any, List, Mapping, Sequence, Type, overload
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, update
 from sqlalchemy.orm import Session
 
 
-from app.common.repositories.base_repository import BaseRepository
+from app.common.repositories.base_repository import (
+    BULK_CHUNK_SIZE,
+    BaseRepository,
+)
+from app.common.repositories.projection import SchemaType
 from app.users.models.user import User
 from app.users.schemas.user_schema import UserCreate, UserUpdate
+from app.users.utils.current_user_cache import invalidate_current_users
 
 
 class UsersRepository(BaseRepository[User, UserCreate, UserUpdate]):
-    def get_by_email(self, db: Session, email: str) -> User | None:
-        return db.query(self.model).filter(User.email == email).first()
+    """
+    Bulk statements bypass the ORM flush events, so they drop the
+    changed users from the current user cache themselves.
+    """
+
+    @overload
+    def get_by_email(self, db: Session, email: str) -> User | None: ...
+
+    @overload
+    def get_by_email(
+        self, db: Session, email: str, *, schema: Type[SchemaType]
+    ) -> SchemaType | None: ...
+
+    def get_by_email(
+        self,
+        db: Session,
+        email: str,
+        *,
+        schema: Type[SchemaType] | None = None,
+    ) -> Any:
+        if schema is not None:
+            return self.get_one_by(db, "email", email, schema=schema)
+        return self.get_one_by(db, "email", email)
+
+    def update_by_email(
+        self, db: Session, email: str, obj_in: UserUpdate
+    ) -> User | None:
+        updated = self.update_where(db, obj_in, User.email == email)
+        return updated[0] if updated else None
+
+    def reset_password(
+        self, db: Session, email: str, hashed_password: str
+    ) -> User | None:
+        """
+        Set the new password hash and bump `token_version`, revoking the
+        access tokens issued before.
+        """
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(
+                hashed_password=hashed_password,
+                token_version=User.token_version + 1,
+            )
+            .returning(User)
+        )
+        user = db.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one_or_none()
+        if user is not None:
+            invalidate_current_users(db, [user.id])
+        return user
+
+    def upsert_many(
+        self,
+        db: Session,
+        objs_in: Sequence[UserCreate],
+        index_elements: Sequence[str] = ("id",),
+        update_fields: Sequence[str] | None = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> List[User]:
+        upserted = super().upsert_many(
+            db, objs_in, index_elements, update_fields, chunk_size
+        )
+        invalidate_current_users(db, [user.id for user in upserted])
+        return upserted
+
+    def update_many(
+        self,
+        db: Session,
+        objs_in: Mapping[UUID, UserUpdate],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> int:
+        updated = super().update_many(db, objs_in, chunk_size)
+        invalidate_current_users(db, objs_in)
+        return updated
+
+    def update_where(
+        self,
+        db: Session,
+        obj_in: UserUpdate,
+        *whereclause: ColumnElement[bool],
+    ) -> List[User]:
+        updated = super().update_where(db, obj_in, *whereclause)
+        invalidate_current_users(db, [user.id for user in updated])
+        return updated
+
+    def delete_by_id(self, db: Session, model_id: UUID) -> User | None:
+        deleted = super().delete_by_id(db, model_id)
+        invalidate_current_users(db, [model_id])
+        return deleted
 
 
 users_repository = UsersRepository(User)
@@ -26,6 +26,10 @@ class UserInDB(UserBase):
     id: UUID
 
 
+class UserTokenState(UserInDB):
+    token_version: int
+
+
 class UserResponse(UserInDB):
     pass
 
@@ -37,4 +41,6 @@ class CreateUserRequest(UserBase):
 class UserAuth(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     id: UUID
+    email: str
     hashed_password: str
+    token_version: int
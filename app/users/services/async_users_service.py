@@ -0,0 +1,47 @@
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.schemas.pagination_schema import ListFilter, ListResponse
+from app.users.repositories.async_users_repository import (
+    AsyncUsersRepository,
+    async_users_repository,
+)
+
+from app.users.schemas.user_schema import (
+    UserCreate,
+    UserInDB,
+    UserTokenState,
+)
+
+
+class AsyncUsersService:
+    def __init__(
+        self,
+        session: AsyncSession,
+        repository: AsyncUsersRepository = async_users_repository,
+    ):
+        self.session = session
+        self.repository = repository
+
+    async def get_by_email(self, email: str) -> UserInDB | None:
+        return await self.repository.get_by_email(
+            self.session, email.lower(), schema=UserInDB
+        )
+
+    async def get_by_id(self, user_id: UUID) -> UserInDB | None:
+        return await self.repository.get(
+            self.session, user_id, schema=UserInDB
+        )
+
+    async def get_token_state(self, user_id: UUID) -> UserTokenState | None:
+        return await self.repository.get(
+            self.session, user_id, schema=UserTokenState
+        )
+
+    async def create_user(self, user: UserCreate) -> UserInDB:
+        created_user = await self.repository.create(self.session, user)
+        return UserInDB.model_validate(created_user)
+
+    async def list(self, list_options: ListFilter) -> ListResponse:
+        return await self.repository.list(self.session, list_options)
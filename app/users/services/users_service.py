@@ -1,14 +1,22 @@
+from collections.abc import Iterator
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.common.repositories.base_repository import STREAM_CHUNK_SIZE
+from app.common.repositories.projection import select_schema
 from app.common.schemas.pagination_schema import ListFilter, ListResponse
+from app.users.models.user import User
 from app.users.repositories.users_repository import (
     UsersRepository,
     users_repository,
 )
 
-from app.users.schemas.user_schema import UserCreate, UserInDB
+from app.users.schemas.user_schema import (
+    UserCreate,
+    UserInDB,
+    UserTokenState,
+)
 
 
 class UsersService:
@@ -21,16 +29,17 @@ class UsersService:
         self.repository = repository
 
     def get_by_email(self, email: str) -> UserInDB | None:
-        user = self.repository.get_by_email(self.session, email.lower())
-        if not user:
-            return None
-        return UserInDB.model_validate(user)
+        return self.repository.get_by_email(
+            self.session, email.lower(), schema=UserInDB
+        )
 
     def get_by_id(self, user_id: UUID) -> UserInDB | None:
-        user = self.repository.get(self.session, user_id)
-        if not user:
-            return None
-        return UserInDB.model_validate(user)
+        return self.repository.get(self.session, user_id, schema=UserInDB)
+
+    def get_token_state(self, user_id: UUID) -> UserTokenState | None:
+        return self.repository.get(
+            self.session, user_id, schema=UserTokenState
+        )
 
     def create_user(self, user: UserCreate) -> UserInDB:
         created_user = self.repository.create(self.session, user)
@@ -38,3 +47,15 @@ class UsersService:
 
     def list(self, list_options: ListFilter) -> ListResponse:
         return self.repository.list(self.session, list_options)
+
+    def stream_all(
+        self, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[UserInDB]:
+        """Every user, read through a server-side cursor."""
+        for row in self.repository.stream(
+            self.session,
+            select_schema(User, UserInDB),
+            mappings=True,
+            chunk_size=chunk_size,
+        ):
+            yield UserInDB.model_validate(dict(row))
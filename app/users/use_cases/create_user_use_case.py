@@ -1,8 +1,9 @@
 from fastapi.exceptions import HTTPException
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from fastapi import status
 
-from app.auth.utils import security
+from app.auth.utils.password_hasher import hash_password
 from app.users.schemas.user_schema import (
     CreateUserRequest,
     UserCreate,
@@ -15,25 +16,32 @@ class CreateUserUseCase:
     def __init__(self, session: Session):
         self.session = session
 
-    def execute(self, create_user_request: CreateUserRequest) -> UserResponse:
-        from app.celery.tasks.emails import send_welcome_email
-
+    async def execute(
+        self, create_user_request: CreateUserRequest
+    ) -> UserResponse:
         users_service = UsersService(self.session)
-        if users_service.get_by_email(create_user_request.email):
+        if await run_in_threadpool(
+            users_service.get_by_email, create_user_request.email
+        ):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="User with that email already registered.",
             )
 
-        created_user = users_service.create_user(
+        hashed_password = await hash_password(create_user_request.password)
+        return await run_in_threadpool(
+            self._create_user,
             UserCreate(
                 email=create_user_request.email.lower(),
-                hashed_password=security.get_password_hash(
-                    create_user_request.password
-                ),
-            )
+                hashed_password=hashed_password,
+            ),
         )
 
+    def _create_user(self, user: UserCreate) -> UserResponse:
+        from app.celery.tasks.emails import send_welcome_email
+
+        created_user = UsersService(self.session).create_user(user)
+
         send_welcome_email.delay(created_user.id)  # type: ignore
 
         return UserResponse(
@@ -0,0 +1,48 @@
+from typing import Any, Iterable
+from uuid import UUID
+
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import Mapper, Session, object_session
+
+from app.common.utils.ttl_cache import TTLCache
+from app.core.config import get_settings
+from app.users.models.user import User
+from app.users.schemas.user_schema import UserTokenState
+
+settings = get_settings()
+
+_PENDING_KEY = "invalidated_user_ids"
+
+current_user_cache: TTLCache[UUID, UserTokenState] = TTLCache(
+    max_size=settings.CURRENT_USER_CACHE_MAX_SIZE,
+    ttl=settings.CURRENT_USER_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_current_users(
+    session: Session | None, user_ids: Iterable[UUID]
+) -> None:
+    """
+    Drop cached users right away and again once the transaction ends, so
+    an entry cached in between from a not yet committed (or rolled back)
+    row does not outlive it.
+    """
+    for user_id in user_ids:
+        current_user_cache.delete(user_id)
+        if session is not None:
+            session.info.setdefault(_PENDING_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_pending(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        current_user_cache.delete(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_flushed(
+    mapper: Mapper, connection: Connection, target: Any
+) -> None:
+    invalidate_current_users(object_session(target), [target.id])
@@ -0,0 +1,59 @@
+"""
+Per-request cost of the authentication dependencies: `validate_token`
+alone, and `get_current_user` as a whole, with the decoded-token cache
+disabled against enabled. The current user cache is warm in both cases,
+so no database is needed:
+
+    python -m benchmarks.auth_dependencies --iterations 20000
+"""
+
+import argparse
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from app.auth.enums.claims_enum import ClaimsEnum
+from app.auth.schemas.token_schema import TokenPayload
+from app.auth.utils.security import (
+    create_access_token,
+    token_cache,
+    validate_token,
+)
+from app.users.api.dependencies.get_current_user import get_current_user
+from app.users.schemas.user_schema import UserTokenState
+from app.users.utils.current_user_cache import current_user_cache
+from benchmarks.utils import summarize, time_calls
+
+
+def main(iterations: int) -> None:
+    user = UserTokenState(
+        id=uuid4(), email="benchmark@example.com", token_version=0
+    )
+    current_user_cache.set(user.id, user)
+    token = create_access_token(
+        TokenPayload(user_id=str(user.id), email=user.email, ver=0)
+    )
+    # Never used, the current user comes from its cache.
+    session = Session()
+
+    ttl = token_cache.ttl
+    for label, cache_ttl in (("uncached", 0.0), ("cached", ttl)):
+        token_cache.clear()
+        token_cache.ttl = cache_ttl
+        for name, call in (
+            (
+                "validate_token",
+                lambda: validate_token(token, ClaimsEnum.USER_ID),
+            ),
+            ("get_current_user", lambda: get_current_user(session, token)),
+        ):
+            time_calls(call, 1000)
+            print(summarize(f"{name} {label}", time_calls(call, iterations)))
+    token_cache.ttl = ttl
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10000)
+    args = parser.parse_args()
+    main(args.iterations)
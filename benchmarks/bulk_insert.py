@@ -0,0 +1,70 @@
+"""
+Compare inserting users one `BaseRepository.create` call at a time
+against `BaseRepository.create_many`.
+
+Everything runs inside a transaction that is rolled back at the end.
+Requires a reachable database configured through the usual environment:
+
+    python -m benchmarks.bulk_insert --rows 100000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.users.repositories.users_repository import users_repository
+from app.users.schemas.user_schema import UserCreate
+
+
+def make_users(rows: int) -> list[UserCreate]:
+    prefix = uuid4().hex[:8]
+    return [
+        UserCreate(
+            email=f"benchmark-{prefix}-{index}@example.com",
+            hashed_password="x",
+        )
+        for index in range(rows)
+    ]
+
+
+def create_loop(session: Session, users: list[UserCreate]) -> None:
+    for user in users:
+        users_repository.create(session, user)
+
+
+def create_many(session: Session, users: list[UserCreate]) -> None:
+    users_repository.create_many(session, users)
+
+
+def measure(
+    label: str,
+    insert: Callable[[Session, list[UserCreate]], None],
+    rows: int,
+) -> None:
+    users = make_users(rows)
+    session = SessionLocal(replicas=None)
+    try:
+        start = time.perf_counter()
+        insert(session, users)
+        session.flush()
+        elapsed = time.perf_counter() - start
+    finally:
+        session.rollback()
+        session.close()
+    print(f"{label:<12} {elapsed:8.2f}s {rows / elapsed:12.1f} rows/s")
+
+
+def main(rows: int) -> None:
+    measure("create", create_loop, rows)
+    measure("create_many", create_many, rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.rows)
@@ -0,0 +1,95 @@
+"""
+Compare psycopg2 against psycopg 3 (server-side prepared statements) on
+the hot primary key read, and sequential against pipelined reads of two
+independent statements.
+
+Requires a reachable database configured through the usual environment:
+
+    python -m benchmarks.postgres_drivers --iterations 5000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import get_settings
+from app.db.pipeline import fetch_first_pipelined
+from app.two_factor_authentication.repositories.users_2fa_repository import (
+    users_2fa_repository,
+)
+from app.two_factor_authentication.schemas.user_2fa_schema import User2FAInDB
+from app.users.models.user import User
+from app.users.repositories.users_repository import users_repository
+from app.users.schemas.user_schema import UserInDB
+from benchmarks.utils import benchmark_user, summarize, time_calls
+
+settings = get_settings()
+
+
+def make_engine(driver: str) -> Engine:
+    url = make_url(settings.SQLALCHEMY_DATABASE_URI).set(
+        drivername=f"postgresql+{driver}"
+    )
+    connect_args = (
+        {"prepare_threshold": settings.DB_PREPARE_THRESHOLD}
+        if driver == "psycopg"
+        else {}
+    )
+    return create_engine(url, pool_size=1, connect_args=connect_args)
+
+
+def measure(label: str, call: Callable[[], object], iterations: int) -> None:
+    # Warm up the connection and, for psycopg 3, the prepared statements.
+    time_calls(call, 100)
+    cpu_start = time.process_time()
+    timings = time_calls(call, iterations)
+    cpu = (time.process_time() - cpu_start) / iterations
+    print(f"{summarize(label, timings)} cpu={cpu * 1e6:8.1f}us")
+
+
+def run_driver(driver: str, user: UserInDB, iterations: int) -> None:
+    engine = make_engine(driver)
+    session: Session = sessionmaker(bind=engine)()
+    statements = [
+        users_repository.select_one_as(UserInDB, User.id == user.id),
+        users_2fa_repository.select_by_user_id(user.id, User2FAInDB),
+    ]
+
+    def get_user() -> object:
+        # Bypass the identity cache, every call hits the database.
+        return users_repository.get_one_as(
+            session, UserInDB, User.id == user.id
+        )
+
+    def sequential() -> object:
+        return [
+            session.execute(statement).mappings().first()
+            for statement in statements
+        ]
+
+    def pipelined() -> object:
+        return fetch_first_pipelined(session, statements)
+
+    try:
+        measure(f"{driver} get", get_user, iterations)
+        measure(f"{driver} 2 reads sequential", sequential, iterations)
+        measure(f"{driver} 2 reads pipelined", pipelined, iterations)
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def main(iterations: int) -> None:
+    with benchmark_user() as user:
+        for driver in ("psycopg2", "psycopg"):
+            run_driver(driver, user, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,86 @@
+"""
+Per-call Python overhead of the hot repository reads: legacy
+`session.query(...).filter(...).first()` chains against the prebuilt
+`select()` statements the repositories use.
+
+Runs against an in-memory SQLite database, so the timings are dominated
+by statement construction, caching and result processing rather than by
+the database itself:
+
+    python -m benchmarks.repository_statements --iterations 20000
+"""
+
+import argparse
+from collections.abc import Callable
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.common.models.base_class import Base
+from app.two_factor_authentication.models.user_2fa import Users2FA
+from app.two_factor_authentication.repositories.users_2fa_repository import (
+    users_2fa_repository,
+)
+from app.users.models.user import User
+from app.users.repositories.users_repository import users_repository
+from app.users.schemas.user_schema import UserInDB
+from benchmarks.utils import summarize, time_calls
+
+
+def make_session() -> tuple[Session, User]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[User.__table__, Users2FA.__table__]
+    )
+    session = Session(engine)
+    user = User(email="benchmark@example.com", hashed_password="x")
+    session.add(user)
+    session.flush()
+    session.add(Users2FA(user_id=user.id, secret_key="x", active=False))
+    session.commit()
+    return session, user
+
+
+def main(iterations: int) -> None:
+    session, user = make_session()
+    email, user_id = user.email, user.id
+
+    def expunged(call: Callable[[], object]) -> Callable[[], object]:
+        # Load rows every time instead of hitting the identity map.
+        def wrapper() -> object:
+            result = call()
+            session.expunge_all()
+            return result
+
+        return wrapper
+
+    calls: dict[str, Callable[[], object]] = {
+        "legacy get_by_email": lambda: (
+            session.query(User).filter(User.email == email).first()
+        ),
+        "get_by_email": lambda: users_repository.get_by_email(session, email),
+        "legacy get_by_email schema": lambda: UserInDB.model_validate(
+            session.query(User).filter(User.email == email).first()
+        ),
+        "get_by_email schema": lambda: users_repository.get_by_email(
+            session, email, schema=UserInDB
+        ),
+        "legacy get_by_user_id": lambda: (
+            session.query(Users2FA).filter(Users2FA.user_id == user_id).first()
+        ),
+        "get_by_user_id": lambda: users_2fa_repository.get_by_user_id(
+            session, user_id
+        ),
+    }
+    for label, call in calls.items():
+        call = expunged(call)
+        time_calls(call, 1000)
+        print(summarize(label, time_calls(call, iterations)))
+    session.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,81 @@
+"""
+Compare the throughput of `/users/current` backed by the sync `Session`
+(threadpool) against the `AsyncSession` stack. The current user cache is
+disabled during the run, so every request queries the database.
+
+Requires a reachable database configured through the usual environment:
+
+    python -m benchmarks.users_current_throughput --requests 5000 \\
+        --concurrency 200
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.auth.schemas.token_schema import TokenPayload
+from app.auth.utils.security import create_access_token
+from app.db.session import async_engine
+from app.users.api.dependencies.get_current_user import (
+    AsyncCurrentUser,
+    CurrentUser,
+)
+from app.users.schemas.user_schema import UserResponse
+from app.users.utils.current_user_cache import current_user_cache
+from benchmarks.utils import benchmark_user
+
+bench_app = FastAPI()
+
+
+@bench_app.get("/sync")
+def sync_current_user(current_user: CurrentUser) -> UserResponse:
+    return UserResponse.model_validate(current_user)
+
+
+@bench_app.get("/async")
+async def async_current_user(current_user: AsyncCurrentUser) -> UserResponse:
+    return UserResponse.model_validate(current_user)
+
+
+async def run(path: str, token: str, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    async with AsyncClient(
+        transport=ASGITransport(app=bench_app),
+        base_url="http://benchmark",
+        cookies={"access_token": token},
+    ) as client:
+
+        async def call() -> None:
+            async with semaphore:
+                response = await client.get(path)
+                response.raise_for_status()
+
+        # Warm up pools and caches before measuring.
+        await asyncio.gather(*(call() for _ in range(concurrency)))
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(requests)))
+        return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    ttl = current_user_cache.ttl
+    current_user_cache.ttl = 0
+    current_user_cache.clear()
+    with benchmark_user() as user:
+        token = create_access_token(TokenPayload(user_id=str(user.id)))
+        for path in ("/sync", "/async"):
+            throughput = await run(path, token, requests, concurrency)
+            print(f"{path:<8} {throughput:10.1f} req/s")
+    current_user_cache.ttl = ttl
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
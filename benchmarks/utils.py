@@ -0,0 +1,57 @@
+import statistics
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from uuid import uuid4
+
+from app.auth.utils import security
+from app.db.session import SessionLocal
+from app.users.models.user import User
+from app.users.schemas.user_schema import UserCreate, UserInDB
+from app.users.services.users_service import UsersService
+
+
+@contextmanager
+def benchmark_user() -> Generator[UserInDB, None, None]:
+    """Commit a throwaway user for the benchmark and remove it afterwards."""
+    session = SessionLocal()
+    try:
+        user = UsersService(session).create_user(
+            UserCreate(
+                email=f"benchmark-{uuid4().hex[:12]}@example.com",
+                hashed_password=security.get_password_hash("password"),
+            )
+        )
+        session.commit()
+    except BaseException:
+        session.close()
+        raise
+    try:
+        yield user
+    finally:
+        # Only this run's user, others may be benchmarking concurrently.
+        session.query(User).filter(User.id == user.id).delete(
+            synchronize_session=False
+        )
+        session.commit()
+        session.close()
+
+
+def time_calls(function: Callable[[], object], iterations: int) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(label: str, timings: list[float]) -> str:
+    timings = sorted(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return (
+        f"{label:<28} n={len(timings):<7} "
+        f"mean={statistics.fmean(timings) * 1e6:9.1f}us "
+        f"p50={statistics.median(timings) * 1e6:9.1f}us "
+        f"p99={p99 * 1e6:9.1f}us"
+    )
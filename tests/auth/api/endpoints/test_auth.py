@@ -2,9 +2,19 @@ from sqlalchemy.orm import Session
 
 from fastapi.testclient import TestClient
 
+from app.auth.utils.password_hashing import (
+    get_bcrypt_rounds,
+    hash_password_bcrypt,
+)
+from app.core.config import get_settings
+from app.users.models.user import User
 from tests.utils.create_user import create_user
 
+settings = get_settings()
+
 login_path = "api/v1/auth/login"
+logout_path = "api/v1/auth/logout"
+current_user_path = "api/v1/users/current"
 
 
 class TestLogin:
@@ -50,3 +60,53 @@ class TestLogin:
         )
 
         assert response.status_code == 401
+
+    def test_login_rehashes_outdated_password_hash(
+        self, client: TestClient, session: Session
+    ):
+        created_user = create_user(session)
+        user = session.get(User, created_user.id)
+        user.hashed_password = hash_password_bcrypt(
+            "password", settings.BCRYPT_ROUNDS + 1
+        )
+        session.commit()
+
+        response = client.post(
+            login_path,
+            json={
+                "email": created_user.email,
+                "password": "password",
+            },
+        )
+
+        assert response.status_code == 204
+        session.refresh(user)
+        assert get_bcrypt_rounds(user.hashed_password) == (
+            settings.BCRYPT_ROUNDS
+        )
+
+
+class TestLogout:
+    def test_logout_revokes_access_token(
+        self, client: TestClient, session: Session
+    ):
+        created_user = create_user(session)
+        client.post(
+            login_path,
+            json={"email": created_user.email, "password": "password"},
+        )
+        access_token = client.cookies["access_token"]
+        assert client.get(current_user_path).status_code == 200
+
+        response = client.post(logout_path)
+
+        assert response.status_code == 200
+        assert "access_token" not in client.cookies
+        # A copy of the cookie taken before logging out no longer works.
+        client.cookies.set("access_token", access_token)
+        assert client.get(current_user_path).status_code == 401
+
+    def test_logout_without_token(self, client: TestClient):
+        response = client.post(logout_path)
+
+        assert response.status_code == 200
@@ -0,0 +1,15 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+jwks_path = "/.well-known/jwks.json"
+
+
+class TestJWKS:
+    def test_get_jwks(self) -> None:
+        with TestClient(app) as client:
+            response = client.get(jwks_path)
+
+        assert response.status_code == 200
+        assert "keys" in response.json()
+        assert response.headers["Cache-Control"].startswith("public")
@@ -0,0 +1,36 @@
+from typing import Generator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.auth.models.revoked_token import RevokedToken
+from app.auth.services import auth_service
+from app.auth.utils import security
+from app.auth.utils.token_denylist import TokenDenylist
+from app.common.models.base_class import Base
+
+
+@pytest.fixture()
+def sqlite_session_factory() -> Generator:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[RevokedToken.__table__])
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture()
+def token_denylist(
+    monkeypatch: pytest.MonkeyPatch, sqlite_session_factory: sessionmaker
+) -> TokenDenylist:
+    """A denylist over sqlite, used by `validate_token` and `AuthService`."""
+    token_denylist = TokenDenylist(
+        capacity=1000,
+        error_rate=0.001,
+        refresh_interval=60,
+        rebuild_interval=3600,
+        session_factory=sqlite_session_factory,
+    )
+    monkeypatch.setattr(security, "token_denylist", token_denylist)
+    monkeypatch.setattr(auth_service, "token_denylist", token_denylist)
+    return token_denylist
@@ -0,0 +1,206 @@
+import hmac
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import jwt
+import pytest
+import pytz
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jwt.utils import base64url_encode
+
+from app.auth.enums.claims_enum import ClaimsEnum
+from app.auth.exceptions.invalid_credentials_exception import (
+    InvalidCredentialsException,
+)
+from app.auth.schemas.token_schema import TokenPayload
+from app.auth.utils import security
+from app.auth.utils.jwt_keys import KeyRing
+from app.auth.utils.token_denylist import TokenDenylist
+from app.core.config import JWTKeySettings, get_settings
+
+settings = get_settings()
+now = datetime.now(pytz.utc)
+
+
+def write_key(
+    directory: Path, kid: str, algorithm: str, public_only: bool = False
+) -> str:
+    private_key = (
+        ed25519.Ed25519PrivateKey.generate()
+        if algorithm == "EdDSA"
+        else rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    )
+    if public_only:
+        pem = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    else:
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    pem_file = directory / f"{kid}.pem"
+    pem_file.write_bytes(pem)
+    return str(pem_file)
+
+
+@pytest.fixture()
+def keyring(tmp_path: Path) -> KeyRing:
+    return KeyRing.from_settings(
+        [
+            JWTKeySettings(
+                kid="retired",
+                algorithm="RS256",
+                pem_file=write_key(tmp_path, "retired", "RS256", True),
+                expires_at=now - timedelta(days=1),
+            ),
+            JWTKeySettings(
+                kid="previous",
+                algorithm="RS256",
+                pem_file=write_key(tmp_path, "previous", "RS256"),
+                active_from=now - timedelta(days=30),
+            ),
+            JWTKeySettings(
+                kid="current",
+                pem_file=write_key(tmp_path, "current", "EdDSA"),
+                active_from=now - timedelta(days=1),
+            ),
+            JWTKeySettings(
+                kid="next",
+                pem_file=write_key(tmp_path, "next", "EdDSA"),
+                active_from=now + timedelta(days=1),
+            ),
+        ]
+    )
+
+
+@pytest.fixture()
+def signing_keyring(
+    keyring: KeyRing,
+    monkeypatch: pytest.MonkeyPatch,
+    token_denylist: TokenDenylist,
+) -> KeyRing:
+    monkeypatch.setattr(security, "keyring", keyring)
+    security.token_cache.clear()
+    return keyring
+
+
+class TestKeyRing:
+    def test_signs_with_latest_active_key(self, keyring: KeyRing) -> None:
+        assert keyring.get_signing_key(now).kid == "current"
+        assert keyring.get_signing_key(now + timedelta(days=2)).kid == "next"
+
+    def test_publishes_keys_until_they_expire(self, keyring: KeyRing) -> None:
+        jwks = keyring.get_jwks(now)
+
+        assert [key["kid"] for key in jwks["keys"]] == [
+            "previous",
+            "current",
+            "next",
+        ]
+        assert all("d" not in key for key in jwks["keys"])
+        assert keyring.get_jwks(now) is jwks
+        assert keyring.get_verification_key("retired", now) is None
+
+
+class TestAsymmetricTokens:
+    def test_verifiable_from_jwks(self, signing_keyring: KeyRing) -> None:
+        token = security.create_access_token(TokenPayload(user_id="user"))
+
+        header = jwt.get_unverified_header(token)
+        key = jwt.PyJWKSet.from_dict(signing_keyring.get_jwks())[header["kid"]]
+        payload = jwt.decode(token, key, algorithms=[header["alg"]])
+
+        assert header["kid"] == "current"
+        assert payload["user_id"] == "user"
+        token_data = security.validate_token(token, ClaimsEnum.USER_ID)
+        assert token_data == TokenPayload(**payload)
+
+    def test_rejects_unknown_key(self, signing_keyring: KeyRing) -> None:
+        token = jwt.encode(
+            {"user_id": "user"},
+            ed25519.Ed25519PrivateKey.generate(),
+            algorithm="EdDSA",
+            headers={"kid": "unknown"},
+        )
+
+        with pytest.raises(InvalidCredentialsException):
+            security.validate_token(token, ClaimsEnum.USER_ID)
+
+    def test_rejects_algorithm_confusion(
+        self, signing_keyring: KeyRing
+    ) -> None:
+        # HMAC signed with the public key of an asymmetric one.
+        public_pem = signing_keyring.keys["previous"].public_key.public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        signing_input = b".".join(
+            base64url_encode(json.dumps(part).encode())
+            for part in (
+                {"alg": "HS256", "kid": "previous"},
+                {"user_id": "user"},
+            )
+        )
+        signature = hmac.new(public_pem, signing_input, "sha256").digest()
+        token = b".".join((signing_input, base64url_encode(signature)))
+
+        with pytest.raises(InvalidCredentialsException):
+            security.validate_token(token.decode(), ClaimsEnum.USER_ID)
+
+    def test_secret_key_tokens_still_accepted(
+        self, signing_keyring: KeyRing
+    ) -> None:
+        token = jwt.encode(
+            {"user_id": "user"},
+            settings.SECRET_KEY,
+            algorithm=settings.ALGORITHM,
+        )
+
+        assert security.validate_token(token, ClaimsEnum.USER_ID) == (
+            TokenPayload(user_id="user")
+        )
+
+    def test_cached_token_rejected_once_its_key_expires(
+        self, signing_keyring: KeyRing, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        token = security.create_access_token(TokenPayload(user_id="user"))
+        security.validate_token(token, ClaimsEnum.USER_ID)
+        assert len(security.token_cache) == 1
+
+        key = signing_keyring.keys["current"]
+        monkeypatch.setitem(
+            signing_keyring.keys,
+            "current",
+            replace(key, expires_at=datetime.now(pytz.utc)),
+        )
+
+        with pytest.raises(InvalidCredentialsException):
+            security.validate_token(token, ClaimsEnum.USER_ID)
+        assert len(security.token_cache) == 0
+
+    def test_cached_secret_key_token_rejected_once_disabled(
+        self, signing_keyring: KeyRing, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        token = jwt.encode(
+            {"user_id": "user"},
+            settings.SECRET_KEY,
+            algorithm=settings.ALGORITHM,
+        )
+        security.validate_token(token, ClaimsEnum.USER_ID)
+
+        monkeypatch.setattr(
+            security,
+            "settings",
+            settings.model_copy(
+                update={"JWT_ACCEPT_SECRET_KEY_TOKENS": False}
+            ),
+        )
+
+        with pytest.raises(InvalidCredentialsException):
+            security.validate_token(token, ClaimsEnum.USER_ID)
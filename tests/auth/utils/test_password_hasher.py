@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+import pytest
+
+from app.auth.exceptions.password_hasher_busy_exception import (
+    PasswordHasherBusyException,
+)
+from app.auth.utils.password_hasher import PasswordHasher
+from app.auth.utils.security import get_password_hash, verify_password
+
+
+class TestPasswordHasher:
+    def test_hashes_compatible_with_security_helpers(self) -> None:
+        hasher = PasswordHasher(workers=0, max_queue=1)
+
+        hashed = asyncio.run(hasher.hash_password("secret"))
+
+        assert verify_password("secret", hashed)
+        assert asyncio.run(
+            hasher.verify_password("secret", get_password_hash("secret"))
+        )
+        assert not asyncio.run(hasher.verify_password("other", hashed))
+
+    def test_runs_in_process_pool(self) -> None:
+        hasher = PasswordHasher(workers=1, max_queue=0)
+        try:
+            hashed = asyncio.run(hasher.hash_password("secret"))
+        finally:
+            hasher.shutdown()
+
+        assert verify_password("secret", hashed)
+        assert hasher.metrics.submitted == 1
+        assert hasher.metrics.in_flight == 0
+
+    def test_shutdown_stops_process_pool(self) -> None:
+        hasher = PasswordHasher(workers=1, max_queue=0)
+        executor = hasher.get_executor()
+        asyncio.run(hasher.hash_password("secret"))
+
+        hasher.shutdown()
+
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+        # A later call starts a new pool.
+        try:
+            assert hasher.get_executor() is not executor
+        finally:
+            hasher.shutdown()
+
+    def test_cancelled_call_holds_slot_until_done(self) -> None:
+        hasher = PasswordHasher(workers=1, max_queue=0)
+        # Start the worker process before timing anything.
+        asyncio.run(hasher.hash_password("secret"))
+
+        async def cancel_running_job() -> None:
+            task = asyncio.create_task(hasher._run(time.sleep, 2))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            assert hasher.metrics.in_flight == 1
+            with pytest.raises(PasswordHasherBusyException):
+                await hasher.hash_password("secret")
+
+        try:
+            asyncio.run(cancel_running_job())
+        finally:
+            hasher.shutdown()
+
+        assert hasher.metrics.in_flight == 0
+
+    def test_rejects_when_queue_is_full(self) -> None:
+        hasher = PasswordHasher(workers=0, max_queue=1)
+
+        async def hash_concurrently() -> list:
+            return await asyncio.gather(
+                hasher.hash_password("first"),
+                hasher.hash_password("second"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(hash_concurrently())
+
+        assert isinstance(results[0], str)
+        assert isinstance(results[1], PasswordHasherBusyException)
+        assert hasher.metrics.as_dict()["rejected"] == 1
+        assert hasher.metrics.as_dict()["submitted"] == 1
+        assert sum(hasher.metrics.wait_buckets) == 1
+
+    def test_busy_exception_message(self) -> None:
+        with pytest.raises(PasswordHasherBusyException) as error:
+            asyncio.run(
+                PasswordHasher(workers=0, max_queue=0).hash_password("secret")
+            )
+
+        assert error.value.message
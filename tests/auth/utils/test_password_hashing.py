@@ -0,0 +1,59 @@
+import sys
+
+import pytest
+
+from app.auth.utils import password_hashing
+from app.auth.utils.password_hashing import (
+    get_bcrypt_rounds,
+    hash_password,
+    hash_password_bcrypt,
+    needs_rehash,
+    verify_password,
+)
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class TestPasswordHashing:
+    def test_hashes_with_configured_rounds(self) -> None:
+        hashed = hash_password("secret")
+
+        assert get_bcrypt_rounds(hashed) == settings.BCRYPT_ROUNDS
+        assert verify_password("secret", hashed)
+        assert not verify_password("other", hashed)
+        assert not needs_rehash(hashed)
+
+    def test_other_rounds_need_rehash(self) -> None:
+        hashed = hash_password_bcrypt("secret", settings.BCRYPT_ROUNDS + 1)
+
+        assert verify_password("secret", hashed)
+        assert needs_rehash(hashed)
+
+    def test_switching_to_argon2(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pytest.importorskip("argon2")
+        bcrypt_hash = hash_password("secret")
+        monkeypatch.setattr(
+            password_hashing,
+            "settings",
+            settings.model_copy(update={"PASSWORD_HASH_ALGORITHM": "argon2"}),
+        )
+
+        argon2_hash = hash_password("secret")
+
+        assert argon2_hash.startswith(password_hashing.ARGON2_PREFIX)
+        assert verify_password("secret", argon2_hash)
+        assert verify_password("secret", bcrypt_hash)
+        assert needs_rehash(bcrypt_hash)
+        assert not needs_rehash(argon2_hash)
+
+    def test_argon2_hash_without_argon2(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setitem(sys.modules, "argon2", None)
+        password_hashing.get_argon2_hasher.cache_clear()
+
+        with pytest.raises(RuntimeError, match="argon2"):
+            verify_password("secret", "$argon2id$v=19$m=65536,t=3,p=4$x$y")
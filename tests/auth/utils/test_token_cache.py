@@ -0,0 +1,81 @@
+import time
+from datetime import timedelta
+from typing import Any, Generator
+
+import jwt
+import pytest
+
+from app.auth.enums.claims_enum import ClaimsEnum
+from app.auth.exceptions.invalid_credentials_exception import (
+    InvalidCredentialsException,
+)
+from app.auth.schemas.token_schema import EmailTokenPayload, TokenPayload
+from app.auth.utils import security
+from app.auth.utils.security import (
+    create_access_token,
+    token_cache,
+    validate_token,
+)
+from app.auth.utils.token_denylist import TokenDenylist
+
+
+@pytest.fixture()
+def decode_calls(
+    monkeypatch: pytest.MonkeyPatch, token_denylist: TokenDenylist
+) -> Generator:
+    calls = []
+    decode = security.decode
+
+    def counting_decode(*args: Any, **kwargs: Any) -> Any:
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    token_cache.clear()
+    monkeypatch.setattr(security, "decode", counting_decode)
+    yield calls
+    token_cache.clear()
+
+
+class TestTokenCache:
+    def test_decodes_each_token_once(self, decode_calls: list) -> None:
+        token = create_access_token(TokenPayload(user_id="user"))
+
+        first = validate_token(token, ClaimsEnum.USER_ID)
+        second = validate_token(token, ClaimsEnum.USER_ID)
+
+        assert first == second
+        assert isinstance(first, TokenPayload) and first.user_id == "user"
+        assert len(decode_calls) == 1
+
+    def test_keyed_by_claim(self, decode_calls: list) -> None:
+        token = create_access_token(
+            EmailTokenPayload(user_email="test@user.com")
+        )
+
+        validate_token(token, ClaimsEnum.USER_EMAIL)
+        with pytest.raises(InvalidCredentialsException):
+            validate_token(token, ClaimsEnum.USER_ID)
+
+        assert len(decode_calls) == 2
+
+    def test_invalid_tokens_are_not_cached(self, decode_calls: list) -> None:
+        token = jwt.encode({"user_id": "user"}, "another secret key")
+
+        for _ in range(2):
+            with pytest.raises(InvalidCredentialsException):
+                validate_token(token, ClaimsEnum.USER_ID)
+
+        assert len(decode_calls) == 2
+        assert len(token_cache) == 0
+
+    def test_not_served_after_expiry(self, decode_calls: list) -> None:
+        token = create_access_token(
+            TokenPayload(user_id="user"), expires_delta=timedelta(seconds=1)
+        )
+        validate_token(token, ClaimsEnum.USER_ID)
+
+        time.sleep(1.1)
+
+        with pytest.raises(InvalidCredentialsException):
+            validate_token(token, ClaimsEnum.USER_ID)
+        assert len(decode_calls) == 2
@@ -0,0 +1,190 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Generator
+
+import pytest
+import pytz
+from sqlalchemy.orm import sessionmaker
+
+from app.auth.enums.claims_enum import ClaimsEnum
+from app.auth.exceptions.invalid_credentials_exception import (
+    InvalidCredentialsException,
+)
+from app.auth.repositories.revoked_tokens_repository import (
+    revoked_tokens_repository,
+)
+from app.auth.schemas.token_schema import TokenPayload
+from app.auth.services.auth_service import AuthService
+from app.auth.utils.security import (
+    create_access_token,
+    token_cache,
+    validate_token,
+)
+from app.auth.utils.token_denylist import TokenDenylist
+
+
+@pytest.fixture()
+def lookups(
+    monkeypatch: pytest.MonkeyPatch, token_denylist: TokenDenylist
+) -> Generator:
+    calls = []
+    is_revoked = revoked_tokens_repository.is_revoked
+
+    def counting_is_revoked(*args: Any, **kwargs: Any) -> bool:
+        calls.append(args[-1])
+        return is_revoked(*args, **kwargs)
+
+    monkeypatch.setattr(
+        token_denylist.repository, "is_revoked", counting_is_revoked
+    )
+    token_cache.clear()
+    yield calls
+    token_cache.clear()
+
+
+def _revoke_elsewhere(
+    session_factory: sessionmaker, jti: str, expires_in: timedelta
+) -> None:
+    """Revoke like another process would, without touching the filter."""
+    with session_factory() as session:
+        revoked_tokens_repository.revoke(
+            session, jti, datetime.now(pytz.utc) + expires_in
+        )
+        session.commit()
+
+
+class TestTokenDenylist:
+    def test_logged_out_token_is_rejected(
+        self,
+        token_denylist: TokenDenylist,
+        sqlite_session_factory: sessionmaker,
+    ) -> None:
+        token = create_access_token(TokenPayload(user_id="user"))
+        token_data = validate_token(token, ClaimsEnum.USER_ID)
+        assert isinstance(token_data, TokenPayload)
+
+        with sqlite_session_factory() as session:
+            AuthService(session).revoke_token(token_data)
+            session.commit()
+
+        # Rejected even though the decoded token is cached.
+        with pytest.raises(InvalidCredentialsException):
+            validate_token(token, ClaimsEnum.USER_ID)
+
+    def test_only_filter_hits_are_looked_up(
+        self, token_denylist: TokenDenylist, lookups: list
+    ) -> None:
+        for index in range(100):
+            token = create_access_token(TokenPayload(user_id=f"user-{index}"))
+            validate_token(token, ClaimsEnum.USER_ID)
+
+        assert lookups == []
+
+    def test_refresh_picks_up_revocations_from_other_processes(
+        self,
+        token_denylist: TokenDenylist,
+        sqlite_session_factory: sessionmaker,
+        lookups: list,
+    ) -> None:
+        token_denylist.refresh()
+        _revoke_elsewhere(sqlite_session_factory, "revoked", timedelta(1))
+
+        assert not token_denylist.is_revoked("revoked")
+
+        token_denylist.refresh(force=True)
+
+        assert token_denylist.is_revoked("revoked")
+        assert token_denylist.is_revoked("revoked")
+        assert lookups == ["revoked"]
+
+    def test_repeated_refreshes_count_rows_once(
+        self,
+        token_denylist: TokenDenylist,
+        sqlite_session_factory: sessionmaker,
+    ) -> None:
+        for index in range(10):
+            _revoke_elsewhere(
+                sqlite_session_factory, f"revoked-{index}", timedelta(1)
+            )
+        token_denylist.refresh()
+        filter_after_load = token_denylist._filter
+
+        for _ in range(5):
+            token_denylist.refresh(force=True)
+
+        # Rows within the refresh overlap were loaded again, but neither
+        # counted twice nor made the filter look full and get rebuilt.
+        assert token_denylist._filter is filter_after_load
+        assert len(token_denylist._filter) == 10
+
+    def test_rebuild_drops_expired_revocations(
+        self,
+        token_denylist: TokenDenylist,
+        sqlite_session_factory: sessionmaker,
+        lookups: list,
+    ) -> None:
+        _revoke_elsewhere(
+            sqlite_session_factory, "expired", timedelta(seconds=1)
+        )
+        token_denylist.refresh()
+        assert token_denylist.is_revoked("expired")
+
+        time.sleep(1.1)
+        token_denylist.rebuild_interval = 0
+        token_denylist.refresh(force=True)
+
+        assert not token_denylist.is_revoked("expired")
+        assert lookups == ["expired"]
+
+    def test_rebuild_keeps_local_revocations(
+        self,
+        token_denylist: TokenDenylist,
+        sqlite_session_factory: sessionmaker,
+    ) -> None:
+        token_denylist.refresh()
+        # Not committed yet (or not replicated) when the rebuild reads.
+        token_denylist.add("local", datetime.now(pytz.utc) + timedelta(1))
+        token_denylist.rebuild_interval = 0
+        token_denylist.refresh(force=True)
+
+        assert "local" in token_denylist._filter
+        assert token_denylist.is_revoked("local")
+
+        _revoke_elsewhere(sqlite_session_factory, "local", timedelta(1))
+        token_denylist.refresh(force=True)
+
+        assert "local" in token_denylist._filter
+        assert token_denylist._local == {}
+
+    def test_add_waits_for_refresh(
+        self, token_denylist: TokenDenylist
+    ) -> None:
+        expires_at = datetime.now(pytz.utc) + timedelta(1)
+        with token_denylist._lock:
+            thread = threading.Thread(
+                target=token_denylist.add, args=("revoked", expires_at)
+            )
+            thread.start()
+            thread.join(0.05)
+
+            assert thread.is_alive()
+            assert "revoked" not in token_denylist._filter
+
+        thread.join()
+        assert "revoked" in token_denylist._filter
+
+    def test_delete_expired(
+        self, sqlite_session_factory: sessionmaker
+    ) -> None:
+        _revoke_elsewhere(sqlite_session_factory, "expired", -timedelta(1))
+        _revoke_elsewhere(sqlite_session_factory, "revoked", timedelta(1))
+
+        with sqlite_session_factory() as session:
+            deleted = revoked_tokens_repository.delete_expired(
+                session, datetime.now(pytz.utc)
+            )
+            session.commit()
+            assert deleted == 1
+            assert revoked_tokens_repository.is_revoked(session, "revoked")
+            assert not revoked_tokens_repository.is_revoked(session, "expired")
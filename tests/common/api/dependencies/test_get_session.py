@@ -0,0 +1,44 @@
+import pytest
+
+from app.common.api.dependencies.get_session import get_read_only_session
+from app.common.exceptions import ReadOnlySessionException
+from app.db.request_stats import start_request_db_stats
+from app.users.models.user import User
+from app.users.services.users_service import UsersService
+
+
+# NOTE: the `client` fixture overrides `get_read_only_session` with the
+#       transactional test session, so these use the real factory.
+class TestGetReadOnlySession:
+    def test_reads_in_autocommit_mode(self) -> None:
+        stats = start_request_db_stats()
+        dependency = get_read_only_session()
+        session = next(dependency)
+
+        UsersService(session).get_by_email("nobody@test.com")
+
+        connection = session.connection()
+        assert (
+            connection.get_execution_options()["isolation_level"]
+            == "AUTOCOMMIT"
+        )
+        dependency.close()
+        assert stats.round_trips_saved == 2
+
+    def test_rejects_writes(self) -> None:
+        dependency = get_read_only_session()
+        session = next(dependency)
+        session.add(User(email="read@only.com", hashed_password="x"))
+
+        with pytest.raises(ReadOnlySessionException):
+            session.flush()
+        dependency.close()
+
+    def test_unused_session_saves_nothing(self) -> None:
+        stats = start_request_db_stats()
+        dependency = get_read_only_session()
+        next(dependency)
+
+        dependency.close()
+
+        assert stats.round_trips_saved == 0
@@ -0,0 +1,58 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.auth.schemas.token_schema import TokenPayload
+from app.auth.utils.security import create_access_token
+from app.users.api.dependencies import get_admin_user
+from tests.utils.create_user import create_user
+
+admin_paths = [
+    "api/v1/admin/db/pool",
+    "api/v1/admin/db/queries",
+    "api/v1/admin/auth/hasher",
+]
+
+
+def _log_in(client: TestClient, session: Session) -> str:
+    user = create_user(session)
+    client.cookies.set(
+        "access_token",
+        create_access_token(TokenPayload(user_id=str(user.id))),
+    )
+    return user.email
+
+
+class TestAdminEndpoints:
+    @pytest.mark.parametrize("path", admin_paths)
+    def test_anonymous_is_unauthorized(
+        self, client: TestClient, path: str
+    ) -> None:
+        assert client.get(path).status_code == 401
+
+    @pytest.mark.parametrize("path", admin_paths)
+    def test_normal_user_is_forbidden(
+        self, client: TestClient, session: Session, path: str
+    ) -> None:
+        _log_in(client, session)
+
+        assert client.get(path).status_code == 403
+
+    @pytest.mark.parametrize("path", admin_paths)
+    def test_admin_is_allowed(
+        self,
+        client: TestClient,
+        session: Session,
+        monkeypatch: pytest.MonkeyPatch,
+        path: str,
+    ) -> None:
+        email = _log_in(client, session)
+        monkeypatch.setattr(
+            get_admin_user,
+            "settings",
+            get_admin_user.settings.model_copy(
+                update={"ADMIN_EMAILS": [email.upper()]}
+            ),
+        )
+
+        assert client.get(path).status_code == 200
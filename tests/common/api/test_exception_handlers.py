@@ -0,0 +1,27 @@
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.common.exceptions import InvalidPaginationException
+from app.main import app
+
+path = "/test/invalid-pagination"
+
+
+@pytest.fixture
+def invalid_pagination_route() -> Generator:
+    def raise_invalid_pagination() -> None:
+        raise InvalidPaginationException()
+
+    app.add_api_route(path, raise_invalid_pagination)
+    yield
+    app.router.routes.pop()
+
+
+@pytest.mark.usefixtures("invalid_pagination_route")
+def test_invalid_pagination_is_bad_request() -> None:
+    response = TestClient(app).get(path)
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid pagination options."}
@@ -0,0 +1,50 @@
+import pytest
+from limits.storage import MemoryStorage, storage_from_string
+
+from app.common.api.limiter import get_storage_options
+from app.common.utils.rate_limit_storage import (
+    BatchedStorage,
+    BoundedMemoryStorage,
+)
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class TestGetStorageOptions:
+    @pytest.mark.parametrize(
+        "storage_uri",
+        ["memory://", "redis://redis:6379", "redis+sentinel://redis:26379"],
+    )
+    def test_none_for_third_party_storages(self, storage_uri: str) -> None:
+        assert get_storage_options(storage_uri) == {}
+
+    def test_batched(self) -> None:
+        storage_uri = "batched+bounded-memory://"
+
+        storage = storage_from_string(
+            storage_uri, **get_storage_options(storage_uri)
+        )
+
+        assert isinstance(storage, BatchedStorage)
+        assert storage.flush_interval == (
+            settings.RATE_LIMIT_FLUSH_INTERVAL_SECONDS
+        )
+        assert storage.max_keys == settings.RATE_LIMIT_MAX_KEYS
+
+    def test_bounded_memory(self) -> None:
+        storage_uri = "bounded-memory://"
+
+        storage = storage_from_string(
+            storage_uri, **get_storage_options(storage_uri)
+        )
+
+        assert isinstance(storage, BoundedMemoryStorage)
+        assert storage.max_keys == settings.RATE_LIMIT_MAX_KEYS
+
+    def test_memory(self) -> None:
+        storage = storage_from_string(
+            "memory://", **get_storage_options("memory://")
+        )
+
+        assert isinstance(storage, MemoryStorage)
@@ -0,0 +1,116 @@
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.repositories.row_counts import count_cache
+from app.common.schemas.pagination_schema import ListFilter
+from app.users.repositories.async_users_repository import (
+    async_users_repository,
+)
+from app.users.schemas.user_schema import UserCreate, UserInDB, UserUpdate
+from tests.utils.async_session import run_in_async_session
+
+
+async def create_users(session: AsyncSession, count: int) -> list[str]:
+    emails = [f"user{index}@async.com" for index in range(count)]
+    for email in emails:
+        await async_users_repository.create(
+            session, UserCreate(email=email, hashed_password="hashed")
+        )
+    return emails
+
+
+class TestAsyncBaseRepository:
+    def test_create_and_get(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            user = await async_users_repository.create(
+                session,
+                UserCreate(email="test@async.com", hashed_password="hashed"),
+            )
+
+            assert await async_users_repository.get(session, user.id) is user
+            assert await async_users_repository.get(
+                session, user.id, schema=UserInDB
+            ) == UserInDB(id=user.id, email="test@async.com")
+            assert await async_users_repository.get(session, uuid4()) is None
+
+        run_in_async_session(test)
+
+    def test_update_and_delete(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            user = await async_users_repository.create(
+                session,
+                UserCreate(email="test@async.com", hashed_password="hashed"),
+            )
+
+            await async_users_repository.update(
+                session, user, UserUpdate(email="updated@async.com")
+            )
+            updated = await async_users_repository.get(
+                session, user.id, schema=UserInDB
+            )
+            deleted = await async_users_repository.delete(session, user.id)
+
+            assert updated is not None
+            assert updated.email == "updated@async.com"
+            assert deleted is user
+            assert await async_users_repository.get(session, user.id) is None
+
+        run_in_async_session(test)
+
+    def test_list_offset_pages(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            count_cache.clear()
+            emails = await create_users(session, 3)
+            list_options = ListFilter(
+                order_by="email", order="asc", page_size=2
+            )
+
+            first_page = await async_users_repository.list(
+                session, list_options
+            )
+            last_page = await async_users_repository.list(
+                session,
+                list_options.model_copy(
+                    update={"page": 2, "total_count": "none"}
+                ),
+            )
+
+            assert [user.email for user in first_page.data] == emails[:2]
+            assert first_page.total == 3
+            assert first_page.has_next
+            assert [user.email for user in last_page.data] == emails[2:]
+            assert last_page.total is None
+            assert not last_page.has_next
+
+        run_in_async_session(test)
+
+    def test_list_cursor_pages(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            emails = await create_users(session, 3)
+            list_options = ListFilter(
+                pagination="cursor",
+                order_by="email",
+                order="desc",
+                page_size=2,
+                total_count="none",
+            )
+
+            first_page = await async_users_repository.list(
+                session, list_options
+            )
+            last_page = await async_users_repository.list(
+                session,
+                list_options.model_copy(
+                    update={"cursor": first_page.next_cursor}
+                ),
+            )
+
+            assert [user.email for user in first_page.data] == [
+                emails[2],
+                emails[1],
+            ]
+            assert [user.email for user in last_page.data] == [emails[0]]
+            assert last_page.next_cursor is None
+
+        run_in_async_session(test)
@@ -0,0 +1,116 @@
+from sqlalchemy.orm import Session
+
+from app.users.models.user import User
+from app.users.repositories.users_repository import users_repository
+from app.users.schemas.user_schema import UserCreate, UserUpdate
+
+
+def make_users(count: int) -> list[UserCreate]:
+    return [
+        UserCreate(email=f"user{index}@bulk.com", hashed_password="x")
+        for index in range(count)
+    ]
+
+
+class TestBulkOperations:
+    def test_create_many_keeps_order(self, session: Session) -> None:
+        users = users_repository.create_many(
+            session, make_users(5), chunk_size=2
+        )
+
+        assert [user.email for user in users] == [
+            f"user{index}@bulk.com" for index in range(5)
+        ]
+        assert session.query(User).count() == 5
+
+    def test_upsert_many_updates_conflicting_rows(
+        self, session: Session
+    ) -> None:
+        users_repository.create_many(session, make_users(2))
+
+        users = users_repository.upsert_many(
+            session,
+            [
+                UserCreate(email="user1@bulk.com", hashed_password="new"),
+                UserCreate(email="user2@bulk.com", hashed_password="new"),
+            ],
+            index_elements=("email",),
+            update_fields=("hashed_password",),
+        )
+
+        assert [user.hashed_password for user in users] == ["new", "new"]
+        assert session.query(User).count() == 3
+
+    def test_upsert_many_without_update_fields_skips_conflicts(
+        self, session: Session
+    ) -> None:
+        users_repository.create_many(session, make_users(2))
+
+        users = users_repository.upsert_many(
+            session,
+            [
+                UserCreate(email="user1@bulk.com", hashed_password="new"),
+                UserCreate(email="user2@bulk.com", hashed_password="new"),
+            ],
+            index_elements=("email",),
+            update_fields=(),
+        )
+
+        assert [user.email for user in users] == ["user2@bulk.com"]
+        existing = users_repository.get_by_email(session, "user1@bulk.com")
+        assert existing is not None
+        assert existing.hashed_password == "x"
+        assert session.query(User).count() == 3
+
+    def test_update_many_by_id(self, session: Session) -> None:
+        first, second, third = users_repository.create_many(
+            session, make_users(3)
+        )
+
+        updated = users_repository.update_many(
+            session,
+            {
+                first.id: UserUpdate(hashed_password="first"),
+                second.id: UserUpdate(
+                    email="second@bulk.com", hashed_password="second"
+                ),
+            },
+        )
+
+        assert updated == 2
+        assert first.hashed_password == "first"
+        assert second.email == "second@bulk.com"
+        assert third.hashed_password == "x"
+
+
+class TestUpdateDeleteById:
+    def test_update_by_id(self, session: Session) -> None:
+        (user,) = users_repository.create_many(session, make_users(1))
+
+        updated = users_repository.update_by_id(
+            session, user.id, UserUpdate(hashed_password="new")
+        )
+
+        assert updated is user
+        assert user.hashed_password == "new"
+        assert user.email == "user0@bulk.com"
+
+    def test_update_by_id_missing_row(self, session: Session) -> None:
+        (user,) = users_repository.create_many(session, make_users(1))
+        users_repository.delete_by_id(session, user.id)
+
+        assert (
+            users_repository.update_by_id(
+                session, user.id, UserUpdate(hashed_password="new")
+            )
+            is None
+        )
+
+    def test_delete_by_id(self, session: Session) -> None:
+        (user,) = users_repository.create_many(session, make_users(1))
+
+        deleted = users_repository.delete_by_id(session, user.id)
+
+        assert deleted is not None
+        assert deleted.id == user.id
+        assert session.query(User).count() == 0
@@ -0,0 +1,83 @@
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from app.users.repositories.users_repository import users_repository
+from app.users.schemas.user_schema import UserCreate, UserInDB, UserUpdate
+from tests.conftest import QueryCounter
+
+
+def create_users(session: Session, count: int) -> list[UserInDB]:
+    users = users_repository.create_many(
+        session,
+        [
+            UserCreate(email=f"user{index}@cache.com", hashed_password="x")
+            for index in range(count)
+        ],
+    )
+    session.expunge_all()
+    return [UserInDB.model_validate(user) for user in users]
+
+
+class TestIdentityCache:
+    def test_repeated_get_hits_database_once(
+        self, session: Session, query_counter: QueryCounter
+    ) -> None:
+        (user,) = create_users(session, 1)
+        query_counter.count = 0
+
+        first = users_repository.get(session, user.id, schema=UserInDB)
+        second = users_repository.get(session, user.id, schema=UserInDB)
+        model = users_repository.get(session, user.id)
+        model_again = users_repository.get(session, user.id)
+
+        assert first == second == user
+        assert model is model_again
+        assert query_counter.count == 2
+
+    def test_write_invalidates_cache(
+        self, session: Session, query_counter: QueryCounter
+    ) -> None:
+        (user,) = create_users(session, 1)
+        users_repository.get(session, user.id, schema=UserInDB)
+
+        users_repository.update_by_id(
+            session, user.id, UserUpdate(email="new@cache.com")
+        )
+        query_counter.count = 0
+        updated = users_repository.get(session, user.id, schema=UserInDB)
+
+        assert updated is not None
+        assert updated.email == "new@cache.com"
+        assert query_counter.count == 1
+
+
+class TestGetMany:
+    def test_chunks_and_keeps_order(
+        self, session: Session, query_counter: QueryCounter
+    ) -> None:
+        users = create_users(session, 5)
+        ids = [user.id for user in reversed(users)] + [uuid4()]
+        query_counter.count = 0
+
+        found = users_repository.get_many(
+            session, ids, schema=UserInDB, chunk_size=2
+        )
+
+        assert found == list(reversed(users))
+        assert query_counter.count == 3
+
+    def test_skips_cached_rows(
+        self, session: Session, query_counter: QueryCounter
+    ) -> None:
+        users = create_users(session, 3)
+        users_repository.get(session, users[0].id, schema=UserInDB)
+        query_counter.count = 0
+
+        found = users_repository.get_many(
+            session, [user.id for user in users], schema=UserInDB
+        )
+        users_repository.get(session, users[2].id, schema=UserInDB)
+
+        assert found == users
+        assert query_counter.count == 1
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app.common.exceptions.invalid_pagination_exception import (
+    InvalidPaginationException,
+)
+from app.common.schemas.pagination_schema import ListFilter
+from app.users.schemas.user_schema import UserCreate
+from app.users.services.users_service import UsersService
+
+
+def create_users(session: Session, count: int) -> list[str]:
+    users_service = UsersService(session)
+    emails = [f"user{index}@keyset.com" for index in range(count)]
+    for email in emails:
+        users_service.create_user(
+            UserCreate(email=email, hashed_password="hashed")
+        )
+    return emails
+
+
+class TestKeysetPagination:
+    def test_walks_forward_and_backwards(self, session: Session) -> None:
+        emails = create_users(session, 5)
+        users_service = UsersService(session)
+        list_options = ListFilter(
+            pagination="cursor", order_by="email", order="asc", page_size=2
+        )
+
+        first_page = users_service.list(list_options)
+        second_page = users_service.list(
+            list_options.model_copy(update={"cursor": first_page.next_cursor})
+        )
+        previous_page = users_service.list(
+            list_options.model_copy(update={"cursor": second_page.prev_cursor})
+        )
+
+        assert [user.email for user in first_page.data] == emails[:2]
+        assert first_page.prev_cursor is None
+        assert [user.email for user in second_page.data] == emails[2:4]
+        assert [user.email for user in previous_page.data] == emails[:2]
+        assert previous_page.prev_cursor is None
+
+    def test_last_page_has_no_next_cursor(self, session: Session) -> None:
+        emails = create_users(session, 3)
+        users_service = UsersService(session)
+        list_options = ListFilter(
+            pagination="cursor", order_by="email", order="desc", page_size=2
+        )
+
+        first_page = users_service.list(list_options)
+        last_page = users_service.list(
+            list_options.model_copy(update={"cursor": first_page.next_cursor})
+        )
+
+        assert [user.email for user in last_page.data] == [emails[0]]
+        assert last_page.next_cursor is None
+        assert last_page.prev_cursor is not None
+
+    def test_invalid_cursor(self, session: Session) -> None:
+        with pytest.raises(InvalidPaginationException):
+            UsersService(session).list(ListFilter(cursor="not-a-cursor"))
@@ -0,0 +1,53 @@
+from sqlalchemy.orm import Session
+
+from app.common.schemas.pagination_schema import ListFilter
+from app.users.schemas.user_schema import UserCreate
+from app.users.services.users_service import UsersService
+
+
+def create_users(session: Session, count: int) -> None:
+    users_service = UsersService(session)
+    for index in range(count):
+        users_service.create_user(
+            UserCreate(email=f"user{index}@count.com", hashed_password="x")
+        )
+
+
+class TestListTotalCount:
+    def test_exact_count(self, session: Session) -> None:
+        create_users(session, 3)
+
+        response = UsersService(session).list(ListFilter(page_size=2))
+
+        assert response.total == 3
+        assert response.total_pages == 2
+        assert response.has_next is True
+
+    def test_no_count_reports_has_next(self, session: Session) -> None:
+        create_users(session, 3)
+        users_service = UsersService(session)
+
+        first_page = users_service.list(
+            ListFilter(page_size=2, total_count="none")
+        )
+        last_page = users_service.list(
+            ListFilter(page=2, page_size=2, total_count="none")
+        )
+
+        assert first_page.total is None
+        assert first_page.total_pages is None
+        assert len(first_page.data) == 2
+        assert first_page.has_next is True
+        assert len(last_page.data) == 1
+        assert last_page.has_next is False
+
+    def test_estimated_count(self, session: Session) -> None:
+        create_users(session, 3)
+
+        response = UsersService(session).list(
+            ListFilter(page_size=2, total_count="estimated")
+        )
+
+        assert response.total is not None and response.total >= 0
+        assert len(response.data) == 2
+        assert response.has_next is True
@@ -0,0 +1,38 @@
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.common.repositories.projection import select_schema
+from app.users.models.user import User
+from app.users.repositories.users_repository import users_repository
+from app.users.schemas.user_schema import UserCreate, UserInDB
+
+
+class TestProjection:
+    def test_selects_only_schema_columns(self) -> None:
+        stmt = select_schema(User, UserInDB)
+
+        assert {column.name for column in stmt.selected_columns} == {
+            "id",
+            "email",
+        }
+
+    def test_rejects_fields_without_columns(self) -> None:
+        class Unknown(BaseModel):
+            nickname: str
+
+        with pytest.raises(ValueError):
+            select_schema(User, Unknown)
+
+    def test_get_with_schema(self, session: Session) -> None:
+        user = users_repository.create(
+            session,
+            UserCreate(email="user@projection.com", hashed_password="x"),
+        )
+
+        found = users_repository.get(session, user.id, schema=UserInDB)
+        by_email = users_repository.get_by_email(
+            session, "user@projection.com", schema=UserInDB
+        )
+
+        assert found == by_email == UserInDB(id=user.id, email=user.email)
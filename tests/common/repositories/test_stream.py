@@ -0,0 +1,53 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.users.models.user import User
+from app.users.repositories.users_repository import users_repository
+from app.users.schemas.user_schema import UserCreate
+from app.users.services.users_service import UsersService
+
+
+def create_users(session: Session, count: int) -> None:
+    users_repository.create_many(
+        session,
+        [
+            UserCreate(email=f"user{index}@stream.com", hashed_password="x")
+            for index in range(count)
+        ],
+    )
+    session.expunge_all()
+
+
+class TestStream:
+    def test_iter_chunks_of_orm_objects(self, session: Session) -> None:
+        create_users(session, 5)
+
+        chunks = list(users_repository.iter_chunks(session, chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert all(isinstance(user, User) for user in chunks[0])
+        # Consumed chunks do not pile up in the session.
+        assert len(session.identity_map) == 0
+
+    def test_stream_mappings(self, session: Session) -> None:
+        create_users(session, 3)
+
+        rows = list(
+            users_repository.stream(
+                session,
+                select(User.email).order_by(User.email),
+                mappings=True,
+                chunk_size=2,
+            )
+        )
+
+        assert rows == [
+            {"email": f"user{index}@stream.com"} for index in range(3)
+        ]
+
+    def test_stream_all_users(self, session: Session) -> None:
+        create_users(session, 3)
+
+        emails = {user.email for user in UsersService(session).stream_all()}
+
+        assert emails == {f"user{index}@stream.com" for index in range(3)}
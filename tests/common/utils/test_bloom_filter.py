@@ -0,0 +1,37 @@
+from app.common.utils.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    def test_contains_added_items(self) -> None:
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"item-{index}" for index in range(1000)]
+        for item in items:
+            bloom_filter.add(item)
+
+        assert all(item in bloom_filter for item in items)
+        # Less a few items whose bits were all set by earlier ones.
+        assert 990 <= len(bloom_filter) <= 1000
+
+    def test_duplicates_are_not_counted(self) -> None:
+        bloom_filter = BloomFilter(capacity=10, error_rate=0.001)
+
+        assert bloom_filter.add("item")
+        assert not bloom_filter.add("item")
+        assert len(bloom_filter) == 1
+
+    def test_false_positive_rate(self) -> None:
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        for index in range(1000):
+            bloom_filter.add(f"item-{index}")
+
+        false_positives = sum(
+            f"other-{index}" in bloom_filter for index in range(10000)
+        )
+
+        assert false_positives < 10000 * 0.02
+
+    def test_empty(self) -> None:
+        bloom_filter = BloomFilter(capacity=10, error_rate=0.001)
+
+        assert "item" not in bloom_filter
+        assert 1 not in bloom_filter
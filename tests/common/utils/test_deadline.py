@@ -0,0 +1,108 @@
+import time
+from typing import Any, Generator
+
+import pytest
+from sqlalchemy import create_engine, event, exc, select
+from sqlalchemy.orm import sessionmaker
+
+from app.common.api.dependencies.deadline import with_deadline
+from app.common.exceptions import DeadlineExceededException
+from app.common.utils.deadline import (
+    get_deadline,
+    get_remaining_timeout,
+    start_deadline,
+)
+from app.db.deadlines import apply_deadline
+from app.db.pool_metrics import InstrumentedQueuePool
+
+
+@pytest.fixture(autouse=True)
+def reset_deadline() -> Generator:
+    yield
+    start_deadline(0)
+
+
+class TestDeadline:
+    def test_disabled_without_budget(self) -> None:
+        assert start_deadline(0) is None
+        assert get_remaining_timeout(1) == 1
+
+    def test_caps_timeouts_by_remaining_budget(self) -> None:
+        start_deadline(0.5)
+
+        assert 0 < get_remaining_timeout(1) <= 0.5
+        assert get_remaining_timeout(0.1) == 0.1
+
+    def test_route_budget_replaces_default(self) -> None:
+        start_deadline(30)
+
+        with_deadline(-1)()
+
+        deadline = get_deadline()
+        assert deadline is not None
+        with pytest.raises(DeadlineExceededException):
+            deadline.check()
+
+    def test_no_statements_after_deadline(self) -> None:
+        engine = create_engine("sqlite://")
+        # Like read only sessions, which have no SET LOCAL to scope.
+        session_factory = sessionmaker(
+            bind=engine.execution_options(isolation_level="AUTOCOMMIT")
+        )
+        apply_deadline(session_factory)
+        session = session_factory()
+
+        start_deadline(30)
+        assert session.execute(select(1)).scalar() == 1
+
+        start_deadline(-1)
+        with pytest.raises(DeadlineExceededException):
+            session.execute(select(1))
+        session.close()
+
+    @pytest.mark.parametrize(
+        ("budget", "sets_timeout"), [(30, False), (5, True)]
+    )
+    def test_statement_timeout_only_when_tighter(
+        self, budget: float, sets_timeout: bool
+    ) -> None:
+        engine = create_engine("sqlite://")
+        statements = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _record(_: Any, __: Any, statement: str, *args: Any) -> None:
+            statements.append(statement)
+
+        session_factory = sessionmaker(bind=engine)
+        apply_deadline(session_factory, statement_timeout=10)
+        session = session_factory()
+
+        start_deadline(budget)
+        # sqlite has no statement_timeout, sending it fails.
+        try:
+            session.execute(select(1))
+        except exc.OperationalError:
+            pass
+        session.close()
+
+        assert statements[0].startswith("SET LOCAL") is sets_timeout
+
+    def test_pool_checkout_waits_until_deadline(self) -> None:
+        engine = create_engine(
+            "sqlite://",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=30,
+        )
+
+        with engine.connect():
+            start_deadline(0.05)
+            started_at = time.monotonic()
+            with pytest.raises(DeadlineExceededException):
+                engine.connect()
+
+        assert time.monotonic() - started_at < 1
+        start_deadline(0)
+        assert engine.pool.timeout() == 30
+        engine.dispose()
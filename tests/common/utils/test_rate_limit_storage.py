@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import (
+    FixedWindowRateLimiter,
+    SlidingWindowCounterRateLimiter,
+)
+
+from app.common.utils.rate_limit_storage import (
+    BatchedStorage,
+    BoundedMemoryStorage,
+    CounterStorage,
+    SharedMemoryStorage,
+)
+
+limit = parse("5 per minute")
+
+
+class CountingStorage(BoundedMemoryStorage):
+    """Local stand-in for a networked storage, counting round trips."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.round_trips = 0
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        self.round_trips += 1
+        return super().incr(key, expiry, amount)
+
+    def get(self, key: str) -> int:
+        self.round_trips += 1
+        return super().get(key)
+
+
+@pytest.fixture(params=["bounded-memory", "shared-memory", "batched"])
+def storage(request: pytest.FixtureRequest, tmp_path: Path) -> CounterStorage:
+    uri = {
+        "bounded-memory": "bounded-memory://",
+        "shared-memory": f"shared-memory://{tmp_path / 'limits'}",
+        "batched": "batched+bounded-memory://",
+    }[request.param]
+    return storage_from_string(uri, slots=1024, flush_interval=0)
+
+
+class TestStorages:
+    def test_fixed_window(self, storage: CounterStorage) -> None:
+        limiter = FixedWindowRateLimiter(storage)
+
+        hits = [limiter.hit(limit, "client") for _ in range(6)]
+
+        assert hits == [True] * 5 + [False]
+        assert limiter.hit(limit, "other client")
+
+    def test_sliding_window(self, storage: CounterStorage) -> None:
+        limiter = SlidingWindowCounterRateLimiter(storage)
+
+        hits = [limiter.hit(limit, "client") for _ in range(6)]
+
+        assert hits == [True] * 5 + [False]
+        assert limiter.get_window_stats(limit, "client").remaining == 0
+        limiter.clear(limit, "client")
+        assert limiter.hit(limit, "client")
+
+
+class TestBoundedMemoryStorage:
+    def test_evicts_least_recently_used(self) -> None:
+        storage = BoundedMemoryStorage(max_keys=2)
+        storage.incr("first", 60)
+        storage.incr("second", 60)
+        storage.get("first")
+
+        storage.incr("third", 60)
+
+        assert len(storage) == 2
+        assert storage.get("first") == 1
+        assert storage.get("second") == 0
+
+
+class TestSharedMemoryStorage:
+    def test_shared_between_instances(self, tmp_path: Path) -> None:
+        uri = f"shared-memory://{tmp_path / 'limits'}"
+        first = SharedMemoryStorage(uri, slots=64)
+        second = SharedMemoryStorage(uri, slots=64)
+
+        first.incr("client", 60)
+        second.incr("client", 60)
+
+        assert first.get("client") == 2
+
+    def test_bounded_number_of_slots(self, tmp_path: Path) -> None:
+        storage = SharedMemoryStorage(
+            f"shared-memory://{tmp_path / 'limits'}", slots=4
+        )
+
+        for client in range(100):
+            assert storage.incr(f"client-{client}", 60) == 1
+
+        assert (tmp_path / "limits").stat().st_size == 4 * 24
+
+
+class TestBatchedStorage:
+    def test_checks_mostly_stay_local(self) -> None:
+        storage = BatchedStorage("batched+bounded-memory://")
+        backend = storage.storage = CountingStorage()
+        limiter = FixedWindowRateLimiter(storage)
+
+        for _ in range(100):
+            limiter.hit(parse("1000 per minute"), "client")
+
+        assert backend.round_trips == 1
+        storage.flush()
+        assert backend.round_trips == 2
+        assert backend.get("LIMITER/client/1000/1/minute") == 100
+
+    def test_sees_other_processes_after_sync(self) -> None:
+        backend = CountingStorage()
+        first = BatchedStorage("batched+bounded-memory://", flush_interval=0)
+        second = BatchedStorage("batched+bounded-memory://", flush_interval=0)
+        first.storage = second.storage = backend
+
+        for _ in range(3):
+            first.incr("client", 60)
+        second.incr("client", 60)
+
+        assert first.get("client") == 4
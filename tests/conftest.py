@@ -1,9 +1,12 @@
-from typing import Generator
+from typing import Any, Generator
 import pytest
 from sqlalchemy import RootTransaction, event
 from fastapi.testclient import TestClient
 
-from app.common.api.dependencies.get_session import get_session
+from app.common.api.dependencies.get_session import (
+    get_read_only_session,
+    get_session,
+)
 from app.core.config import get_settings
 from app.db.session import engine, SessionLocal
 from app.main import app
@@ -45,6 +48,24 @@ def client(session: Session) -> Generator:
         yield session
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_only_session] = override_get_session
 
     with TestClient(app) as client:
         yield client
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *_: Any) -> None:
+        self.count += 1
+
+
+@pytest.fixture()
+def query_counter() -> Generator:
+    """Count the statements sent to the database while the test runs."""
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine, "before_cursor_execute", counter)
@@ -0,0 +1,89 @@
+from typing import Any
+
+import pytest
+from sqlalchemy.pool import NullPool
+
+from app.db import engine_options
+from app.db.engine_options import (
+    get_engine_options,
+    get_statement_timeout,
+)
+from app.db.pool_metrics import InstrumentedQueuePool
+
+
+def use_settings(monkeypatch: pytest.MonkeyPatch, **values: Any) -> None:
+    monkeypatch.setattr(
+        engine_options,
+        "settings",
+        engine_options.settings.model_copy(update=values),
+    )
+
+
+class TestTransactionPoolerMode:
+    def test_defaults_to_null_pool(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        use_settings(
+            monkeypatch, DB_POOLER="transaction", POSTGRES_DRIVER="psycopg2"
+        )
+
+        assert get_engine_options() == {"poolclass": NullPool}
+
+    def test_small_pool_without_pre_ping(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        use_settings(
+            monkeypatch,
+            DB_POOLER="transaction",
+            DB_POOLER_CLIENT_POOL_SIZE=2,
+        )
+
+        options = get_engine_options()
+
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert options["pool_size"] == 2
+        assert options["max_overflow"] == 0
+        assert options["pool_pre_ping"] is False
+
+    def test_disables_prepared_statements(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        use_settings(
+            monkeypatch, DB_POOLER="transaction", POSTGRES_DRIVER="psycopg"
+        )
+        assert get_engine_options()["connect_args"] == {
+            "prepare_threshold": None
+        }
+
+        use_settings(monkeypatch, POSTGRES_DRIVER="psycopg2")
+        connect_args = get_engine_options(is_async=True)["connect_args"]
+        name_func = connect_args["prepared_statement_name_func"]
+        assert connect_args["statement_cache_size"] == 0
+        assert name_func() != name_func()
+
+
+class TestStatementTimeout:
+    def test_set_on_connect(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        use_settings(
+            monkeypatch,
+            POSTGRES_DRIVER="psycopg2",
+            DB_STATEMENT_TIMEOUT_SECONDS=1.5,
+        )
+
+        assert get_engine_options()["connect_args"] == {
+            "options": "-c statement_timeout=1500"
+        }
+        assert get_engine_options(is_async=True)["connect_args"] == {
+            "server_settings": {"statement_timeout": "1500"}
+        }
+
+    def test_not_set_behind_transaction_pooler(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        use_settings(
+            monkeypatch,
+            DB_POOLER="transaction",
+            DB_STATEMENT_TIMEOUT_SECONDS=1.5,
+        )
+
+        assert get_statement_timeout() is None
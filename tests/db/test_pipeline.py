@@ -0,0 +1,107 @@
+from typing import Generator
+
+import pytest
+from sqlalchemy import (
+    Engine,
+    create_engine,
+    event,
+    false,
+    literal,
+    literal_column,
+    make_url,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from app.common.exceptions import DeadlineExceededException
+from app.common.utils.deadline import start_deadline
+from app.core.config import get_settings
+from app.db.pipeline import fetch_first_pipelined
+from app.db.request_stats import start_request_db_stats
+from app.db.sql_comments import add_sql_comments, bind_task_name
+from app.db.statement_stats import track_statement_stats
+
+settings = get_settings()
+
+
+@pytest.fixture()
+def psycopg_engine() -> Generator:
+    engine = create_engine(
+        make_url(settings.SQLALCHEMY_DATABASE_URI or "").set(
+            drivername="postgresql+psycopg"
+        )
+    )
+    track_statement_stats(engine)
+    add_sql_comments(engine, include_request_id=False)
+    # The dialect's first connect queries the server, keep those out.
+    engine.connect().close()
+    yield engine
+    engine.dispose()
+    start_deadline(0)
+
+
+class TestFetchFirstPipelined:
+    def test_falls_back_to_sequential_reads(self) -> None:
+        # sqlite has no pipeline mode, statements run one after the other.
+        session = Session(bind=create_engine("sqlite://"))
+
+        rows = fetch_first_pipelined(
+            session,
+            [
+                select(literal_column("1").label("a")),
+                select(literal_column("2").label("b")).where(
+                    literal_column("1") == 0
+                ),
+            ],
+        )
+
+        assert rows == [{"a": 1}, None]
+        session.close()
+
+    def test_pipelined_statements_are_recorded(
+        self, psycopg_engine: Engine
+    ) -> None:
+        statements = []
+        event.listen(
+            psycopg_engine,
+            "after_cursor_execute",
+            lambda _, __, statement, *___: statements.append(statement),
+        )
+        stats = start_request_db_stats()
+        bind_task_name("pipeline")
+
+        try:
+            with Session(psycopg_engine) as session:
+                rows = fetch_first_pipelined(
+                    session,
+                    [
+                        select(literal(1).label("a")),
+                        select(literal(2).label("b")).where(false()),
+                    ],
+                )
+        finally:
+            bind_task_name(None)
+
+        assert rows == [{"a": 1}, None]
+        assert len(statements) == 2
+        assert all(
+            statement.endswith("/*task='pipeline'*/")
+            for statement in statements
+        )
+        assert stats.statements == 2
+        assert stats.rows == 1
+
+    def test_checks_the_deadline(self, psycopg_engine: Engine) -> None:
+        statements = []
+        event.listen(
+            psycopg_engine,
+            "after_cursor_execute",
+            lambda _, __, statement, *___: statements.append(statement),
+        )
+        start_deadline(-1)
+
+        with Session(psycopg_engine) as session:
+            with pytest.raises(DeadlineExceededException):
+                fetch_first_pipelined(session, [select(literal(1))])
+
+        assert statements == []
@@ -0,0 +1,40 @@
+from typing import Generator
+
+import pytest
+from sqlalchemy import Engine, create_engine, exc
+
+from app.db import pool_metrics
+from app.db.pool_metrics import (
+    InstrumentedQueuePool,
+    get_pool_stats,
+    register_engine,
+)
+
+
+@pytest.fixture
+def engine() -> Generator:
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    register_engine("test-sqlite", engine)
+    yield engine
+    # NOTE: registered engines are global, keep them out of other tests.
+    pool_metrics._engines.pop("test-sqlite", None)
+    engine.dispose()
+
+
+class TestPoolMetrics:
+    def test_records_checkouts_and_timeouts(self, engine: Engine) -> None:
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+            stats = get_pool_stats()["test-sqlite"]
+
+        assert stats["checked_out"] == 1
+        assert stats["checkouts"] == 1
+        assert stats["checkout_timeouts"] == 1
+        assert sum(stats["wait_histogram"].values()) == 1
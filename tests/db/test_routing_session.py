@@ -0,0 +1,96 @@
+import threading
+import time
+
+from sqlalchemy import create_engine, event, select, update
+
+from app.db.replicas import ReplicaSet
+from app.db.routing_session import RoutingSession
+from app.users.models.user import User
+
+primary = create_engine("postgresql+psycopg2://test@primary/test")
+
+
+def healthy_replicas() -> ReplicaSet:
+    # No background checks, replicas stay healthy until marked otherwise.
+    return ReplicaSet(
+        [create_engine("postgresql+psycopg2://test@replica/test")],
+        max_lag=5,
+        check_interval=0,
+    )
+
+
+def unreachable_replicas(check_interval: float) -> ReplicaSet:
+    return ReplicaSet(
+        [
+            create_engine(
+                "postgresql+psycopg2://test@unreachable.invalid/test",
+                connect_args={"connect_timeout": 1},
+            )
+        ],
+        max_lag=5,
+        check_interval=check_interval,
+    )
+
+
+class TestRoutingSession:
+    def test_selects_go_to_replica(self) -> None:
+        replica_set = healthy_replicas()
+        session = RoutingSession(bind=primary, replicas=replica_set)
+
+        bind = session.get_bind(clause=select(User))
+
+        assert bind is replica_set.replicas[0].engine
+
+    def test_reads_after_write_go_to_primary(self) -> None:
+        session = RoutingSession(bind=primary, replicas=healthy_replicas())
+
+        assert session.get_bind(clause=update(User)) is primary
+        assert session.get_bind(clause=select(User)) is primary
+
+    def test_locking_reads_go_to_primary(self) -> None:
+        session = RoutingSession(bind=primary, replicas=healthy_replicas())
+
+        bind = session.get_bind(clause=select(User).with_for_update())
+
+        assert bind is primary
+
+    def test_unhealthy_replica_falls_back_to_primary(self) -> None:
+        replica_set = healthy_replicas()
+        replica_set.replicas[0].healthy = False
+        session = RoutingSession(bind=primary, replicas=replica_set)
+
+        assert session.get_bind(clause=select(User)) is primary
+
+
+class TestReplicaSet:
+    def test_check_marks_unreachable_replica_unhealthy(self) -> None:
+        replica_set = unreachable_replicas(check_interval=0)
+        replica = replica_set.replicas[0]
+
+        assert not replica_set.check(replica)
+        assert not replica.healthy
+        assert replica_set.choose() is None
+
+    def test_checks_in_the_background(self) -> None:
+        replica_set = unreachable_replicas(check_interval=60)
+        replica = replica_set.replicas[0]
+        connecting_threads = []
+        event.listen(
+            replica.engine,
+            "do_connect",
+            lambda *_: connecting_threads.append(threading.get_ident()),
+        )
+        try:
+            replica_set.choose()
+
+            deadline = time.monotonic() + 10
+            while not replica.checked_at and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            replica_set.stop()
+
+        assert replica.checked_at
+        assert not replica.healthy
+        # Choosing never connected itself.
+        assert connecting_threads
+        assert threading.get_ident() not in connecting_threads
@@ -0,0 +1,83 @@
+from typing import Generator
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.common.models.base_class import Base
+from app.db.slow_queries import (
+    QueryStatsTable,
+    get_caller,
+    get_parameter_shapes,
+)
+from app.users.models.user import User
+from app.users.repositories.users_repository import users_repository
+
+
+@pytest.fixture()
+def sqlite_session() -> Generator:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    with Session(engine) as session:
+        yield session
+
+
+class TestQueryStatsTable:
+    def test_ranks_by_total_time(self) -> None:
+        table = QueryStatsTable()
+        table.observe("SELECT a", 0.1)
+        table.observe("SELECT b", 0.3)
+        table.observe("SELECT a", 0.3, caller="repo:get")
+
+        top = table.top(10)
+
+        assert [row["fingerprint"] for row in top] == ["SELECT a", "SELECT b"]
+        assert top[0]["calls"] == 2
+        assert top[0]["slow_calls"] == 1
+        assert top[0]["caller"] == "repo:get"
+
+    def test_evicts_cheapest_fingerprint(self) -> None:
+        table = QueryStatsTable(max_fingerprints=2)
+        table.observe("SELECT a", 0.2)
+        table.observe("SELECT b", 0.1)
+        table.observe("SELECT c", 0.3)
+
+        assert {row["fingerprint"] for row in table.top(10)} == {
+            "SELECT a",
+            "SELECT c",
+        }
+
+
+class TestSlowQueryContext:
+    def test_parameter_shapes_hide_values(self) -> None:
+        assert get_parameter_shapes({"email": "a@b.com", "limit": 1}) == {
+            "email": "str",
+            "limit": "int",
+        }
+        assert get_parameter_shapes([{"a": 1}, {"a": 2}]) == {
+            "rows": 2,
+            "row": {"a": "int"},
+        }
+
+    def test_caller_outside_repositories(self) -> None:
+        assert get_caller() is None
+
+    def test_caller_is_the_called_repository_method(
+        self, sqlite_session: Session
+    ) -> None:
+        callers = []
+        event.listen(
+            sqlite_session.get_bind(),
+            "before_cursor_execute",
+            lambda *_: callers.append(get_caller()),
+        )
+
+        users_repository.get_by_email(sqlite_session, "test@user.com")
+        users_repository.get_one_by(sqlite_session, "email", "test@user.com")
+
+        assert callers == [
+            "app.users.repositories.users_repository:"
+            "UsersRepository.get_by_email",
+            "app.users.repositories.users_repository:"
+            "UsersRepository.get_one_by",
+        ]
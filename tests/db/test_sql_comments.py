@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.common.models.base_class import Base
+
+from app.db.sql_comments import (
+    add_sql_comments,
+    bind_request_scope,
+    bind_task_name,
+    format_sql_comment,
+)
+from app.db.statement_stats import fingerprint
+from app.users.models.user import User
+from app.users.repositories.users_repository import users_repository
+
+
+class TestSQLComments:
+    def test_format_is_sorted_and_encoded(self) -> None:
+        comment = format_sql_comment(
+            {"route": "/users/{user_id}", "repo": "Users Repository.get"},
+            escape_percent=True,
+        )
+
+        assert comment == (
+            "/*repo='Users%%20Repository.get',route='/users/{user_id}'*/"
+        )
+
+    def test_tags_statements(self) -> None:
+        engine = create_engine("sqlite://")
+        add_sql_comments(engine, include_request_id=False)
+        statements = []
+        event.listen(
+            engine,
+            "after_cursor_execute",
+            lambda _, __, statement, *___: statements.append(statement),
+        )
+        bind_request_scope({"route": SimpleNamespace(path="/users/current")})
+        bind_task_name("send_reminder_email")
+
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        finally:
+            bind_request_scope({})
+            bind_task_name(None)
+
+        assert statements == [
+            "SELECT 1 /*route='/users/current',task='send_reminder_email'*/"
+        ]
+        assert fingerprint(statements[0]) == "SELECT ?"
+
+    def test_tags_repository_method(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[User.__table__])
+        add_sql_comments(engine, include_request_id=False)
+        statements = []
+        event.listen(
+            engine,
+            "after_cursor_execute",
+            lambda _, __, statement, *___: statements.append(statement),
+        )
+
+        with Session(engine) as session:
+            users_repository.get_by_email(session, "test@user.com")
+
+        assert statements[-1].endswith(
+            "/*repo='UsersRepository.get_by_email'*/"
+        )
@@ -0,0 +1,46 @@
+from sqlalchemy import create_engine, text
+
+from app.db.pool_metrics import InstrumentedQueuePool
+from app.db.request_stats import start_request_db_stats
+from app.db.statement_stats import fingerprint, track_statement_stats
+
+
+class TestFingerprint:
+    def test_normalizes_literals_and_lists(self) -> None:
+        assert fingerprint(
+            "SELECT *\n  FROM users WHERE id IN (%(id_1)s, %(id_2)s)"
+            " AND email = 'a@b.com' LIMIT 10"
+        ) == ("SELECT * FROM users WHERE id IN (...) AND email = ? LIMIT ?")
+
+    def test_keeps_numbered_placeholders(self) -> None:
+        assert fingerprint(
+            "SELECT * FROM users WHERE id IN ($1, $2, $3) AND email = $4"
+        ) == ("SELECT * FROM users WHERE id IN (...) AND email = $4")
+
+    def test_collapses_multi_row_values(self) -> None:
+        assert fingerprint("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)") == (
+            "INSERT INTO t (a, b) VALUES (...)"
+        )
+
+
+class TestStatementStats:
+    def test_accounts_statements_to_request(self) -> None:
+        engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool)
+        track_statement_stats(engine)
+        stats = start_request_db_stats()
+
+        with engine.connect() as connection:
+            connection.execute(text("CREATE TABLE t (a INTEGER)"))
+            for value in range(3):
+                connection.execute(
+                    text("INSERT INTO t (a) VALUES (:a)"), {"a": value}
+                )
+            connection.execute(text("SELECT a FROM t")).all()
+
+        assert stats.statements == 5
+        assert stats.db_time > 0
+        assert stats.checkout_wait > 0
+        assert stats.slowest_statement is not None
+        assert stats.repeated_statements(2) == {
+            "INSERT INTO t (a) VALUES (...)": 3
+        }
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.common.exceptions.read_only_session_exception import (
+    ReadOnlySessionException,
+)
+from app.db.session import ReadOnlySessionLocal, engine
+from app.db.write_tracking import (
+    autocommit_connections,
+    has_connection,
+    has_writes,
+    track_writes,
+)
+from app.users.models.user import User
+from app.users.services.users_service import UsersService
+from tests.utils.create_user import create_user
+
+
+class TestWriteTracking:
+    def test_reads_are_not_writes(self, session: Session) -> None:
+        UsersService(session).get_by_email("nobody@test.com")
+
+        assert has_connection(session)
+        assert not has_writes(session)
+
+    def test_flush_is_a_write(self, session: Session) -> None:
+        create_user(session)
+
+        assert has_writes(session)
+
+    def test_read_only_session_rejects_writes(self) -> None:
+        with engine.connect() as connection:
+            session = ReadOnlySessionLocal(bind=connection)
+            session.add(User(email="read@only.com", hashed_password="x"))
+
+            with pytest.raises(ReadOnlySessionException):
+                session.flush()
+            session.close()
+
+    @pytest.mark.parametrize(
+        ("isolation_level", "expected"),
+        [("AUTOCOMMIT", 1), ("SERIALIZABLE", 0)],
+    )
+    def test_counts_autocommit_connections(
+        self, isolation_level: str, expected: int
+    ) -> None:
+        engine = create_engine("sqlite://")
+        session_factory = sessionmaker(
+            bind=engine.execution_options(isolation_level=isolation_level)
+        )
+        track_writes(session_factory)
+
+        with session_factory() as session:
+            assert autocommit_connections(session) == 0
+            session.execute(select(1))
+            session.execute(select(2))
+
+            assert autocommit_connections(session) == expected
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.schemas.token_schema import TokenPayload
+from app.auth.utils import security
+from app.auth.utils.security import create_access_token
+from app.users.api.dependencies import get_current_user
+from app.users.api.dependencies.get_current_user import (
+    get_current_user_async,
+)
+from app.users.repositories.async_users_repository import (
+    async_users_repository,
+)
+from app.users.schemas.user_schema import (
+    UserCreate,
+    UserInDB,
+    UserTokenState,
+)
+from app.users.utils.current_user_cache import current_user_cache
+from tests.utils.async_session import run_in_async_session
+
+
+def _token(user_id: Any, ver: int = 0) -> str:
+    return create_access_token(TokenPayload(user_id=str(user_id), ver=ver))
+
+
+async def _create_user(session: AsyncSession) -> Any:
+    current_user_cache.clear()
+    return await async_users_repository.create(
+        session, UserCreate(email="test@user.com", hashed_password="hashed")
+    )
+
+
+class TestGetCurrentUserAsync:
+    def test_revocation_check_runs_off_the_event_loop(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            get_current_user,
+            "settings",
+            get_current_user.settings.model_copy(
+                update={"CURRENT_USER_STATELESS": True}
+            ),
+        )
+        threads = []
+
+        def is_revoked(jti: str) -> bool:
+            threads.append(threading.get_ident())
+            return False
+
+        monkeypatch.setattr(security.token_denylist, "is_revoked", is_revoked)
+        user_id = uuid4()
+        token = create_access_token(
+            TokenPayload(user_id=str(user_id), email="test@user.com")
+        )
+
+        async def get_user() -> Any:
+            user = await get_current_user_async(None, token)  # type: ignore[arg-type]
+            return user, threading.get_ident()
+
+        user, loop_thread = asyncio.run(get_user())
+
+        assert user.id == user_id
+        assert len(threads) == 1
+        assert threads[0] != loop_thread
+
+    def test_cache_hit_hides_token_version(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            security.token_denylist, "is_revoked", lambda jti: False
+        )
+        user_id = uuid4()
+        current_user_cache.clear()
+        current_user_cache.set(
+            user_id,
+            UserTokenState(id=user_id, email="test@user.com", token_version=0),
+        )
+
+        user = asyncio.run(get_current_user_async(None, _token(user_id)))  # type: ignore[arg-type]
+
+        assert type(user) is UserInDB
+        assert user == UserInDB(id=user_id, email="test@user.com")
+        current_user_cache.clear()
+
+    def test_get_current_user(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            user = await _create_user(session)
+
+            current_user = await get_current_user_async(
+                session, _token(user.id)
+            )
+
+            assert current_user == UserInDB(id=user.id, email=user.email)
+            assert current_user_cache.get(user.id) is not None
+
+        run_in_async_session(test)
+
+    def test_unknown_user(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            await _create_user(session)
+
+            with pytest.raises(HTTPException) as error:
+                await get_current_user_async(session, _token(uuid4()))
+
+            assert error.value.status_code == 404
+
+        run_in_async_session(test)
+
+    def test_revoked_by_password_reset(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            user = await _create_user(session)
+            user.token_version = 1
+            await session.flush()
+
+            with pytest.raises(HTTPException) as error:
+                await get_current_user_async(session, _token(user.id, ver=0))
+
+            assert error.value.status_code == 401
+
+        run_in_async_session(test)
+
+    def test_invalid_token(self) -> None:
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(get_current_user_async(None, "invalid"))  # type: ignore[arg-type]
+
+        assert error.value.status_code == 401
@@ -0,0 +1,76 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.auth.schemas.token_schema import TokenPayload
+from app.auth.utils.security import create_access_token
+from app.users.repositories.users_repository import users_repository
+from app.users.utils.current_user_cache import current_user_cache
+from tests.conftest import QueryCounter
+from tests.utils.create_user import create_user
+
+current_user_path = "api/v1/users/current"
+
+
+class TestGetCurrentUserEndpoint:
+    def test_get_current_user(
+        self, client: TestClient, session: Session
+    ) -> None:
+        created_user = create_user(session)
+        client.cookies.set(
+            "access_token",
+            create_access_token(TokenPayload(user_id=str(created_user.id))),
+        )
+
+        response = client.get(current_user_path)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "id": str(created_user.id),
+            "email": created_user.email,
+        }
+
+    def test_get_current_user_unauthenticated(
+        self, client: TestClient
+    ) -> None:
+        response = client.get(current_user_path)
+
+        assert response.status_code == 401
+
+    def test_get_current_user_cached(
+        self,
+        client: TestClient,
+        session: Session,
+        query_counter: QueryCounter,
+    ) -> None:
+        created_user = create_user(session)
+        client.cookies.set(
+            "access_token",
+            create_access_token(TokenPayload(user_id=str(created_user.id))),
+        )
+        client.get(current_user_path)
+        query_counter.count = 0
+
+        response = client.get(current_user_path)
+
+        assert response.status_code == 200
+        assert query_counter.count == 0
+        assert current_user_cache.get(created_user.id) is not None
+
+    def test_get_current_user_revoked_by_password_reset(
+        self, client: TestClient, session: Session
+    ) -> None:
+        created_user = create_user(session)
+        client.cookies.set(
+            "access_token",
+            create_access_token(TokenPayload(user_id=str(created_user.id))),
+        )
+        assert client.get(current_user_path).status_code == 200
+
+        users_repository.reset_password(
+            session, created_user.email, "new_hashed_password"
+        )
+        session.commit()
+
+        response = client.get(current_user_path)
+
+        assert response.status_code == 401
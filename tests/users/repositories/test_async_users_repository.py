@@ -0,0 +1,34 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.users.repositories.async_users_repository import (
+    async_users_repository,
+)
+from app.users.schemas.user_schema import UserCreate, UserInDB
+from tests.utils.async_session import run_in_async_session
+
+
+class TestAsyncUsersRepository:
+    def test_get_by_email(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            user = await async_users_repository.create(
+                session,
+                UserCreate(email="test@user.com", hashed_password="hashed"),
+            )
+
+            assert (
+                await async_users_repository.get_by_email(
+                    session, "test@user.com"
+                )
+                is user
+            )
+            assert await async_users_repository.get_by_email(
+                session, "test@user.com", schema=UserInDB
+            ) == UserInDB(id=user.id, email="test@user.com")
+            assert (
+                await async_users_repository.get_by_email(
+                    session, "other@user.com"
+                )
+                is None
+            )
+
+        run_in_async_session(test)
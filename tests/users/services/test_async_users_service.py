@@ -0,0 +1,44 @@
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.schemas.pagination_schema import ListFilter
+from app.users.schemas.user_schema import UserCreate, UserTokenState
+from app.users.services.async_users_service import AsyncUsersService
+from tests.utils.async_session import run_in_async_session
+
+
+class TestAsyncUsersService:
+    def test_create_and_get_user(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            users_service = AsyncUsersService(session)
+
+            created = await users_service.create_user(
+                UserCreate(email="test@user.com", hashed_password="hashed")
+            )
+
+            assert await users_service.get_by_id(created.id) == created
+            assert await users_service.get_by_email("TEST@user.com") == (
+                created
+            )
+            assert await users_service.get_token_state(created.id) == (
+                UserTokenState(
+                    id=created.id, email="test@user.com", token_version=0
+                )
+            )
+            assert await users_service.get_by_id(uuid4()) is None
+
+        run_in_async_session(test)
+
+    def test_list(self) -> None:
+        async def test(session: AsyncSession) -> None:
+            users_service = AsyncUsersService(session)
+            created = await users_service.create_user(
+                UserCreate(email="test@user.com", hashed_password="hashed")
+            )
+
+            page = await users_service.list(ListFilter(total_count="none"))
+
+            assert [user.id for user in page.data] == [created.id]
+
+        run_in_async_session(test)
@@ -0,0 +1,80 @@
+from typing import Generator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.common.models.base_class import Base
+from app.users.models.user import User
+from app.users.repositories.users_repository import users_repository
+from app.users.schemas.user_schema import UserTokenState, UserUpdate
+from app.users.utils.current_user_cache import current_user_cache
+
+
+@pytest.fixture()
+def sqlite_session() -> Generator:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    with Session(engine) as session:
+        yield session
+
+
+def _cache(user: User) -> None:
+    current_user_cache.set(
+        user.id,
+        UserTokenState(id=user.id, email=user.email, token_version=0),
+    )
+
+
+def _create_user(session: Session) -> User:
+    user = User(id=uuid4(), email="cached@user.com", hashed_password="x")
+    session.add(user)
+    session.commit()
+    return user
+
+
+class TestCurrentUserCache:
+    def test_orm_update_invalidates(self, sqlite_session: Session) -> None:
+        user = _create_user(sqlite_session)
+        _cache(user)
+
+        user.email = "changed@user.com"
+        sqlite_session.flush()
+
+        assert current_user_cache.get(user.id) is None
+
+    def test_bulk_update_invalidates(self, sqlite_session: Session) -> None:
+        user = _create_user(sqlite_session)
+        _cache(user)
+
+        users_repository.update_by_id(
+            sqlite_session, user.id, UserUpdate(hashed_password="y")
+        )
+
+        assert current_user_cache.get(user.id) is None
+
+    def test_invalidates_again_at_transaction_end(
+        self, sqlite_session: Session
+    ) -> None:
+        user = _create_user(sqlite_session)
+        users_repository.reset_password(sqlite_session, user.email, "y")
+        # Cached by a read of the uncommitted row.
+        _cache(user)
+
+        sqlite_session.rollback()
+
+        assert current_user_cache.get(user.id) is None
+
+    def test_password_reset_bumps_token_version(
+        self, sqlite_session: Session
+    ) -> None:
+        user = _create_user(sqlite_session)
+
+        updated = users_repository.reset_password(
+            sqlite_session, user.email, "y"
+        )
+
+        assert updated is not None
+        assert updated.token_version == 1
+        assert updated.hashed_password == "y"
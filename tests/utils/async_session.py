@@ -0,0 +1,36 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import async_engine
+
+T = TypeVar("T")
+
+
+def run_in_async_session(test: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """
+    Run `test` on its own event loop with an `AsyncSession` whose changes,
+    commits included, are rolled back afterwards.
+    """
+
+    async def run() -> T:
+        try:
+            async with async_engine.connect() as connection:
+                transaction = await connection.begin()
+                session = AsyncSession(
+                    bind=connection,
+                    expire_on_commit=False,
+                    join_transaction_mode="create_savepoint",
+                )
+                try:
+                    return await test(session)
+                finally:
+                    await session.close()
+                    await transaction.rollback()
+        finally:
+            # Pooled connections belong to this loop, which is about to
+            # be closed.
+            await async_engine.dispose()
+
+    return asyncio.run(run())